@@ -1,3 +1,6 @@
+import base64
+import hashlib
+import hmac
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -13,12 +16,48 @@ from app.database import get_db, User
 security = HTTPBearer()
 
 
+def _prehash(password: str) -> bytes:
+    """SHA-256 + base64 so bcrypt never sees more than 72 bytes or a NUL."""
+    return base64.b64encode(hashlib.sha256(password.encode("utf-8")).digest())
+
+
+def _bcrypt_matches(password: bytes, hashed: bytes) -> bool:
+    return hmac.compare_digest(bcrypt.hashpw(password, hashed), hashed)
+
+
+# Marks hashes of pre-hashed passwords.  Unmarked hashes predate the marker
+# and may be bcrypt(raw password), so only they pay for the legacy check.
+_PREHASHED_PREFIX = "sha256$"
+
+
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    return _PREHASHED_PREFIX + bcrypt.hashpw(_prehash(password), bcrypt.gensalt()).decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+    try:
+        if hashed_password.startswith(_PREHASHED_PREFIX):
+            hashed = hashed_password[len(_PREHASHED_PREFIX):].encode("utf-8")
+            return _bcrypt_matches(_prehash(plain_password), hashed)
+        hashed = hashed_password.encode("utf-8")
+        if _bcrypt_matches(_prehash(plain_password), hashed):
+            return True
+        # Accounts created before pre-hashing store bcrypt(raw password)
+        raw = plain_password.encode("utf-8")
+        return len(raw) <= 72 and _bcrypt_matches(raw, hashed)
+    except ValueError:
+        return False
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """True for hashes stored without the pre-hash marker; replace them with
+    hash_password() after a successful login so the legacy check dies out."""
+    return not hashed_password.startswith(_PREHASHED_PREFIX)
+
+
+# Verified against when the username does not exist, so login timing
+# does not reveal which usernames are registered.
+DUMMY_PASSWORD_HASH = hash_password("dummy-password-for-timing")
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -47,7 +86,7 @@ def get_current_user(
     except (JWTError, ValueError):
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if user is None:
         raise credentials_exception
     return user
@@ -16,10 +16,25 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "uploads")
     VIDEO_DIR: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "generated_videos")
     TEMP_DIR: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "temp")
+    IMAGE_CACHE_DIR: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "image_cache")
+    IMAGE_CACHE_TTL: int = 7 * 24 * 3600  # 7 days
+    TTS_CACHE_DIR: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tts_cache")
+    TTS_CACHE_TTL: int = 7 * 24 * 3600  # 7 days
+    LLM_CACHE_DB: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "llm_cache.db")
+    LLM_CACHE_TTL: int = 24 * 3600  # 1 day
+    LLM_WARM_ON_STARTUP: bool = True
+    LLM_FEATURE_TIMEOUT: float = 20.0  # seconds, whole LLM call for object features
+    LLM_CONCURRENCY: int = 8  # feature-generation LLM calls in flight per worker
 
     VIDEO_WIDTH: int = 720
     VIDEO_HEIGHT: int = 1280
     VIDEO_FPS: int = 24
+    # False: mux captions as a soft mov_text track (the feed overlays them from subtitle_text)
+    VIDEO_BURN_SUBTITLES: bool = True
+    VIDEO_ENCODE_CONCURRENCY: int = 2  # ffmpeg encodes in flight per worker
+    # Frame-render processes; with DOC_PARSE_WORKERS this leaves cores for ffmpeg and the server
+    VIDEO_FRAME_WORKERS: int = max(1, (os.cpu_count() or 1) // 2)
+    DOC_PARSE_WORKERS: int = max(1, (os.cpu_count() or 1) // 4)  # PDF/DOCX parser processes
     VIDEO_DURATION_MIN: int = 30
     VIDEO_DURATION_MAX: int = 60
 
@@ -30,5 +45,5 @@ class Settings(BaseSettings):
 settings = Settings()
 
 # Create required directories
-for d in [settings.UPLOAD_DIR, settings.VIDEO_DIR, settings.TEMP_DIR]:
+for d in [settings.UPLOAD_DIR, settings.VIDEO_DIR, settings.TEMP_DIR, settings.IMAGE_CACHE_DIR, settings.TTS_CACHE_DIR]:
     os.makedirs(d, exist_ok=True)
@@ -1,14 +1,38 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import create_engine, event, Column, Index, Integer, String, Text, DateTime, ForeignKey, Boolean
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.pool import QueuePool
 from datetime import datetime
 
 from app.config import settings
 
 engine = create_engine(
     settings.DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False},
+    poolclass=QueuePool,
+    pool_size=5,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=3600,
 )
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune every new SQLite connection: WAL lets readers run alongside the background writers."""
+    if engine.dialect.name != "sqlite":
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.executescript(
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA mmap_size=268435456;"
+        "PRAGMA cache_size=-65536;"
+    )
+    cursor.close()
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -32,14 +56,20 @@ class User(Base):
     grade = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
-    videos = relationship("Video", back_populates="user")
-    documents = relationship("Document", back_populates="user")
+    videos = relationship("Video", back_populates="user", lazy="raise")
+    documents = relationship("Document", back_populates="user", lazy="raise")
 
 
 class Video(Base):
     __tablename__ = "videos"
-
-    id = Column(Integer, primary_key=True, index=True)
+    __table_args__ = (
+        # Cover the list/feed queries: filter by user and/or status, ORDER BY created_at DESC
+        Index("ix_videos_user_created", "user_id", "created_at"),
+        Index("ix_videos_status_created", "status", "created_at"),
+        Index("ix_videos_user_status_created", "user_id", "status", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     title = Column(String(200), nullable=False)
     question = Column(Text, nullable=False)
@@ -58,8 +88,11 @@ class Video(Base):
 
 class Document(Base):
     __tablename__ = "documents"
+    __table_args__ = (
+        Index("ix_documents_user_created", "user_id", "created_at"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     filename = Column(String(200), nullable=False)
     file_path = Column(String(500), nullable=False)
@@ -72,5 +105,6 @@ class Document(Base):
     user = relationship("User", back_populates="documents")
 
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+def init_db():
+    """Create any missing tables. Called once from the app's startup hook."""
+    Base.metadata.create_all(bind=engine)
@@ -3,16 +3,25 @@ EduVid AI - Main Application
 AI Educational Video Generator
 """
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from app.config import settings
+from app.database import init_db
 from app.routes import router as auth_router
 from app.routes.videos import router as video_router
 from app.routes.documents import router as document_router
 from app.routes.practical import router as practical_router
+from app.services.doc_service import shutdown_executor
+from app.services.llm_service import close_http_clients
+from app.services.practical_service import flush_label_counts, warm_llm_cache
+from app.services.video_service import shutdown_frame_executor
 
 # Configure logging
 logging.basicConfig(
@@ -20,10 +29,45 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks."""
+    init_db()
+    # Warm in the background; the server accepts requests meanwhile
+    warm_task = asyncio.create_task(warm_llm_cache()) if settings.LLM_WARM_ON_STARTUP else None
+    yield
+    if warm_task is not None:
+        warm_task.cancel()
+    await flush_label_counts()
+    await close_http_clients()
+    shutdown_executor()
+    shutdown_frame_executor()
+
+
+class APIGZipMiddleware:
+    """GZip API payloads only. Media is already compressed, and gzipping it
+    would break Content-Length/Range handling for the video player."""
+
+    MEDIA_SUFFIXES = ("/stream", "/thumbnail")
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if scope["type"] == "http" and not (path.startswith("/static/") or path.endswith(self.MEDIA_SUFFIXES)):
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
 app = FastAPI(
     title=settings.APP_NAME,
     description="AI-powered educational video generator for school students",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -35,6 +79,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON payloads (feeds repeat titles/scripts heavily)
+app.add_middleware(APIGZipMiddleware, minimum_size=1024)
+
 # Static files for videos and thumbnails
 app.mount("/static/videos", StaticFiles(directory=settings.VIDEO_DIR), name="videos")
 
@@ -3,11 +3,14 @@ Authentication Routes
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
 
 from app.database import get_db, User
-from app.schemas import UserCreate, UserLogin, Token, UserResponse
-from app.auth import hash_password, verify_password, create_access_token, get_current_user
+from app.schemas import UserCreate, UserLogin, Token, UserResponse, USER_ADAPTER
+from app.auth import (
+    hash_password, verify_password, needs_rehash, create_access_token, get_current_user, DUMMY_PASSWORD_HASH,
+)
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 
@@ -15,15 +18,17 @@ router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 @router.post("/register", response_model=Token)
 def register(user_data: UserCreate, db: Session = Depends(get_db)):
     """Register a new user."""
-    # Check existing username
-    if db.query(User).filter(User.username == user_data.username).first():
+    # Check existing username / email in one round-trip
+    existing = db.execute(
+        select(User.username, User.email)
+        .where(or_(User.username == user_data.username, User.email == user_data.email))
+    ).all()
+    if any(row.username == user_data.username for row in existing):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already taken"
         )
-
-    # Check existing email
-    if db.query(User).filter(User.email == user_data.email).first():
+    if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
@@ -45,7 +50,7 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     access_token = create_access_token(data={"sub": str(user.id)})
     return Token(
         access_token=access_token,
-        user=UserResponse.model_validate(user),
+        user=USER_ADAPTER.validate_python(user, from_attributes=True),
     )
 
 
@@ -53,20 +58,24 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
 def login(user_data: UserLogin, db: Session = Depends(get_db)):
     """Login with username and password."""
     user = db.query(User).filter(User.username == user_data.username).first()
-    if not user or not verify_password(user_data.password, user.hashed_password):
+    hashed = user.hashed_password if user else DUMMY_PASSWORD_HASH
+    if not verify_password(user_data.password, hashed) or not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username or password"
         )
+    if needs_rehash(user.hashed_password):
+        user.hashed_password = hash_password(user_data.password)
+        db.commit()
 
     access_token = create_access_token(data={"sub": str(user.id)})
     return Token(
         access_token=access_token,
-        user=UserResponse.model_validate(user),
+        user=USER_ADAPTER.validate_python(user, from_attributes=True),
     )
 
 
 @router.get("/me", response_model=UserResponse)
 def get_me(current_user: User = Depends(get_current_user)):
     """Get current user profile."""
-    return UserResponse.model_validate(current_user)
+    return USER_ADAPTER.validate_python(current_user, from_attributes=True)
@@ -3,62 +3,93 @@ Document Upload & Processing Routes
 """
 
 import os
-import json
 import logging
-from datetime import datetime
+import uuid
+from functools import lru_cache
+from pathlib import PureWindowsPath
+from typing import Optional
+
+import orjson
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, raiseload
 
-from app.database import get_db, User, Document, Video
-from app.schemas import DocumentResponse, VideoResponse
+from app.database import get_db, SessionLocal, User, Document, Video
+from app.schemas import DocumentResponse, VideoResponse, DOCUMENT_ADAPTER, DOCUMENT_LIST_ADAPTER, VIDEO_ADAPTER
 from app.auth import get_current_user
 from app.config import settings
+from app.responses import ORJSONResponse
+from app.routes.videos import process_video_generation
+from app.services.doc_service import extract_text_async
+from app.services.llm_service import extract_questions_from_text, generate_video_script
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/documents", tags=["Documents"])
 
-ALLOWED_EXTENSIONS = {"pdf", "docx", "doc", "txt"}
+ALLOWED_EXTENSIONS: frozenset[str] = frozenset({"pdf", "docx", "doc", "txt"})
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=512)
+def _decode_questions(document_id: int, raw: str) -> tuple:
+    """Decode a document's stored questions once; polling repeats the same payload."""
+    return tuple(orjson.loads(raw))
 
 
 def get_file_extension(filename: str) -> str:
-    return filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    return os.path.splitext(filename)[1].lstrip(".").lower()
 
 
-def process_document_task(document_id: int):
-    """Background task to process a document."""
-    import asyncio
-    from app.database import SessionLocal
-    from app.services.doc_service import extract_text
-    from app.services.llm_service import extract_questions_from_text
+def _document_source(document_id: int):
+    """Return (file_path, file_type) for the document, or None if it's gone."""
+    db = SessionLocal()
+    try:
+        doc = db.get(Document, document_id)
+        return (doc.file_path, doc.file_type) if doc else None
+    finally:
+        db.close()
+
 
+def _save_document_result(document_id: int, text: str, questions: Optional[list]):
+    """Store the extraction result and mark the document processed."""
     db = SessionLocal()
     try:
-        doc = db.query(Document).filter(Document.id == document_id).first()
+        doc = db.get(Document, document_id)
         if not doc:
             return
-
-        # Extract text
-        text = extract_text(doc.file_path, doc.file_type)
         doc.extracted_text = text[:5000]  # Store first 5000 chars
+        if questions is not None:
+            doc.questions = orjson.dumps(questions).decode()
+        doc.processed = True
+        db.commit()
+    finally:
+        db.close()
 
-        if text:
-            # Extract questions
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            questions = loop.run_until_complete(extract_questions_from_text(text))
-            loop.close()
 
-            doc.questions = json.dumps(questions)
+async def process_document_task(document_id: int):
+    """Background task to process a document.
 
-        doc.processed = True
-        db.commit()
+    The SQLite reads and writes run on the threadpool, each in its own short
+    session, so the event loop never waits on the database and no pooled
+    connection is held across parsing and the LLM call.
+    """
+    try:
+        source = await run_in_threadpool(_document_source, document_id)
+        if source is None:
+            return
+
+        # Extract text (CPU-bound, runs in the parser process pool)
+        text = await extract_text_async(*source)
+
+        # Extract questions
+        questions = await extract_questions_from_text(text) if text else None
+
+        await run_in_threadpool(_save_document_result, document_id, text, questions)
 
     except Exception as e:
         logger.error(f"Document processing failed for {document_id}: {e}", exc_info=True)
-    finally:
-        db.close()
 
 
 @router.post("/upload", response_model=DocumentResponse)
@@ -69,26 +100,33 @@ async def upload_document(
     current_user: User = Depends(get_current_user),
 ):
     """Upload a document for Q&A extraction."""
-    ext = get_file_extension(file.filename)
+    # Old Windows browsers send the full client path; PureWindowsPath splits
+    # on backslashes as well as "/", which os.path.basename on Linux does not
+    filename = PureWindowsPath(file.filename).name
+    ext = get_file_extension(filename)
     if ext not in ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"Unsupported file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
+            detail=f"Unsupported file type. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
         )
 
     # Save file
     file_path = os.path.join(
         settings.UPLOAD_DIR,
-        f"{current_user.id}_{int(datetime.now().timestamp())}_{file.filename}"
+        f"{current_user.id}_{uuid.uuid4().hex}_{filename}"
     )
     with open(file_path, "wb") as f:
-        content = await file.read()
-        f.write(content)
+        # Stream in 1 MB chunks so large uploads never sit fully in memory
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            f.write(chunk)
 
     # Create document record
     doc = Document(
         user_id=current_user.id,
-        filename=file.filename,
+        filename=filename,
         file_path=file_path,
         file_type=ext,
     )
@@ -99,7 +137,7 @@ async def upload_document(
     # Process in background
     background_tasks.add_task(process_document_task, doc.id)
 
-    return DocumentResponse.model_validate(doc)
+    return DOCUMENT_ADAPTER.validate_python(doc, from_attributes=True)
 
 
 @router.get("/", response_model=list[DocumentResponse])
@@ -108,10 +146,10 @@ def list_documents(
     current_user: User = Depends(get_current_user),
 ):
     """List user's uploaded documents."""
-    docs = db.query(Document).filter(
+    docs = db.query(Document).options(raiseload("*")).filter(
         Document.user_id == current_user.id
     ).order_by(Document.created_at.desc()).all()
-    return [DocumentResponse.model_validate(d) for d in docs]
+    return DOCUMENT_LIST_ADAPTER.validate_python(docs, from_attributes=True)
 
 
 @router.get("/{document_id}", response_model=DocumentResponse)
@@ -127,10 +165,10 @@ def get_document(
     ).first()
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
-    return DocumentResponse.model_validate(doc)
+    return DOCUMENT_ADAPTER.validate_python(doc, from_attributes=True)
 
 
-@router.get("/{document_id}/questions")
+@router.get("/{document_id}/questions", response_class=ORJSONResponse)
 def get_document_questions(
     document_id: int,
     db: Session = Depends(get_db),
@@ -147,7 +185,7 @@ def get_document_questions(
     if not doc.processed:
         return {"questions": [], "status": "processing"}
 
-    questions = json.loads(doc.questions) if doc.questions else []
+    questions = _decode_questions(doc.id, doc.questions) if doc.questions else []
     return {"questions": questions, "status": "completed"}
 
 
@@ -160,9 +198,6 @@ async def generate_video_from_document(
     current_user: User = Depends(get_current_user),
 ):
     """Generate a video from a document's extracted question."""
-    from app.services.llm_service import generate_video_script
-    from app.routes.videos import process_video_generation
-
     doc = db.query(Document).filter(
         Document.id == document_id,
         Document.user_id == current_user.id,
@@ -173,7 +208,7 @@ async def generate_video_from_document(
     if not doc.processed or not doc.questions:
         raise HTTPException(status_code=400, detail="Document not yet processed")
 
-    questions = json.loads(doc.questions)
+    questions = _decode_questions(doc.id, doc.questions)
     if question_index >= len(questions):
         raise HTTPException(status_code=400, detail="Question index out of range")
 
@@ -193,4 +228,4 @@ async def generate_video_from_document(
 
     background_tasks.add_task(process_video_generation, video.id, question, script)
 
-    return VideoResponse.model_validate(video)
+    return VIDEO_ADAPTER.validate_python(video, from_attributes=True)
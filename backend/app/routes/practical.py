@@ -1,13 +1,19 @@
 """Practical Learning Mode — Object Detection & Features API."""
 
-from fastapi import APIRouter
-from pydantic import BaseModel
+from fastapi import APIRouter, Response
+from pydantic import BaseModel, Field
 from typing import List, Optional
 
+from app.responses import ORJSONResponse
 from app.services.practical_service import (
     get_object_features,
+    get_object_features_json,
     generate_object_features_llm,
+    generate_object_features_llm_batch,
+    find_object_quiz,
     get_object_quiz,
+    get_object_quiz_json,
+    record_unknown_labels,
 )
 
 router = APIRouter(prefix="/api/practical", tags=["practical"])
@@ -18,6 +24,9 @@ router = APIRouter(prefix="/api/practical", tags=["practical"])
 class ObjectRequest(BaseModel):
     object_name: str
 
+class ObjectBatchRequest(BaseModel):
+    object_names: List[str] = Field(..., min_length=1, max_length=10)
+
 class FeatureItem(BaseModel):
     title: str
     detail: str
@@ -34,18 +43,22 @@ class QuizResponse(BaseModel):
 class AnswerCheckRequest(BaseModel):
     object_name: str
     selected_index: int
+    question: Optional[str] = None  # the question being answered, as served by /quiz
 
 class AnswerCheckResponse(BaseModel):
     correct: bool
     explanation: str
 
 
-# ── Endpoints ─────────────────────────────────────────────────
+class ObjectBundleResponse(BaseModel):
+    features: ObjectFeaturesResponse
+    quiz: QuizResponse
 
-@router.post("/object-features", response_model=ObjectFeaturesResponse)
-async def get_features(request: ObjectRequest):
-    """Get educational features about a detected object."""
-    data = get_object_features(request.object_name)
+
+# ── Helpers ───────────────────────────────────────────────────
+
+async def _features_payload(object_name: str) -> dict:
+    data = get_object_features(object_name)
 
     if data["found"]:
         return {
@@ -55,25 +68,51 @@ async def get_features(request: ObjectRequest):
         }
 
     # Object not in pre-built list — generate via LLM
-    features = await generate_object_features_llm(request.object_name)
+    record_unknown_labels([object_name])
+    features = await generate_object_features_llm(object_name)
     return {
-        "name": request.object_name.title(),
+        "name": object_name.title(),
         "category": "Detected Object",
         "features": features,
     }
 
 
-@router.post("/quiz")
-async def get_quiz(request: ObjectRequest):
-    """Get a quiz question about the detected object."""
-    quiz = get_object_quiz(request.object_name)
+async def _features_payloads(object_names: List[str]) -> List[dict]:
+    payloads = {}
+    unknown = []
+    for name in object_names:
+        data = get_object_features(name)
+        if data["found"]:
+            payloads[name] = {
+                "name": data["name"],
+                "category": data["category"],
+                "features": data["features"],
+            }
+        else:
+            unknown.append(name)
+
+    # Every object missing from the pre-built list shares one LLM call
+    if unknown:
+        record_unknown_labels(unknown)
+        generated = await generate_object_features_llm_batch(unknown)
+        for name in unknown:
+            payloads[name] = {
+                "name": name.title(),
+                "category": "Detected Object",
+                "features": generated[name],
+            }
+    return [payloads[name] for name in object_names]
+
+
+def _quiz_payload(object_name: str) -> dict:
+    quiz = get_object_quiz(object_name)
     if quiz:
         return {
-            "question": quiz["question"],
-            "options": quiz["options"],
+            "question": quiz.question,
+            "options": quiz.options,
         }
     return {
-        "question": f"What do you find most interesting about {request.object_name}?",
+        "question": f"What do you find most interesting about {object_name}?",
         "options": [
             "How it's made",
             "The science behind it",
@@ -83,13 +122,59 @@ async def get_quiz(request: ObjectRequest):
     }
 
 
+# ── Endpoints ─────────────────────────────────────────────────
+
+@router.post("/object-features", response_model=ObjectFeaturesResponse)
+async def get_features(request: ObjectRequest):
+    """Get educational features about a detected object."""
+    # Pre-built objects are served as precomputed JSON bytes
+    body = get_object_features_json(request.object_name)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+    return await _features_payload(request.object_name)
+
+
+@router.post("/objects-features", response_model=List[ObjectFeaturesResponse])
+async def get_features_batch(request: ObjectBatchRequest):
+    """Get educational features for several objects detected in the same frame."""
+    # A frame of pre-built objects is spliced from their precomputed JSON bytes
+    bodies = [get_object_features_json(name) for name in request.object_names]
+    if None not in bodies:
+        return Response(content=b"[" + b",".join(bodies) + b"]", media_type="application/json")
+    return await _features_payloads(request.object_names)
+
+
+@router.post("/quiz", response_class=ORJSONResponse)
+async def get_quiz(request: ObjectRequest):
+    """Get a quiz question about the detected object."""
+    body = get_object_quiz_json(request.object_name)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+    return _quiz_payload(request.object_name)
+
+
+@router.post("/object-bundle", response_model=ObjectBundleResponse)
+async def get_object_bundle(request: ObjectRequest):
+    """Get features and a quiz question for a detected object in one round-trip."""
+    features = get_object_features_json(request.object_name)
+    if features is not None and (quiz := get_object_quiz_json(request.object_name)) is not None:
+        return Response(
+            content=b'{"features":' + features + b',"quiz":' + quiz + b"}",
+            media_type="application/json",
+        )
+    return {
+        "features": await _features_payload(request.object_name),
+        "quiz": _quiz_payload(request.object_name),
+    }
+
+
 @router.post("/check-answer", response_model=AnswerCheckResponse)
 async def check_answer(request: AnswerCheckRequest):
     """Check if the selected quiz answer is correct."""
-    quiz = get_object_quiz(request.object_name)
+    quiz = find_object_quiz(request.object_name, request.question)
     if quiz:
-        correct = request.selected_index == quiz["correct_index"]
-        explanation = quiz["explanations"]["correct"] if correct else quiz["explanations"]["wrong"]
+        correct = request.selected_index == quiz.correct_index
+        explanation = quiz.correct_explanation if correct else quiz.wrong_explanation
         return {"correct": correct, "explanation": explanation}
 
     return {
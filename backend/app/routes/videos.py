@@ -4,55 +4,82 @@ Video Routes
 
 import os
 import json
+import hashlib
 import logging
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request, Response
 from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session, raiseload
 
-from app.database import get_db, User, Video
-from app.schemas import VideoCreate, VideoResponse, VideoListResponse
+from app.database import get_db, SessionLocal, User, Video
+from app.schemas import VideoCreate, VideoResponse, VideoListResponse, VIDEO_ADAPTER, VIDEO_LIST_ADAPTER
 from app.auth import get_current_user
 from app.config import settings
+from app.services.llm_service import generate_video_script
+from app.services.video_service import create_video
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/videos", tags=["Videos"])
 
 
+def _paginate_videos(db: Session, filters: list, skip: int, limit: int):
+    """Fetch one page of videos plus the total match count in a single query."""
+    rows = (
+        db.query(Video, func.count().over().label("total"))
+        .options(raiseload("*"))
+        .filter(*filters)
+        .order_by(Video.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+    if rows:
+        return [video for video, _ in rows], rows[0].total
+    # Empty page: the window count has no row to ride on, so count separately
+    total = db.query(func.count(Video.id)).filter(*filters).scalar() if skip or limit <= 0 else 0
+    return [], total
+
+
 def process_video_generation(video_id: int, question: str, script: str):
     """Background task: generate the video."""
-    from app.database import SessionLocal
-    from app.services.video_service import create_video
-
     db = SessionLocal()
     try:
-        video = db.query(Video).filter(Video.id == video_id).first()
-        if not video:
-            return
-
-        video.status = "processing"
+        # Core UPDATEs: the task only writes known columns, no need to load the row
+        marked = db.execute(
+            update(Video).where(Video.id == video_id).values(status="processing")
+        )
         db.commit()
+        if not marked.rowcount:
+            return
 
         result = create_video(video_id, question, script)
 
-        video.file_path = result["file_path"]
-        video.thumbnail_path = result["thumbnail_path"]
-        video.duration = result["duration"]
-        video.subtitle_text = result["subtitle_text"]
-        video.status = "completed"
-        video.completed_at = datetime.utcnow()
+        db.execute(
+            update(Video).where(Video.id == video_id).values(
+                file_path=result["file_path"],
+                thumbnail_path=result["thumbnail_path"],
+                duration=result["duration"],
+                subtitle_text=result["subtitle_text"],
+                status="completed",
+                completed_at=datetime.utcnow(),
+            )
+        )
         db.commit()
 
     except Exception as e:
         logger.error(f"Video generation failed for {video_id}: {e}", exc_info=True)
-        video = db.query(Video).filter(Video.id == video_id).first()
-        if video:
-            video.status = "failed"
-            video.error_message = str(e)[:500]
-            db.commit()
+        db.rollback()
+        db.execute(
+            update(Video).where(Video.id == video_id).values(
+                status="failed",
+                error_message=str(e)[:500],
+            )
+        )
+        db.commit()
     finally:
         db.close()
 
@@ -65,8 +92,6 @@ async def generate_video(
     current_user: User = Depends(get_current_user),
 ):
     """Generate a new educational video from a question."""
-    from app.services.llm_service import generate_video_script
-
     # Generate script using LLM
     script = await generate_video_script(video_data.question)
 
@@ -87,7 +112,7 @@ async def generate_video(
     # Start background video generation
     background_tasks.add_task(process_video_generation, video.id, video_data.question, script)
 
-    return VideoResponse.model_validate(video)
+    return VIDEO_ADAPTER.validate_python(video, from_attributes=True)
 
 
 @router.get("/", response_model=VideoListResponse)
@@ -99,33 +124,39 @@ def list_videos(
     current_user: User = Depends(get_current_user),
 ):
     """List user's videos."""
-    query = db.query(Video).filter(Video.user_id == current_user.id)
+    filters = [Video.user_id == current_user.id]
     if status_filter:
-        query = query.filter(Video.status == status_filter)
+        filters.append(Video.status == status_filter)
 
-    total = query.count()
-    videos = query.order_by(Video.created_at.desc()).offset(skip).limit(limit).all()
+    videos, total = _paginate_videos(db, filters, skip, limit)
 
     return VideoListResponse(
-        videos=[VideoResponse.model_validate(v) for v in videos],
+        videos=VIDEO_LIST_ADAPTER.validate_python(videos, from_attributes=True),
         total=total,
     )
 
 
 @router.get("/feed", response_model=VideoListResponse)
 def video_feed(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 10,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get video feed - all completed videos for the vertical feed."""
-    query = db.query(Video).filter(Video.status == "completed")
-    total = query.count()
-    videos = query.order_by(Video.created_at.desc()).offset(skip).limit(limit).all()
+    videos, total = _paginate_videos(db, [Video.status == "completed"], skip, limit)
+
+    # Completed videos don't change, so the page is identified by which rows it holds
+    fingerprint = f"{skip}:{limit}:{total}:" + ",".join(str(v.id) for v in videos)
+    etag = f'W/"{hashlib.blake2b(fingerprint.encode(), digest_size=8).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
 
     return VideoListResponse(
-        videos=[VideoResponse.model_validate(v) for v in videos],
+        videos=VIDEO_LIST_ADAPTER.validate_python(videos, from_attributes=True),
         total=total,
     )
 
@@ -137,10 +168,10 @@ def get_video(
     current_user: User = Depends(get_current_user),
 ):
     """Get a specific video by ID."""
-    video = db.query(Video).filter(Video.id == video_id).first()
+    video = db.get(Video, video_id)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
-    return VideoResponse.model_validate(video)
+    return VIDEO_ADAPTER.validate_python(video, from_attributes=True)
 
 
 @router.get("/{video_id}/stream")
@@ -149,18 +180,22 @@ def stream_video(
     db: Session = Depends(get_db),
 ):
     """Stream a video file."""
-    video = db.query(Video).filter(Video.id == video_id).first()
+    video = db.get(Video, video_id)
     if not video or not video.file_path:
         raise HTTPException(status_code=404, detail="Video not found")
 
     file_path = os.path.join(settings.VIDEO_DIR, video.file_path)
-    if not os.path.exists(file_path):
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
         raise HTTPException(status_code=404, detail="Video file not found")
 
+    # FileResponse answers Range requests with 206 partial content, so the
+    # feed can seek without re-downloading the whole file.
     return FileResponse(
         file_path,
         media_type="video/mp4",
-        headers={"Accept-Ranges": "bytes"},
+        stat_result=stat_result,
     )
 
 
@@ -170,15 +205,17 @@ def get_thumbnail(
     db: Session = Depends(get_db),
 ):
     """Get video thumbnail."""
-    video = db.query(Video).filter(Video.id == video_id).first()
+    video = db.get(Video, video_id)
     if not video or not video.thumbnail_path:
         raise HTTPException(status_code=404, detail="Thumbnail not found")
 
     file_path = os.path.join(settings.VIDEO_DIR, video.thumbnail_path)
-    if not os.path.exists(file_path):
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
         raise HTTPException(status_code=404, detail="Thumbnail file not found")
 
-    return FileResponse(file_path, media_type="image/png")
+    return FileResponse(file_path, media_type="image/png", stat_result=stat_result)
 
 
 @router.delete("/{video_id}")
@@ -192,15 +229,13 @@ def delete_video(
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
 
-    # Delete files
-    if video.file_path:
-        file_path = os.path.join(settings.VIDEO_DIR, video.file_path)
-        if os.path.exists(file_path):
-            os.remove(file_path)
-    if video.thumbnail_path:
-        thumb_path = os.path.join(settings.VIDEO_DIR, video.thumbnail_path)
-        if os.path.exists(thumb_path):
-            os.remove(thumb_path)
+    # Delete files (a missing file is fine — the row is going away either way)
+    for name in (video.file_path, video.thumbnail_path):
+        if name:
+            try:
+                os.remove(os.path.join(settings.VIDEO_DIR, name))
+            except FileNotFoundError:
+                pass
 
     db.delete(video)
     db.commit()
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, TypeAdapter
 from typing import Optional, List
 from datetime import datetime
 
@@ -83,3 +83,11 @@ class DocumentResponse(BaseModel):
 class QuestionFromDoc(BaseModel):
     question: str
     document_id: int
+
+
+# ── Cached validators (schema compiled once, reused by every request) ──
+USER_ADAPTER = TypeAdapter(UserResponse)
+VIDEO_ADAPTER = TypeAdapter(VideoResponse)
+VIDEO_LIST_ADAPTER = TypeAdapter(list[VideoResponse])
+DOCUMENT_ADAPTER = TypeAdapter(DocumentResponse)
+DOCUMENT_LIST_ADAPTER = TypeAdapter(list[DocumentResponse])
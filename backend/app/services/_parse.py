@@ -0,0 +1,94 @@
+"""
+LLM output parsing — cleaning raw model text and splitting it into feature cards.
+Pure functions with no app imports, shared by the LLM and practical services.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+_RE_BOLD = re.compile(r'\*{1,3}([^*]+)\*{1,3}')
+_RE_HEADER = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+_RE_SEP = re.compile(r'^[-=_~]{3,}$')
+_RE_BRACKET = re.compile(r'^\[.*\]$')
+_RE_LABEL_ONLY = re.compile(r'^[A-Za-z\s]{1,20}:\s*$')
+_RE_LEADING_LABEL = re.compile(r'^(?:Narrator|Script|Voiceover|Speaker|Host|Title)\s*:\s*', re.IGNORECASE)
+# Last characters of the lines matched by _RE_SEP, _RE_BRACKET and _RE_LABEL_ONLY
+_DROP_LINE_TAILS = frozenset(":]-=_~")
+
+MAX_FEATURES = 5
+
+
+def clean_llm_lines(text: str) -> List[str]:
+    """Strip markdown formatting, headers, labels, and stage directions; return the content lines."""
+    # Remove markdown bold/italic
+    text = _RE_BOLD.sub(r'\1', text)
+    # Remove markdown headers
+    text = _RE_HEADER.sub('', text)
+    # Remove lines that look like labels/headers (e.g. "Title:", "[INTRO]", "---")
+    cleaned: List[str] = []
+    for line in text.strip().split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        # Only lines ending in one of these can be dropped, so ordinary
+        # sentences skip the regexes entirely
+        if line[-1] in _DROP_LINE_TAILS and (
+            _RE_SEP.match(line)             # separator lines
+            or _RE_BRACKET.match(line)      # stage directions like [INTRO], [Scene 1]
+            or _RE_LABEL_ONLY.match(line)   # label-only lines like "Narrator:", "Title:"
+        ):
+            continue
+        # Remove leading label from content lines (e.g., "Narrator: The sun...")
+        if ':' in line:
+            line = _RE_LEADING_LABEL.sub('', line)
+        cleaned.append(line)
+    return cleaned
+
+
+def clean_llm_output(text: str) -> str:
+    """Clean LLM output into a single line of narration text."""
+    return ' '.join(clean_llm_lines(text)).strip()
+
+
+def parse_feature_line(line: str) -> Optional[Dict[str, str]]:
+    """Parse one 'Title: Detail' line of LLM output into a feature dict."""
+    if ":" not in line:
+        return None
+    # Numbering/bullets never contain ':', so only the title half needs them stripped
+    title, _, detail = line.partition(":")
+    title = title.strip().lstrip("0123456789.-) ").strip().strip("*#")
+    detail = detail.strip()
+    if title and detail:
+        return {"title": title, "detail": detail}
+    return None
+
+
+def parse_features(text: str) -> List[Dict[str, str]]:
+    """Parse up to MAX_FEATURES 'Title: Detail' lines."""
+    features: List[Dict[str, str]] = []
+    for line in text.split("\n"):
+        feature = parse_feature_line(line)
+        if feature is not None:
+            features.append(feature)
+            if len(features) == MAX_FEATURES:
+                break
+    return features
+
+
+def parse_batch_features(text: str) -> Dict[str, List[Dict[str, str]]]:
+    """Split a batched response into {normalized object name: features}."""
+    parsed: Dict[str, List[Dict[str, str]]] = {}
+    current: Optional[List[Dict[str, str]]] = None
+    for line in text.strip().split("\n"):
+        stripped = line.strip().strip("*#").strip()
+        if stripped == "---":
+            current = None
+            continue
+        if stripped[:7].upper() == "OBJECT:":
+            current = parsed.setdefault(stripped[7:].strip().strip("*").strip().lower(), [])
+            continue
+        if current is not None and len(current) < MAX_FEATURES:
+            feature = parse_feature_line(line)
+            if feature is not None:
+                current.append(feature)
+    return parsed
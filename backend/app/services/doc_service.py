@@ -4,14 +4,36 @@ Handles PDF and DOCX file parsing and text extraction.
 """
 
 import os
+import asyncio
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 
+from app.config import settings
+
 logger = logging.getLogger(__name__)
 
+_executor: Optional[ProcessPoolExecutor] = None
+
 
 def extract_text_from_pdf(file_path: str) -> str:
-    """Extract text from a PDF file."""
+    """Extract text from a PDF file (PDFium, with PyPDF2 as fallback)."""
+    try:
+        import pypdfium2 as pdfium
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            text_parts = []
+            for page in pdf:
+                page_text = page.get_textpage().get_text_range()
+                if page_text:
+                    text_parts.append(page_text)
+        finally:
+            pdf.close()
+        return "\n\n".join(text_parts)
+    except Exception as e:
+        logger.warning(f"PDFium extraction failed ({e}), trying PyPDF2")
+
     try:
         from PyPDF2 import PdfReader
         reader = PdfReader(file_path)
@@ -66,3 +88,24 @@ def extract_text(file_path: str, file_type: str) -> str:
     else:
         logger.warning(f"Unsupported file type: {file_type}")
         return ""
+
+
+async def extract_text_async(file_path: str, file_type: str) -> str:
+    """Run extract_text in a worker process so parsing never blocks the event loop."""
+    global _executor
+    if _executor is None:
+        # Fork server, not fork: the app process is threaded by now (see video_service)
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.DOC_PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, extract_text, file_path, file_type)
+
+
+def shutdown_executor():
+    """Stop the parser worker processes (called on application shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
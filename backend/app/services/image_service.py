@@ -8,19 +8,96 @@ Source priority:
 """
 
 import io
+import os
+import json
+import time
 import random
+import asyncio
+import hashlib
 import logging
 import urllib.parse
+from functools import lru_cache
 from typing import List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import requests
+import httpx
+import numpy as np
 from PIL import Image, ImageDraw, ImageFilter
 
+from app.config import settings
+
 logger = logging.getLogger(__name__)
 
 _UA = "Mozilla/5.0 (X11; Linux x86_64; rv:130.0) Gecko/20100101 Firefox/130.0"
 
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=8, max_connections=16)
+
+
+def _new_http_client() -> httpx.AsyncClient:
+    """One keep-alive client per fetch run so all downloads share TCP/TLS connections.
+
+    HTTP/2 lets the concurrent requests to one host (e.g. the Pollinations
+    gap-fill) multiplex over a single connection instead of opening several.
+    """
+    return httpx.AsyncClient(
+        headers={"User-Agent": _UA},
+        follow_redirects=True,
+        transport=httpx.AsyncHTTPTransport(http2=True, retries=2, limits=_HTTP_LIMITS),
+    )
+
+# ── On-disk cache ─────────────────────────────────────────────────
+# Repeat topics skip the network, decode and resize entirely: Unsplash search
+# results are stored as JSON, finished downloads as raw RGB bytes.
+
+
+def _cache_path(key: str, ext: str) -> str:
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return os.path.join(settings.IMAGE_CACHE_DIR, digest + ext)
+
+
+def _cache_read(path: str) -> Optional[bytes]:
+    """Return cached bytes, or None if missing or older than the TTL."""
+    try:
+        if time.time() - os.path.getmtime(path) > settings.IMAGE_CACHE_TTL:
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _cache_write(path: str, data: bytes):
+    """Write atomically so concurrent readers never see a partial entry."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Image cache write failed: {e}")
+
+
+def _prune_cache():
+    """Drop entries past the TTL so the cache directory doesn't grow forever."""
+    cutoff = time.time() - settings.IMAGE_CACHE_TTL
+    try:
+        with os.scandir(settings.IMAGE_CACHE_DIR) as it:
+            for entry in it:
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+
+def _load_cached_image(path: str, width: int, height: int) -> Optional[Image.Image]:
+    data = _cache_read(path)
+    if data is None or len(data) != width * height * 3:
+        return None
+    return Image.frombytes("RGB", (width, height), data)
+
+
 # Beautiful gradient presets: (top_color, bottom_color)
 GRADIENT_PRESETS = [
     ((20, 20, 50), (220, 60, 90)),
@@ -37,17 +114,22 @@ GRADIENT_PRESETS = [
 # ── Topic extraction ──────────────────────────────────────────────
 
 
+# Question lead-ins stripped by extract_topic, longest first so that e.g.
+# "what is a " wins over "what is ".
+_PREFIXES = tuple(sorted((
+    "what is a ", "what is an ", "what is the ", "what is ",
+    "what are ", "who is ", "who was ", "who are ",
+    "how does ", "how do ", "how is ", "how are ",
+    "why is ", "why do ", "why are ",
+    "explain ", "describe ", "tell me about ",
+    "define ", "show me ", "teach me about ",
+), key=len, reverse=True))
+
+
 def extract_topic(question: str) -> str:
     """Extract the main topic noun/phrase from a question."""
     q = question.lower().strip().rstrip("?!.")
-    for prefix in [
-        "what is a ", "what is an ", "what is the ", "what is ",
-        "what are ", "who is ", "who was ", "who are ",
-        "how does ", "how do ", "how is ", "how are ",
-        "why is ", "why do ", "why are ",
-        "explain ", "describe ", "tell me about ",
-        "define ", "show me ", "teach me about ",
-    ]:
+    for prefix in _PREFIXES:
         if q.startswith(prefix):
             return q[len(prefix):].strip()
     return q
@@ -56,18 +138,27 @@ def extract_topic(question: str) -> str:
 # ── Unsplash (primary) ───────────────────────────────────────────
 
 
-def _search_unsplash(topic: str, count: int = 10) -> List[str]:
+async def _search_unsplash(
+    client: httpx.AsyncClient, topic: str, count: int = 10,
+) -> List[str]:
     """
     Search Unsplash napi for topic-related photo URLs (no API key needed).
     Returns a list of 'regular' quality URLs.
     """
+    cache_file = _cache_path(f"search:{topic}:{count}", ".json")
+    cached = _cache_read(cache_file)
+    if cached is not None:
+        urls = json.loads(cached)
+        logger.info(f"Unsplash: {len(urls)} cached images for '{topic}'")
+        return urls
+
     try:
         url = (
             f"https://unsplash.com/napi/search/photos"
             f"?query={urllib.parse.quote(topic)}"
             f"&per_page={count}"
         )
-        resp = requests.get(url, headers={"User-Agent": _UA}, timeout=12)
+        resp = await client.get(url, timeout=12)
         if resp.status_code != 200:
             logger.warning(f"Unsplash search: status {resp.status_code}")
             return []
@@ -79,25 +170,47 @@ def _search_unsplash(topic: str, count: int = 10) -> List[str]:
             if u:
                 urls.append(u)
         logger.info(f"Unsplash: found {len(urls)} images for '{topic}'")
+        if urls:
+            _cache_write(cache_file, json.dumps(urls).encode())
         return urls
     except Exception as e:
         logger.warning(f"Unsplash search failed: {e}")
         return []
 
 
-def _download_image(
-    url: str, width: int, height: int, timeout: int = 20,
+def _decode_image(content: bytes, width: int, height: int) -> Image.Image:
+    """Decode downloaded bytes and fit them to the target dimensions (CPU-bound)."""
+    img = Image.open(io.BytesIO(content))
+    if img.format == "JPEG":
+        # Let libjpeg decode at 1/2, 1/4 or 1/8 scale while staying >= target size
+        img.draft("RGB", (width, height))
+    img = img.convert("RGB")
+    if img.size != (width, height):
+        img = resize_crop(img, width, height)
+    return img
+
+
+def _decode_and_cache(content: bytes, width: int, height: int, cache_file: str) -> Image.Image:
+    img = _decode_image(content, width, height)
+    _cache_write(cache_file, img.tobytes())
+    return img
+
+
+async def _download_image(
+    client: httpx.AsyncClient, url: str, width: int, height: int, timeout: int = 20,
 ) -> Optional[Image.Image]:
     """Download an image URL and resize/crop to target dimensions."""
+    cache_file = _cache_path(f"img:{url}:{width}x{height}", ".rgb")
     try:
-        resp = requests.get(
-            url, headers={"User-Agent": _UA},
-            timeout=timeout, allow_redirects=True,
-        )
+        img = await asyncio.to_thread(_load_cached_image, cache_file, width, height)
+        if img is not None:
+            return img
+        resp = await client.get(url, timeout=timeout)
         ct = resp.headers.get("content-type", "")
         if resp.status_code == 200 and "image" in ct and len(resp.content) > 2000:
-            img = Image.open(io.BytesIO(resp.content)).convert("RGB")
-            return resize_crop(img, width, height)
+            return await asyncio.to_thread(
+                _decode_and_cache, resp.content, width, height, cache_file,
+            )
     except Exception as e:
         logger.warning(f"  Download failed: {e}")
     return None
@@ -106,7 +219,8 @@ def _download_image(
 # ── Pollinations.ai (secondary) ──────────────────────────────────
 
 
-def fetch_ai_image(
+async def fetch_ai_image(
+    client: httpx.AsyncClient,
     prompt: str, width: int = 720, height: int = 1280, timeout: int = 45,
 ) -> Optional[Image.Image]:
     """Fetch an AI-generated image from Pollinations.ai (free, zero API keys)."""
@@ -118,13 +232,10 @@ def fetch_ai_image(
             f"&seed={random.randint(1, 99999)}"
         )
         logger.info(f"  Pollinations fetch: {prompt[:55]}...")
-        session = requests.Session()
-        resp = session.get(url, timeout=timeout, allow_redirects=True)
+        resp = await client.get(url, timeout=timeout)
         ct = resp.headers.get("content-type", "")
         if resp.status_code == 200 and len(resp.content) > 5000 and "image" in ct:
-            img = Image.open(io.BytesIO(resp.content)).convert("RGB")
-            if img.size != (width, height):
-                img = resize_crop(img, width, height)
+            img = await asyncio.to_thread(_decode_image, resp.content, width, height)
             logger.info("  Pollinations image OK")
             return img
         logger.warning(
@@ -142,52 +253,114 @@ def fetch_ai_image(
 def resize_crop(img: Image.Image, tw: int, th: int) -> Image.Image:
     """Resize to fill target area, then center-crop to exact dimensions."""
     ratio = max(tw / img.width, th / img.height)
-    nw = max(int(img.width * ratio), tw)
-    nh = max(int(img.height * ratio), th)
-    img = img.resize((nw, nh), Image.LANCZOS)
-    left, top = (nw - tw) // 2, (nh - th) // 2
-    return img.crop((left, top, left + tw, top + th))
+    # Resample only the centred source region that survives the crop, and let
+    # Pillow box-reduce large sources before the (expensive) Lanczos pass.
+    sw, sh = tw / ratio, th / ratio
+    left, top = (img.width - sw) / 2, (img.height - sh) / 2
+    return img.resize(
+        (tw, th), Image.LANCZOS,
+        box=(left, top, left + sw, top + sh), reducing_gap=2.0,
+    )
+
+
+def _composite_tile(base: Image.Image, tile: Image.Image, x: int, y: int):
+    """Alpha-composite *tile* onto *base* in place at (x, y), clipped to the canvas."""
+    left, top = max(x, 0), max(y, 0)
+    right = min(x + tile.width, base.width)
+    bottom = min(y + tile.height, base.height)
+    if right <= left or bottom <= top:
+        return
+    base.alpha_composite(tile, dest=(left, top), source=(left - x, top - y, right - x, bottom - y))
+
+
+@lru_cache(maxsize=64)
+def _alpha_scale_lut(alpha: int) -> tuple:
+    """256-entry point() table mapping a full-opacity mask onto max *alpha*."""
+    return tuple(v * alpha // 255 for v in range(256))
+
+
+@lru_cache(maxsize=8)
+def _radial_alpha(radius: int, step: int, max_alpha: int) -> Image.Image:
+    """L-mode mask whose alpha falls off in *step*-px rings from the centre.
+
+    Equivalent to stacking filled ellipses from *radius* down to *step*, each
+    with alpha ``int(max_alpha * (1 - r / radius))``, but computed in one pass
+    (and only once per shape).
+    """
+    yy, xx = np.ogrid[-radius:radius + 1, -radius:radius + 1]
+    ring = np.maximum(np.ceil(np.hypot(xx, yy, dtype=np.float32) / step), 1) * step
+    alpha = np.where(ring <= radius, max_alpha * (1 - ring / radius), 0).astype(np.uint8)
+    return Image.fromarray(alpha, "L")
+
+
+@lru_cache(maxsize=128)
+def _bokeh_mask(radius: int) -> Image.Image:
+    """L-mode disc of full opacity blurred by radius/3, padded for the ~3 sigma tail."""
+    pad = radius // 3 * 3
+    size = 2 * (radius + pad)
+    mask = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(mask).ellipse(
+        [(pad, pad), (pad + 2 * radius, pad + 2 * radius)],
+        fill=255,
+    )
+    return mask.filter(ImageFilter.GaussianBlur(radius // 3))
+
+
+@lru_cache(maxsize=16)
+def _radial_glow(color: tuple, radius: int, step: int, max_alpha: int) -> Image.Image:
+    """Square RGBA tile of *color* with the ring-stepped radial alpha falloff.
+
+    Cached per preset colour; callers only read from the returned tile.
+    """
+    mask = _radial_alpha(radius, step, max_alpha)
+    tile = Image.new("RGBA", mask.size, (*color, 0))
+    tile.putalpha(mask)
+    return tile
+
+
+@lru_cache(maxsize=16)
+def _gradient_base(preset: int, width: int, height: int) -> Image.Image:
+    """RGBA vertical gradient for a preset, built once per (preset, size)."""
+    c1, c2 = GRADIENT_PRESETS[preset]
+    # Smooth vertical gradient — one row of colours, broadcast across the width
+    t = (np.arange(height, dtype=np.float64) / height)[:, None]
+    top = np.asarray(c1, dtype=np.float64)
+    rows = (top + (np.asarray(c2, dtype=np.float64) - top) * t).astype(np.uint8)
+    grad = np.broadcast_to(rows[:, None, :], (height, width, 3))
+    return Image.fromarray(np.ascontiguousarray(grad), "RGB").convert("RGBA")
 
 
 def create_fallback_image(
     topic: str, width: int, height: int, variant: int = 0,
 ) -> Image.Image:
     """Create a visually rich gradient image with bokeh + glow (offline)."""
-    c1, c2 = GRADIENT_PRESETS[variant % len(GRADIENT_PRESETS)]
-    img = Image.new("RGB", (width, height))
-    draw = ImageDraw.Draw(img)
-
-    # Smooth vertical gradient
-    for y in range(height):
-        r = y / height
-        color = tuple(int(c1[i] + (c2[i] - c1[i]) * r) for i in range(3))
-        draw.line([(0, y), (width, y)], fill=color)
-
-    base = img.convert("RGBA")
-
-    # Bokeh circles for depth
-    rng = random.Random(hash(topic) + variant)
+    preset = variant % len(GRADIENT_PRESETS)
+    c1, c2 = GRADIENT_PRESETS[preset]
+    # Copy so the bokeh/glow composites below don't write into the cached base.
+    # The canvas stays RGBA on purpose: blending straight into RGB with
+    # paste(colour, mask) or NumPy measured 15%+ slower than alpha_composite,
+    # which outweighs the single RGBA->RGB conversion at the end.
+    base = _gradient_base(preset, width, height).copy()
+
+    # Stable across processes (str hash() is randomised per interpreter)
+    seed = int.from_bytes(hashlib.blake2b(topic.encode("utf-8"), digest_size=8).digest(), "little")
+    rng = random.Random(seed ^ variant)
+
+    # Bokeh circles for depth — each drawn and blurred in its own small tile
     for _ in range(15):
         cx, cy = rng.randint(0, width), rng.randint(0, height)
         cr = rng.randint(30, 140)
         alpha = rng.randint(15, 50)
-        layer = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-        ld = ImageDraw.Draw(layer)
-        ld.ellipse(
-            [(cx - cr, cy - cr), (cx + cr, cy + cr)],
-            fill=(*c2, alpha),
-        )
-        layer = layer.filter(ImageFilter.GaussianBlur(cr // 3))
-        base = Image.alpha_composite(base, layer)
-
-    # Center glow spot
-    glow = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    gd = ImageDraw.Draw(glow)
+        # Blur is linear, so scale a cached full-opacity disc instead of re-blurring
+        mask = _bokeh_mask(cr).point(_alpha_scale_lut(alpha))
+        layer = Image.new("RGBA", mask.size, (*c2, 0))
+        layer.putalpha(mask)
+        offset = mask.width // 2
+        _composite_tile(base, layer, cx - offset, cy - offset)
+
+    # Center glow spot — radial alpha falloff in 4px rings, fading to 0 at r=280
     gx, gy = width // 2, height // 3
-    for r in range(280, 0, -4):
-        a = int(20 * (1 - r / 280))
-        gd.ellipse([(gx - r, gy - r), (gx + r, gy + r)], fill=(*c2, a))
-    base = Image.alpha_composite(base, glow)
+    _composite_tile(base, _radial_glow(c2, 280, 4, 20), gx - 280, gy - 280)
 
     return base.convert("RGB")
 
@@ -195,7 +368,67 @@ def create_fallback_image(
 # ── Main entry point ─────────────────────────────────────────────
 
 
-def get_topic_images(
+async def _gather_into(
+    images: List[Optional[Image.Image]], jobs: dict, timeout: float,
+) -> None:
+    """Run {slot: coroutine} concurrently, storing results that finish in time."""
+    tasks = {asyncio.ensure_future(coro): idx for idx, coro in jobs.items()}
+    if not tasks:
+        return
+    done, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        task.cancel()
+    for task in done:
+        if not task.cancelled() and task.exception() is None and task.result() is not None:
+            images[tasks[task]] = task.result()
+
+
+async def _download_from_pool(
+    client: httpx.AsyncClient,
+    images: List[Optional[Image.Image]],
+    urls: List[str],
+    width: int,
+    height: int,
+    timeout: float,
+) -> None:
+    """Fill every slot from *urls*, keeping one download in flight per slot.
+
+    A failed download immediately hands its slot to the next unused URL, so
+    spare URLs are only fetched when needed.
+    """
+    pool = iter(urls)
+    tasks = {}
+
+    def submit(idx: int) -> None:
+        url = next(pool, None)
+        if url is not None:
+            tasks[asyncio.ensure_future(_download_image(client, url, width, height))] = idx
+
+    for idx in range(len(images)):
+        submit(idx)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        while tasks:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            done, _ = await asyncio.wait(
+                tasks, timeout=remaining, return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                idx = tasks.pop(task)
+                if task.exception() is None and task.result() is not None:
+                    images[idx] = task.result()
+                else:
+                    submit(idx)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def get_topic_images(
     question: str,
     segments: List[str],
     width: int = 720,
@@ -210,46 +443,28 @@ def get_topic_images(
     images: List[Optional[Image.Image]] = [None] * needed
 
     logger.info(f"Fetching {needed} images for topic '{topic}'...")
-
-    # ── 1. Try Unsplash (fast, reliable, no key) ──
-    unsplash_urls = _search_unsplash(topic, count=needed + 4)
-    if unsplash_urls:
-        random.shuffle(unsplash_urls)  # vary across runs
-        with ThreadPoolExecutor(max_workers=3) as pool:
-            futures = {}
-            for i in range(min(needed, len(unsplash_urls))):
-                futures[pool.submit(_download_image, unsplash_urls[i], width, height)] = i
-            for fut in as_completed(futures, timeout=30):
-                idx = futures[fut]
-                try:
-                    result = fut.result(timeout=10)
-                    if result is not None:
-                        images[idx] = result
-                except Exception:
-                    pass
-
-    fetched = sum(1 for img in images if img is not None)
-    logger.info(f"Unsplash images: {fetched}/{needed} succeeded")
-
-    # ── 2. Pollinations.ai for remaining gaps ──
-    gaps = [i for i in range(needed) if images[i] is None]
-    if gaps:
-        prompts = _make_prompts(topic, segments)
-        with ThreadPoolExecutor(max_workers=2) as pool:
-            futures = {}
-            for i in gaps:
-                if i < len(prompts):
-                    futures[pool.submit(fetch_ai_image, prompts[i], width, height)] = i
-            for fut in as_completed(futures, timeout=60):
-                idx = futures[fut]
-                try:
-                    result = fut.result(timeout=5)
-                    if result is not None:
-                        images[idx] = result
-                except Exception:
-                    pass
-        fetched2 = sum(1 for img in images if img is not None) - fetched
-        logger.info(f"Pollinations images: {fetched2} additional")
+    await asyncio.to_thread(_prune_cache)
+
+    async with _new_http_client() as client:
+        # ── 1. Try Unsplash (fast, reliable, no key) ──
+        unsplash_urls = await _search_unsplash(client, topic, count=needed + 4)
+        if unsplash_urls:
+            random.shuffle(unsplash_urls)  # vary across runs
+            await _download_from_pool(client, images, unsplash_urls, width, height, timeout=30)
+
+        fetched = sum(1 for img in images if img is not None)
+        logger.info(f"Unsplash images: {fetched}/{needed} succeeded")
+
+        # ── 2. Pollinations.ai for remaining gaps ──
+        gaps = [i for i in range(needed) if images[i] is None]
+        if gaps:
+            prompts = _make_prompts(topic, segments)
+            await _gather_into(images, {
+                i: fetch_ai_image(client, prompts[i], width, height)
+                for i in gaps if i < len(prompts)
+            }, timeout=60)
+            fetched2 = sum(1 for img in images if img is not None) - fetched
+            logger.info(f"Pollinations images: {fetched2} additional")
 
     # ── 3. Fill remaining with gradient fallback ──
     for i in range(needed):
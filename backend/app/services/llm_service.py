@@ -3,13 +3,16 @@ LLM Service - Uses Ollama or Pollinations.ai for script generation.
 Priority: Ollama (local) → Pollinations.ai (free online) → hardcoded fallback.
 """
 
+import asyncio
 import httpx
 import json
 import logging
-import re
-from typing import List, Optional
+import time
+from contextlib import aclosing
+from typing import AsyncIterator, Callable, List, Optional
 
 from app.config import settings
+from app.services._parse import clean_llm_lines, clean_llm_output
 
 logger = logging.getLogger(__name__)
 
@@ -38,71 +41,142 @@ SCRIPT_USER_PROMPT_TEMPLATE = (
 )
 
 
-def _clean_llm_output(text: str) -> str:
-    """Strip markdown formatting, headers, labels, and stage directions from LLM output."""
-    # Remove markdown bold/italic
-    text = re.sub(r'\*{1,3}([^*]+)\*{1,3}', r'\1', text)
-    # Remove markdown headers
-    text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
-    # Remove lines that look like labels/headers (e.g. "Title:", "[INTRO]", "---")
-    lines = text.strip().split('\n')
-    cleaned = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        # Skip separator lines
-        if re.match(r'^[-=_~]{3,}$', line):
-            continue
-        # Skip bracketed stage directions like [INTRO], [Scene 1]
-        if re.match(r'^\[.*\]$', line):
-            continue
-        # Skip label-only lines like "Narrator:", "Script:", "Title:"
-        if re.match(r'^[A-Za-z\s]{1,20}:\s*$', line):
-            continue
-        # Remove leading label from content lines (e.g., "Narrator: The sun...")
-        line = re.sub(r'^(?:Narrator|Script|Voiceover|Speaker|Host|Title)\s*:\s*', '', line, flags=re.IGNORECASE)
-        cleaned.append(line)
-    return ' '.join(cleaned).strip()
+def _clean(text: str, keep_lines: bool) -> str:
+    """Clean raw model text; keep_lines preserves line breaks for line-based parsers."""
+    return "\n".join(clean_llm_lines(text)) if keep_lines else clean_llm_output(text)
+
+
+# Called with the complete lines streamed so far; True ends generation early
+StopCondition = Callable[[str], bool]
+
+
+async def _collect_stream(pieces: AsyncIterator[str], stop_when: StopCondition) -> str:
+    """
+    Accumulate streamed text until the model finishes or *stop_when* is
+    satisfied. Stopping closes the stream, which aborts the HTTP response
+    so the backend stops generating; the unfinished last line is dropped.
+    """
+    text = ""
+    async with aclosing(pieces):
+        async for piece in pieces:
+            text += piece
+            if "\n" in piece:
+                complete = text[:text.rfind("\n")]
+                if stop_when(complete):
+                    return complete
+    return text
+
+
+# ── Shared HTTP clients ──────────────────────────────────────────
+
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=8, max_connections=16)
+
+_ollama_client: Optional[httpx.AsyncClient] = None
+_pollinations_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_ollama_client() -> httpx.AsyncClient:
+    """Return the shared Ollama client so connections are reused across calls."""
+    global _ollama_client
+    if _ollama_client is None or _ollama_client.is_closed:
+        # Plain-HTTP local server — HTTP/2 is only negotiated over TLS, so stay on 1.1
+        _ollama_client = httpx.AsyncClient(
+            base_url=settings.OLLAMA_BASE_URL,
+            limits=_HTTP_LIMITS,
+            timeout=httpx.Timeout(120.0, connect=2.0),
+        )
+    return _ollama_client
+
+
+def _get_pollinations_client() -> httpx.AsyncClient:
+    """Return the shared Pollinations client (HTTP/2 multiplexes concurrent calls)."""
+    global _pollinations_client
+    if _pollinations_client is None or _pollinations_client.is_closed:
+        _pollinations_client = httpx.AsyncClient(
+            http2=True,
+            limits=_HTTP_LIMITS,
+            timeout=httpx.Timeout(60.0),
+        )
+    return _pollinations_client
+
+
+async def close_http_clients():
+    """Close the shared HTTP clients (called on application shutdown)."""
+    global _ollama_client, _pollinations_client
+    for client in (_ollama_client, _pollinations_client):
+        if client is not None:
+            await client.aclose()
+    _ollama_client = _pollinations_client = None
 
 
 # ── Ollama (local LLM) ───────────────────────────────────────────
 
-async def check_ollama_available() -> bool:
-    """Check if Ollama is running and accessible."""
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.get(f"{settings.OLLAMA_BASE_URL}/api/tags")
-            return resp.status_code == 200
-    except Exception:
-        return False
+# After a refused connection Ollama is skipped for this long, so machines
+# without a local server don't pay a connect attempt on every request
+OLLAMA_DOWN_TTL = 30.0  # seconds
+_ollama_down_until = 0.0
+
 
+def _mark_ollama_down():
+    global _ollama_down_until
+    _ollama_down_until = time.monotonic() + OLLAMA_DOWN_TTL
 
-async def generate_with_ollama(prompt: str, system_prompt: str = "") -> str:
-    """Generate text using Ollama API."""
+
+def ollama_known_down() -> bool:
+    """True while a recent connection failure says Ollama isn't running."""
+    return time.monotonic() < _ollama_down_until
+
+
+async def _stream_ollama(payload: dict) -> AsyncIterator[str]:
+    """Yield response tokens from Ollama's NDJSON streaming endpoint."""
+    async with _get_ollama_client().stream("POST", "/api/generate", json=payload) as resp:
+        if resp.status_code != 200:
+            await resp.aread()
+            logger.error(f"Ollama error: {resp.status_code} - {resp.text}")
+            return
+        async for line in resp.aiter_lines():
+            if not line:
+                continue
+            data = json.loads(line)
+            yield data.get("response", "")
+            if data.get("done"):
+                return
+
+
+async def generate_with_ollama(
+    prompt: str, system_prompt: str = "", keep_lines: bool = False,
+    stop_when: Optional[StopCondition] = None,
+) -> str:
+    """Generate text using Ollama API (streamed when *stop_when* may end it early)."""
+    if ollama_known_down():
+        return ""
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            payload = {
-                "model": settings.OLLAMA_MODEL,
-                "prompt": prompt,
-                "system": system_prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.4,
-                    "top_p": 0.85,
-                    "num_predict": 1024,
-                }
+        payload = {
+            "model": settings.OLLAMA_MODEL,
+            "prompt": prompt,
+            "system": system_prompt,
+            "stream": stop_when is not None,
+            "options": {
+                "temperature": 0.4,
+                "top_p": 0.85,
+                "num_predict": 1024,
             }
-            resp = await client.post(
-                f"{settings.OLLAMA_BASE_URL}/api/generate",
-                json=payload
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                return _clean_llm_output(data.get("response", ""))
-            else:
-                logger.error(f"Ollama error: {resp.status_code} - {resp.text}")
-                return ""
+        }
+        if stop_when is not None:
+            text = await _collect_stream(_stream_ollama(payload), stop_when)
+            return _clean(text, keep_lines)
+
+        resp = await _get_ollama_client().post("/api/generate", json=payload)
+        if resp.status_code == 200:
+            data = resp.json()
+            return _clean(data.get("response", ""), keep_lines)
+        else:
+            logger.error(f"Ollama error: {resp.status_code} - {resp.text}")
+            return ""
+    except httpx.ConnectError:
+        logger.info(f"Ollama not reachable, skipping it for {OLLAMA_DOWN_TTL:.0f}s")
+        _mark_ollama_down()
+        return ""
     except Exception as e:
         logger.error(f"Ollama connection error: {e}")
         return ""
@@ -113,170 +187,264 @@ async def generate_with_ollama(prompt: str, system_prompt: str = "") -> str:
 POLLINATIONS_TEXT_URL = "https://text.pollinations.ai/"
 
 
-async def generate_with_pollinations(prompt: str, system_prompt: str = "") -> str:
+async def _stream_pollinations(payload: dict) -> AsyncIterator[str]:
+    """Yield text from Pollinations' streamed reply (OpenAI-style SSE, or raw text chunks)."""
+    async with _get_pollinations_client().stream(
+        "POST",
+        POLLINATIONS_TEXT_URL,
+        json={**payload, "stream": True},
+        headers={"Content-Type": "application/json"},
+    ) as resp:
+        if resp.status_code != 200:
+            await resp.aread()
+            logger.error(f"Pollinations text error: {resp.status_code} - {resp.text[:200]}")
+            return
+        if "text/event-stream" not in resp.headers.get("content-type", ""):
+            async for chunk in resp.aiter_text():
+                yield chunk
+            return
+        async for line in resp.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                return
+            try:
+                content = json.loads(data)["choices"][0]["delta"].get("content")
+            except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+                continue
+            if content:
+                yield content
+
+
+async def generate_with_pollinations(
+    prompt: str, system_prompt: str = "", keep_lines: bool = False,
+    stop_when: Optional[StopCondition] = None,
+) -> str:
     """Generate text using Pollinations.ai free text API (OpenAI-compatible)."""
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            payload = {
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt},
-                ],
-                "model": "openai",
-                "seed": 42,
-                "jsonMode": False,
-            }
-            resp = await client.post(
-                POLLINATIONS_TEXT_URL,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-            )
-            if resp.status_code == 200:
-                text = resp.text.strip()
-                # Pollinations returns raw text (not JSON-wrapped)
-                return _clean_llm_output(text)
-            else:
-                logger.error(f"Pollinations text error: {resp.status_code} - {resp.text[:200]}")
-                return ""
+        payload = {
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            "model": "openai",
+            "seed": 42,
+            "jsonMode": False,
+        }
+        if stop_when is not None:
+            text = await _collect_stream(_stream_pollinations(payload), stop_when)
+            return _clean(text.strip(), keep_lines)
+
+        resp = await _get_pollinations_client().post(
+            POLLINATIONS_TEXT_URL,
+            json=payload,
+            headers={"Content-Type": "application/json"},
+        )
+        if resp.status_code == 200:
+            text = resp.text.strip()
+            # Pollinations returns raw text (not JSON-wrapped)
+            return _clean(text, keep_lines)
+        else:
+            logger.error(f"Pollinations text error: {resp.status_code} - {resp.text[:200]}")
+            return ""
     except Exception as e:
         logger.error(f"Pollinations text connection error: {e}")
         return ""
 
 
+async def generate_with_fastest_backend(
+    prompt: str, system_prompt: str = "", min_length: int = 1, keep_lines: bool = False,
+    stop_when: Optional[StopCondition] = None,
+) -> str:
+    """
+    Query Ollama and Pollinations.ai concurrently and return the first
+    response of at least *min_length* characters (the other call is cancelled).
+    With *stop_when*, both replies are streamed and cut off once it is met.
+    """
+    if ollama_known_down():
+        result = await generate_with_pollinations(prompt, system_prompt, keep_lines, stop_when)
+        return result if len(result) >= min_length else ""
+
+    tasks = [
+        asyncio.ensure_future(generate_with_ollama(prompt, system_prompt, keep_lines, stop_when)),
+        asyncio.ensure_future(generate_with_pollinations(prompt, system_prompt, keep_lines, stop_when)),
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if result and len(result) >= min_length:
+                return result
+        return ""
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 # ── Hardcoded fallback (last resort) ─────────────────────────────
 
+# Simple educational content templates
+_FALLBACK_TOPICS = {
+    "photosynthesis": (
+        "Photosynthesis is the process by which plants make their own food. "
+        "Plants use sunlight, water, and carbon dioxide to create glucose and oxygen. "
+        "This happens mainly in the leaves, where chlorophyll captures sunlight. "
+        "The chemical equation is: 6CO2 + 6H2O + light energy → C6H12O6 + 6O2. "
+        "Without photosynthesis, life on Earth would not be possible. "
+        "It provides food for plants and oxygen for all living beings."
+    ),
+    "gravity": (
+        "Gravity is a fundamental force that attracts objects with mass toward each other. "
+        "Sir Isaac Newton discovered gravity when he saw an apple fall from a tree. "
+        "The Earth's gravity pulls everything toward its center. "
+        "Gravity keeps the Moon orbiting Earth and Earth orbiting the Sun. "
+        "The gravitational force depends on mass and distance between objects. "
+        "On the Moon, you would weigh only one-sixth of your Earth weight."
+    ),
+    "water cycle": (
+        "The water cycle describes how water moves continuously on Earth. "
+        "It has four main stages: evaporation, condensation, precipitation, and collection. "
+        "The Sun heats water in oceans and rivers, turning it into water vapor. "
+        "Water vapor rises and cools, forming clouds through condensation. "
+        "When clouds get heavy enough, water falls as rain or snow. "
+        "This water collects in rivers, lakes, and oceans, starting the cycle again."
+    ),
+    "cell": (
+        "A cell is the basic unit of life in all living organisms. "
+        "There are two main types: plant cells and animal cells. "
+        "Every cell has a cell membrane that controls what enters and leaves. "
+        "The nucleus is the control center, containing DNA with genetic instructions. "
+        "Mitochondria are the powerhouses that produce energy for the cell. "
+        "Humans have about 37 trillion cells working together in their body."
+    ),
+    "cat": (
+        "Cats are one of the most popular pets in the world. "
+        "They are carnivorous mammals that belong to the family Felidae. "
+        "Cats have excellent night vision and can see six times better than humans in the dark. "
+        "They have retractable claws, sharp teeth, and powerful muscles for hunting. "
+        "A cat's whiskers help it sense its surroundings and judge tight spaces. "
+        "Domestic cats can sleep up to 16 hours a day and purr when they are content."
+    ),
+    "dog": (
+        "Dogs are known as man's best friend and are the most loyal pets. "
+        "They are descendants of wolves and were the first animals domesticated by humans. "
+        "Dogs have an incredible sense of smell, about 40 times better than ours. "
+        "There are over 340 different dog breeds, from tiny Chihuahuas to giant Great Danes. "
+        "Dogs communicate through barking, body language, and tail wagging. "
+        "They are used as guide dogs, police dogs, and therapy animals because of their intelligence."
+    ),
+    "solar system": (
+        "Our solar system consists of the Sun and everything that orbits around it. "
+        "There are eight planets: Mercury, Venus, Earth, Mars, Jupiter, Saturn, Uranus, and Neptune. "
+        "The Sun is a massive star that contains 99.8 percent of the solar system's total mass. "
+        "Jupiter is the largest planet, so big that all other planets could fit inside it. "
+        "Earth is the only planet known to support life because of liquid water and atmosphere. "
+        "The solar system is about 4.6 billion years old and is located in the Milky Way galaxy."
+    ),
+    "atom": (
+        "An atom is the smallest unit of matter that retains the properties of an element. "
+        "Every atom has three main parts: protons, neutrons, and electrons. "
+        "Protons carry a positive charge and neutrons have no charge, both sit in the nucleus. "
+        "Electrons are tiny negative particles that orbit the nucleus in energy levels. "
+        "Atoms are incredibly small — about 10 million atoms could fit across a single millimeter. "
+        "Different elements have different numbers of protons, which gives them unique properties."
+    ),
+    "volcano": (
+        "A volcano is an opening in the Earth's surface where magma escapes from below. "
+        "When magma reaches the surface, it is called lava and can reach temperatures over 1000 degrees. "
+        "There are three main types: shield volcanoes, cinder cones, and stratovolcanoes. "
+        "The Ring of Fire in the Pacific Ocean contains about 75 percent of the world's active volcanoes. "
+        "Volcanic eruptions can create new islands, fertile soil, and even affect global climate. "
+        "Famous volcanoes include Mount Vesuvius, Mount Fuji, and Mount Etna."
+    ),
+    "moon": (
+        "The Moon is Earth's only natural satellite and our closest neighbor in space. "
+        "It is about 384,400 kilometers away from Earth and takes 27.3 days to orbit us. "
+        "The Moon has no atmosphere, no weather, and no liquid water on its surface. "
+        "We always see the same side of the Moon because it rotates at the same speed as it orbits. "
+        "The Moon's gravity causes ocean tides on Earth, creating high and low tides daily. "
+        "In 1969, Neil Armstrong became the first human to walk on the Moon during Apollo 11."
+    ),
+    "electricity": (
+        "Electricity is the flow of tiny particles called electrons through a conductor. "
+        "It is a form of energy that powers everything from light bulbs to smartphones. "
+        "There are two types of electricity: static electricity and current electricity. "
+        "Current electricity flows through circuits made of conductors like copper wire. "
+        "Voltage pushes electrons, current measures their flow, and resistance slows them down. "
+        "Electricity can be generated from solar panels, wind turbines, and hydroelectric dams."
+    ),
+    "dinosaur": (
+        "Dinosaurs were incredible reptiles that ruled the Earth for over 160 million years. "
+        "They first appeared about 230 million years ago during the Triassic period. "
+        "The largest dinosaur, Argentinosaurus, was over 30 meters long and weighed 70 tons. "
+        "The fearsome Tyrannosaurus Rex had teeth as long as bananas and a massive bite force. "
+        "Dinosaurs went extinct about 66 million years ago when a huge asteroid hit Earth. "
+        "Birds are actually living dinosaurs, as they evolved from small feathered dinosaurs."
+    ),
+    "ocean": (
+        "Oceans cover about 71 percent of Earth's surface and contain 97 percent of all water. "
+        "There are five major oceans: Pacific, Atlantic, Indian, Southern, and Arctic. "
+        "The Pacific Ocean is the largest and deepest, covering more area than all land combined. "
+        "The deepest point is the Mariana Trench at nearly 11,000 meters below sea level. "
+        "Oceans are home to millions of species, from tiny plankton to the massive blue whale. "
+        "They regulate our climate, produce over half the world's oxygen, and absorb carbon dioxide."
+    ),
+    "dna": (
+        "DNA stands for deoxyribonucleic acid, and it contains the instructions for life. "
+        "It has a famous double helix shape, like a twisted ladder, discovered by Watson and Crick. "
+        "DNA is made of four chemical bases: Adenine, Thymine, Guanine, and Cytosine. "
+        "The human genome contains about 3 billion base pairs and around 20,000 genes. "
+        "Every cell in your body contains the same DNA, yet cells become different types. "
+        "DNA is passed from parents to children, which is why family members look alike."
+    ),
+    "computer": (
+        "A computer is an electronic device that processes information at incredible speeds. "
+        "Modern computers have four main parts: input, processing, memory, and output. "
+        "The CPU is the brain of the computer, performing billions of calculations per second. "
+        "Computers understand only binary code, which uses just two digits: zero and one. "
+        "RAM is temporary fast memory, while hard drives store data permanently. "
+        "From smartphones to supercomputers, these machines have transformed how we live and learn."
+    ),
+}
+
+
+def _build_topic_automaton():
+    """Build an Aho-Corasick automaton over the fallback topic keys, if available."""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    automaton = ahocorasick.Automaton()
+    for order, topic in enumerate(_FALLBACK_TOPICS):
+        automaton.add_word(topic, order)
+    automaton.make_automaton()
+    return automaton
+
+
+_TOPIC_KEYS = list(_FALLBACK_TOPICS)
+_TOPIC_AUTOMATON = _build_topic_automaton()
+
+
+def _match_fallback_topic(question_lower: str) -> Optional[str]:
+    """Return the template of the first topic (in dict order) contained in the question."""
+    if _TOPIC_AUTOMATON is None:
+        for topic, content in _FALLBACK_TOPICS.items():
+            if topic in question_lower:
+                return content
+        return None
+    # One pass over the question; keep dict-order priority among all hits
+    best = min((order for _, order in _TOPIC_AUTOMATON.iter(question_lower)), default=None)
+    return None if best is None else _FALLBACK_TOPICS[_TOPIC_KEYS[best]]
+
+
 def fallback_generate_script(question: str) -> str:
     """Generate a simple educational script without any LLM (last resort)."""
     question_lower = question.lower().strip().rstrip("?")
 
-    # Simple educational content templates
-    topics = {
-        "photosynthesis": (
-            "Photosynthesis is the process by which plants make their own food. "
-            "Plants use sunlight, water, and carbon dioxide to create glucose and oxygen. "
-            "This happens mainly in the leaves, where chlorophyll captures sunlight. "
-            "The chemical equation is: 6CO2 + 6H2O + light energy → C6H12O6 + 6O2. "
-            "Without photosynthesis, life on Earth would not be possible. "
-            "It provides food for plants and oxygen for all living beings."
-        ),
-        "gravity": (
-            "Gravity is a fundamental force that attracts objects with mass toward each other. "
-            "Sir Isaac Newton discovered gravity when he saw an apple fall from a tree. "
-            "The Earth's gravity pulls everything toward its center. "
-            "Gravity keeps the Moon orbiting Earth and Earth orbiting the Sun. "
-            "The gravitational force depends on mass and distance between objects. "
-            "On the Moon, you would weigh only one-sixth of your Earth weight."
-        ),
-        "water cycle": (
-            "The water cycle describes how water moves continuously on Earth. "
-            "It has four main stages: evaporation, condensation, precipitation, and collection. "
-            "The Sun heats water in oceans and rivers, turning it into water vapor. "
-            "Water vapor rises and cools, forming clouds through condensation. "
-            "When clouds get heavy enough, water falls as rain or snow. "
-            "This water collects in rivers, lakes, and oceans, starting the cycle again."
-        ),
-        "cell": (
-            "A cell is the basic unit of life in all living organisms. "
-            "There are two main types: plant cells and animal cells. "
-            "Every cell has a cell membrane that controls what enters and leaves. "
-            "The nucleus is the control center, containing DNA with genetic instructions. "
-            "Mitochondria are the powerhouses that produce energy for the cell. "
-            "Humans have about 37 trillion cells working together in their body."
-        ),
-        "cat": (
-            "Cats are one of the most popular pets in the world. "
-            "They are carnivorous mammals that belong to the family Felidae. "
-            "Cats have excellent night vision and can see six times better than humans in the dark. "
-            "They have retractable claws, sharp teeth, and powerful muscles for hunting. "
-            "A cat's whiskers help it sense its surroundings and judge tight spaces. "
-            "Domestic cats can sleep up to 16 hours a day and purr when they are content."
-        ),
-        "dog": (
-            "Dogs are known as man's best friend and are the most loyal pets. "
-            "They are descendants of wolves and were the first animals domesticated by humans. "
-            "Dogs have an incredible sense of smell, about 40 times better than ours. "
-            "There are over 340 different dog breeds, from tiny Chihuahuas to giant Great Danes. "
-            "Dogs communicate through barking, body language, and tail wagging. "
-            "They are used as guide dogs, police dogs, and therapy animals because of their intelligence."
-        ),
-        "solar system": (
-            "Our solar system consists of the Sun and everything that orbits around it. "
-            "There are eight planets: Mercury, Venus, Earth, Mars, Jupiter, Saturn, Uranus, and Neptune. "
-            "The Sun is a massive star that contains 99.8 percent of the solar system's total mass. "
-            "Jupiter is the largest planet, so big that all other planets could fit inside it. "
-            "Earth is the only planet known to support life because of liquid water and atmosphere. "
-            "The solar system is about 4.6 billion years old and is located in the Milky Way galaxy."
-        ),
-        "atom": (
-            "An atom is the smallest unit of matter that retains the properties of an element. "
-            "Every atom has three main parts: protons, neutrons, and electrons. "
-            "Protons carry a positive charge and neutrons have no charge, both sit in the nucleus. "
-            "Electrons are tiny negative particles that orbit the nucleus in energy levels. "
-            "Atoms are incredibly small — about 10 million atoms could fit across a single millimeter. "
-            "Different elements have different numbers of protons, which gives them unique properties."
-        ),
-        "volcano": (
-            "A volcano is an opening in the Earth's surface where magma escapes from below. "
-            "When magma reaches the surface, it is called lava and can reach temperatures over 1000 degrees. "
-            "There are three main types: shield volcanoes, cinder cones, and stratovolcanoes. "
-            "The Ring of Fire in the Pacific Ocean contains about 75 percent of the world's active volcanoes. "
-            "Volcanic eruptions can create new islands, fertile soil, and even affect global climate. "
-            "Famous volcanoes include Mount Vesuvius, Mount Fuji, and Mount Etna."
-        ),
-        "moon": (
-            "The Moon is Earth's only natural satellite and our closest neighbor in space. "
-            "It is about 384,400 kilometers away from Earth and takes 27.3 days to orbit us. "
-            "The Moon has no atmosphere, no weather, and no liquid water on its surface. "
-            "We always see the same side of the Moon because it rotates at the same speed as it orbits. "
-            "The Moon's gravity causes ocean tides on Earth, creating high and low tides daily. "
-            "In 1969, Neil Armstrong became the first human to walk on the Moon during Apollo 11."
-        ),
-        "electricity": (
-            "Electricity is the flow of tiny particles called electrons through a conductor. "
-            "It is a form of energy that powers everything from light bulbs to smartphones. "
-            "There are two types of electricity: static electricity and current electricity. "
-            "Current electricity flows through circuits made of conductors like copper wire. "
-            "Voltage pushes electrons, current measures their flow, and resistance slows them down. "
-            "Electricity can be generated from solar panels, wind turbines, and hydroelectric dams."
-        ),
-        "dinosaur": (
-            "Dinosaurs were incredible reptiles that ruled the Earth for over 160 million years. "
-            "They first appeared about 230 million years ago during the Triassic period. "
-            "The largest dinosaur, Argentinosaurus, was over 30 meters long and weighed 70 tons. "
-            "The fearsome Tyrannosaurus Rex had teeth as long as bananas and a massive bite force. "
-            "Dinosaurs went extinct about 66 million years ago when a huge asteroid hit Earth. "
-            "Birds are actually living dinosaurs, as they evolved from small feathered dinosaurs."
-        ),
-        "ocean": (
-            "Oceans cover about 71 percent of Earth's surface and contain 97 percent of all water. "
-            "There are five major oceans: Pacific, Atlantic, Indian, Southern, and Arctic. "
-            "The Pacific Ocean is the largest and deepest, covering more area than all land combined. "
-            "The deepest point is the Mariana Trench at nearly 11,000 meters below sea level. "
-            "Oceans are home to millions of species, from tiny plankton to the massive blue whale. "
-            "They regulate our climate, produce over half the world's oxygen, and absorb carbon dioxide."
-        ),
-        "dna": (
-            "DNA stands for deoxyribonucleic acid, and it contains the instructions for life. "
-            "It has a famous double helix shape, like a twisted ladder, discovered by Watson and Crick. "
-            "DNA is made of four chemical bases: Adenine, Thymine, Guanine, and Cytosine. "
-            "The human genome contains about 3 billion base pairs and around 20,000 genes. "
-            "Every cell in your body contains the same DNA, yet cells become different types. "
-            "DNA is passed from parents to children, which is why family members look alike."
-        ),
-        "computer": (
-            "A computer is an electronic device that processes information at incredible speeds. "
-            "Modern computers have four main parts: input, processing, memory, and output. "
-            "The CPU is the brain of the computer, performing billions of calculations per second. "
-            "Computers understand only binary code, which uses just two digits: zero and one. "
-            "RAM is temporary fast memory, while hard drives store data permanently. "
-            "From smartphones to supercomputers, these machines have transformed how we live and learn."
-        ),
-    }
-
     # Check for matching topic
-    for topic, content in topics.items():
-        if topic in question_lower:
-            return content
+    content = _match_fallback_topic(question_lower)
+    if content is not None:
+        return content
 
     # Generic response — try harder to give useful content based on keywords
     q_clean = question_lower.replace("what is", "").replace("what are", "").replace("how does", "").replace("how do", "").replace("why is", "").replace("why do", "").replace("explain", "").replace("describe", "").replace("tell me about", "").strip()
@@ -299,12 +467,11 @@ async def generate_video_script(question: str) -> str:
     """
     prompt = SCRIPT_USER_PROMPT_TEMPLATE.format(question=question)
 
-    # 1. Try Ollama (local LLM)
-    if await check_ollama_available():
-        script = await generate_with_ollama(prompt, SCRIPT_SYSTEM_PROMPT)
-        if script and len(script) > 50:
-            logger.info("Script generated via Ollama")
-            return script
+    # 1. Try Ollama (local LLM); a refused connection fails fast and returns ""
+    script = await generate_with_ollama(prompt, SCRIPT_SYSTEM_PROMPT)
+    if script and len(script) > 50:
+        logger.info("Script generated via Ollama")
+        return script
 
     # 2. Try Pollinations.ai (free online LLM, no API key)
     logger.info("Ollama unavailable, trying Pollinations.ai text API...")
@@ -330,9 +497,7 @@ async def extract_questions_from_text(text: str, num_questions: int = 5) -> List
     prompt = f"Extract {num_questions} important educational questions from this text:\n\n{text[:2000]}"
 
     # Try Ollama first, then Pollinations
-    result = ""
-    if await check_ollama_available():
-        result = await generate_with_ollama(prompt, system_prompt)
+    result = await generate_with_ollama(prompt, system_prompt)
 
     if not result:
         logger.info("Trying Pollinations.ai for question extraction...")
@@ -357,9 +522,8 @@ async def extract_questions_from_text(text: str, num_questions: int = 5) -> List
 
     # Fallback: generate generic questions from text
     logger.info("Using fallback question extraction")
-    words = text.split()
     sentences = text.replace("!", ".").replace("?", ".").split(".")
-    sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
+    sentences = [s for s in map(str.strip, sentences) if len(s) > 20]
 
     questions = []
     if sentences:
@@ -5,643 +5,672 @@ Uses MobileNet (1000+ ImageNet classes) for accurate identification
 and provides educational features about detected objects.
 """
 
+import asyncio
+import bisect
+import itertools
 import logging
 import random
-from typing import Dict, List, Optional
+import sqlite3
+import time
+from collections import Counter, OrderedDict
+from contextlib import closing
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
-from app.services.llm_service import (
-    generate_with_pollinations,
-    generate_with_ollama,
-    check_ollama_available,
-    _clean_llm_output,
-)
+import orjson
+
+from app.config import settings
+from app.services._parse import parse_batch_features, parse_features
+
+try:
+    import ahocorasick
+except ImportError:  # optional C accelerator; plain substring scans otherwise
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
 # ── Pre-built feature cards (covers MobileNet ImageNet class names) ──────
 
-OBJECT_FEATURES: Dict[str, dict] = {
+@dataclass(frozen=True, slots=True)
+class Feature:
+    title: str
+    detail: str
+
+
+@dataclass(frozen=True, slots=True)
+class ObjectCard:
+    name: str
+    category: str
+    features: Tuple[Feature, ...]
+
+
+OBJECT_FEATURES: Mapping[str, ObjectCard] = {
     # ── Technology ─────────────────────────────────────────
-    "laptop": {
-        "name": "Laptop Computer",
-        "category": "Technology",
-        "features": [
-            {"title": "Processor", "detail": "The CPU performs billions of calculations per second. Modern chips have transistors just 3-5 nanometers wide — smaller than a virus!"},
-            {"title": "Storage", "detail": "SSDs store data using electrical charges in tiny cells. A 512GB SSD can hold about 100,000 photos or 250 movies."},
-            {"title": "Screen", "detail": "LCD/OLED screens use millions of tiny pixels. Each pixel has Red, Green, and Blue sub-pixels that mix to create any color."},
-            {"title": "Battery", "detail": "Lithium-ion batteries store energy via chemical reactions. They contain lithium, cobalt, and graphite."},
-            {"title": "Fun Fact", "detail": "Your laptop has more computing power than all of NASA had during the 1969 Moon landing combined!"},
-        ],
-    },
-    "notebook": {
-        "name": "Laptop / Notebook",
-        "category": "Technology",
-        "features": [
-            {"title": "Processor", "detail": "Modern laptop CPUs have billions of transistors on a chip the size of your fingernail. They process data at GHz speeds."},
-            {"title": "Memory", "detail": "RAM (Random Access Memory) temporarily stores data being used. 8-16GB is common — it forgets everything when power is off."},
-            {"title": "Connectivity", "detail": "WiFi uses radio waves at 2.4GHz or 5GHz. Bluetooth operates at 2.4GHz for short-range device communication."},
-            {"title": "Fun Fact", "detail": "The first laptop (Osborne 1, 1981) weighed 10.7 kg and had a 5-inch screen. Today's laptops are 100x more powerful and 10x lighter!"},
-        ],
-    },
-    "cell phone": {
-        "name": "Smartphone",
-        "category": "Technology",
-        "features": [
-            {"title": "Sensors", "detail": "Your phone has 10+ sensors: accelerometer, gyroscope, GPS, proximity, ambient light, barometer, magnetometer, and more."},
-            {"title": "Camera", "detail": "Phone cameras use CMOS sensors with millions of tiny light-detecting pixels. Computational photography uses AI to enhance images."},
-            {"title": "Connectivity", "detail": "Uses radio waves: 4G/5G for internet, Bluetooth for short range, WiFi for local networks, NFC for tap-to-pay."},
-            {"title": "Screen", "detail": "OLED screens have pixels that emit their own light. Each pixel can turn completely off, creating true black and saving battery."},
-            {"title": "Fun Fact", "detail": "The average smartphone has 100,000x more processing power than the computer that guided Apollo 11 to the Moon."},
-        ],
-    },
-    "cellular telephone": {
-        "name": "Mobile Phone",
-        "category": "Technology",
-        "features": [
-            {"title": "Sensors", "detail": "Phones contain accelerometers, gyroscopes, GPS, proximity sensors, and more — over 10 different sensors!"},
-            {"title": "Camera", "detail": "Modern phone cameras use CMOS sensors with millions of light-detecting pixels and AI computational photography."},
-            {"title": "Radio", "detail": "Phones communicate via radio waves: cellular (4G/5G), WiFi, Bluetooth, and NFC for contactless payments."},
-            {"title": "Fun Fact", "detail": "Your phone is millions of times more powerful than the computers used for the Apollo 11 moon landing!"},
-        ],
-    },
-    "monitor": {
-        "name": "Computer Monitor",
-        "category": "Display Technology",
-        "features": [
-            {"title": "Pixels", "detail": "A 4K monitor has 8.3 million pixels (3840x2160). Each pixel has RGB sub-pixels — about 25 million light sources total!"},
-            {"title": "Panel Types", "detail": "IPS panels offer wide viewing angles, VA panels have deep blacks, and TN panels have fastest response times for gaming."},
-            {"title": "Refresh Rate", "detail": "60Hz refreshes 60 times/second. 144Hz and 240Hz are smoother for fast motion. Your eye can perceive differences up to ~240Hz."},
-            {"title": "Fun Fact", "detail": "The first computer monitors were oscilloscopes in the 1950s displaying simple dots and lines — no color, no graphics!"},
-        ],
-    },
-    "screen": {
-        "name": "Display Screen",
-        "category": "Display Technology",
-        "features": [
-            {"title": "Technology", "detail": "LCD screens use liquid crystals that twist to block or pass light. OLED pixels emit their own light — no backlight needed."},
-            {"title": "Resolution", "detail": "HD = 1920x1080 (2M pixels), 4K = 3840x2160 (8.3M pixels), 8K = 7680x4320 (33.2M pixels)."},
-            {"title": "Blue Light", "detail": "Screens emit blue light (400-490nm) that can affect sleep by suppressing melatonin. Night mode shifts colors warmer."},
-            {"title": "Fun Fact", "detail": "If you could see individual pixels on a 4K screen, each one would be about 0.07mm — thinner than a human hair!"},
-        ],
-    },
-    "desktop computer": {
-        "name": "Desktop Computer",
-        "category": "Technology",
-        "features": [
-            {"title": "CPU", "detail": "The processor is the brain — modern ones have billions of transistors and can execute billions of instructions per second."},
-            {"title": "GPU", "detail": "Graphics cards render images using thousands of small cores in parallel. A modern GPU can have over 10,000 processing cores!"},
-            {"title": "Cooling", "detail": "CPUs generate 65-125W of heat. Fans, heatsinks, and liquid cooling prevent overheating. Without cooling, chips would melt in seconds."},
-            {"title": "Fun Fact", "detail": "The first general-purpose computer (ENIAC, 1945) weighed 30 tons and filled an entire room. Your phone is millions of times faster."},
-        ],
-    },
-    "keyboard": {
-        "name": "Keyboard",
-        "category": "Input Device",
-        "features": [
-            {"title": "Layout", "detail": "QWERTY layout was designed in 1873 by Christopher Sholes to prevent typewriter key jams by separating common letter pairs."},
-            {"title": "Mechanism", "detail": "Each key press completes an electrical circuit, sending a unique scan code to the computer. Mechanical keyboards use individual switches."},
-            {"title": "Types", "detail": "Membrane keyboards use pressure pads, mechanical use switches, laptop keyboards use scissor mechanisms for thin profiles."},
-            {"title": "Fun Fact", "detail": "A keyboard can harbor 400x more bacteria than a toilet seat! The spacebar is the most-pressed key."},
-        ],
-    },
-    "space bar": {
-        "name": "Keyboard / Space Bar",
-        "category": "Input Device",
-        "features": [
-            {"title": "Layout", "detail": "QWERTY layout was designed in 1873 to prevent typewriter key jams by separating commonly used letter pairs."},
-            {"title": "The Space Bar", "detail": "It's the largest key and the most frequently pressed. Typists hit it about 18% of all keystrokes — once every 5-6 characters."},
-            {"title": "Mechanism", "detail": "Each key press completes a circuit sending a scan code. Mechanical keyboards use spring-loaded switches for tactile feedback."},
-            {"title": "Fun Fact", "detail": "Keyboards can harbor 400x more bacteria than a toilet seat! The average typist's fingers travel about 20 km per day."},
-        ],
-    },
-    "mouse": {
-        "name": "Computer Mouse",
-        "category": "Input Device",
-        "features": [
-            {"title": "Inventor", "detail": "Invented by Douglas Engelbart in 1964. It was made of wood and had only one button!"},
-            {"title": "How It Works", "detail": "Optical mice use an LED and camera sensor to track movement 1000+ times per second by comparing tiny surface images."},
-            {"title": "Laser vs Optical", "detail": "Laser mice work on more surfaces (even glass) because laser light penetrates surfaces deeper than LED light."},
-            {"title": "Fun Fact", "detail": "The average person moves their mouse about 1.5 km (0.93 miles) per day during computer use!"},
-        ],
-    },
-    "iPod": {
-        "name": "Portable Media Player",
-        "category": "Technology",
-        "features": [
-            {"title": "Storage", "detail": "Early iPods used tiny 1.8-inch hard drives. Later models used flash memory — no moving parts, more durable, less power."},
-            {"title": "Audio", "detail": "Digital audio files (MP3/AAC) compress sound by removing frequencies humans can't easily hear, reducing file size by 90%."},
-            {"title": "History", "detail": "The iPod (2001) revolutionized music. Before digital players, people used Walkmans with cassette tapes or portable CD players."},
-            {"title": "Fun Fact", "detail": "The first iPod could hold 1,000 songs. Today a phone can hold 100,000+ songs — and do a million other things!"},
-        ],
-    },
+    "laptop": ObjectCard(
+        name="Laptop Computer",
+        category="Technology",
+        features=(
+            Feature("Processor", "The CPU performs billions of calculations per second. Modern chips have transistors just 3-5 nanometers wide — smaller than a virus!"),
+            Feature("Storage", "SSDs store data using electrical charges in tiny cells. A 512GB SSD can hold about 100,000 photos or 250 movies."),
+            Feature("Screen", "LCD/OLED screens use millions of tiny pixels. Each pixel has Red, Green, and Blue sub-pixels that mix to create any color."),
+            Feature("Battery", "Lithium-ion batteries store energy via chemical reactions. They contain lithium, cobalt, and graphite."),
+            Feature("Fun Fact", "Your laptop has more computing power than all of NASA had during the 1969 Moon landing combined!"),
+        ),
+    ),
+    "notebook": ObjectCard(
+        name="Laptop / Notebook",
+        category="Technology",
+        features=(
+            Feature("Processor", "Modern laptop CPUs have billions of transistors on a chip the size of your fingernail. They process data at GHz speeds."),
+            Feature("Memory", "RAM (Random Access Memory) temporarily stores data being used. 8-16GB is common — it forgets everything when power is off."),
+            Feature("Connectivity", "WiFi uses radio waves at 2.4GHz or 5GHz. Bluetooth operates at 2.4GHz for short-range device communication."),
+            Feature("Fun Fact", "The first laptop (Osborne 1, 1981) weighed 10.7 kg and had a 5-inch screen. Today's laptops are 100x more powerful and 10x lighter!"),
+        ),
+    ),
+    "cell phone": ObjectCard(
+        name="Smartphone",
+        category="Technology",
+        features=(
+            Feature("Sensors", "Your phone has 10+ sensors: accelerometer, gyroscope, GPS, proximity, ambient light, barometer, magnetometer, and more."),
+            Feature("Camera", "Phone cameras use CMOS sensors with millions of tiny light-detecting pixels. Computational photography uses AI to enhance images."),
+            Feature("Connectivity", "Uses radio waves: 4G/5G for internet, Bluetooth for short range, WiFi for local networks, NFC for tap-to-pay."),
+            Feature("Screen", "OLED screens have pixels that emit their own light. Each pixel can turn completely off, creating true black and saving battery."),
+            Feature("Fun Fact", "The average smartphone has 100,000x more processing power than the computer that guided Apollo 11 to the Moon."),
+        ),
+    ),
+    "cellular telephone": ObjectCard(
+        name="Mobile Phone",
+        category="Technology",
+        features=(
+            Feature("Sensors", "Phones contain accelerometers, gyroscopes, GPS, proximity sensors, and more — over 10 different sensors!"),
+            Feature("Camera", "Modern phone cameras use CMOS sensors with millions of light-detecting pixels and AI computational photography."),
+            Feature("Radio", "Phones communicate via radio waves: cellular (4G/5G), WiFi, Bluetooth, and NFC for contactless payments."),
+            Feature("Fun Fact", "Your phone is millions of times more powerful than the computers used for the Apollo 11 moon landing!"),
+        ),
+    ),
+    "monitor": ObjectCard(
+        name="Computer Monitor",
+        category="Display Technology",
+        features=(
+            Feature("Pixels", "A 4K monitor has 8.3 million pixels (3840x2160). Each pixel has RGB sub-pixels — about 25 million light sources total!"),
+            Feature("Panel Types", "IPS panels offer wide viewing angles, VA panels have deep blacks, and TN panels have fastest response times for gaming."),
+            Feature("Refresh Rate", "60Hz refreshes 60 times/second. 144Hz and 240Hz are smoother for fast motion. Your eye can perceive differences up to ~240Hz."),
+            Feature("Fun Fact", "The first computer monitors were oscilloscopes in the 1950s displaying simple dots and lines — no color, no graphics!"),
+        ),
+    ),
+    "screen": ObjectCard(
+        name="Display Screen",
+        category="Display Technology",
+        features=(
+            Feature("Technology", "LCD screens use liquid crystals that twist to block or pass light. OLED pixels emit their own light — no backlight needed."),
+            Feature("Resolution", "HD = 1920x1080 (2M pixels), 4K = 3840x2160 (8.3M pixels), 8K = 7680x4320 (33.2M pixels)."),
+            Feature("Blue Light", "Screens emit blue light (400-490nm) that can affect sleep by suppressing melatonin. Night mode shifts colors warmer."),
+            Feature("Fun Fact", "If you could see individual pixels on a 4K screen, each one would be about 0.07mm — thinner than a human hair!"),
+        ),
+    ),
+    "desktop computer": ObjectCard(
+        name="Desktop Computer",
+        category="Technology",
+        features=(
+            Feature("CPU", "The processor is the brain — modern ones have billions of transistors and can execute billions of instructions per second."),
+            Feature("GPU", "Graphics cards render images using thousands of small cores in parallel. A modern GPU can have over 10,000 processing cores!"),
+            Feature("Cooling", "CPUs generate 65-125W of heat. Fans, heatsinks, and liquid cooling prevent overheating. Without cooling, chips would melt in seconds."),
+            Feature("Fun Fact", "The first general-purpose computer (ENIAC, 1945) weighed 30 tons and filled an entire room. Your phone is millions of times faster."),
+        ),
+    ),
+    "keyboard": ObjectCard(
+        name="Keyboard",
+        category="Input Device",
+        features=(
+            Feature("Layout", "QWERTY layout was designed in 1873 by Christopher Sholes to prevent typewriter key jams by separating common letter pairs."),
+            Feature("Mechanism", "Each key press completes an electrical circuit, sending a unique scan code to the computer. Mechanical keyboards use individual switches."),
+            Feature("Types", "Membrane keyboards use pressure pads, mechanical use switches, laptop keyboards use scissor mechanisms for thin profiles."),
+            Feature("Fun Fact", "A keyboard can harbor 400x more bacteria than a toilet seat! The spacebar is the most-pressed key."),
+        ),
+    ),
+    "space bar": ObjectCard(
+        name="Keyboard / Space Bar",
+        category="Input Device",
+        features=(
+            Feature("Layout", "QWERTY layout was designed in 1873 to prevent typewriter key jams by separating commonly used letter pairs."),
+            Feature("The Space Bar", "It's the largest key and the most frequently pressed. Typists hit it about 18% of all keystrokes — once every 5-6 characters."),
+            Feature("Mechanism", "Each key press completes a circuit sending a scan code. Mechanical keyboards use spring-loaded switches for tactile feedback."),
+            Feature("Fun Fact", "Keyboards can harbor 400x more bacteria than a toilet seat! The average typist's fingers travel about 20 km per day."),
+        ),
+    ),
+    "mouse": ObjectCard(
+        name="Computer Mouse",
+        category="Input Device",
+        features=(
+            Feature("Inventor", "Invented by Douglas Engelbart in 1964. It was made of wood and had only one button!"),
+            Feature("How It Works", "Optical mice use an LED and camera sensor to track movement 1000+ times per second by comparing tiny surface images."),
+            Feature("Laser vs Optical", "Laser mice work on more surfaces (even glass) because laser light penetrates surfaces deeper than LED light."),
+            Feature("Fun Fact", "The average person moves their mouse about 1.5 km (0.93 miles) per day during computer use!"),
+        ),
+    ),
+    "ipod": ObjectCard(
+        name="Portable Media Player",
+        category="Technology",
+        features=(
+            Feature("Storage", "Early iPods used tiny 1.8-inch hard drives. Later models used flash memory — no moving parts, more durable, less power."),
+            Feature("Audio", "Digital audio files (MP3/AAC) compress sound by removing frequencies humans can't easily hear, reducing file size by 90%."),
+            Feature("History", "The iPod (2001) revolutionized music. Before digital players, people used Walkmans with cassette tapes or portable CD players."),
+            Feature("Fun Fact", "The first iPod could hold 1,000 songs. Today a phone can hold 100,000+ songs — and do a million other things!"),
+        ),
+    ),
     # ── Ceiling Fan & Fans ─────────────────────────────────
-    "ceiling fan": {
-        "name": "Ceiling Fan",
-        "category": "Home Appliance",
-        "features": [
-            {"title": "How It Works", "detail": "Blades are angled (pitched) to push air downward. The motor spins at 50-350 RPM. More blade pitch = more air movement."},
-            {"title": "Physics", "detail": "Fans don't actually cool air — they create a wind-chill effect that helps evaporate sweat from your skin, making you feel cooler."},
-            {"title": "Energy", "detail": "A ceiling fan uses only 15-75 watts — about 50x less than an air conditioner! Running one can lower AC costs by 30-40%."},
-            {"title": "Design", "detail": "Most fans have 3-5 blades. Fewer blades = less drag = higher speed. More blades = quieter operation but more motor strain."},
-            {"title": "Fun Fact", "detail": "In winter, reverse the fan direction (clockwise) to push warm air down from the ceiling and distribute heat evenly."},
-        ],
-    },
-    "electric fan": {
-        "name": "Electric Fan",
-        "category": "Home Appliance",
-        "features": [
-            {"title": "Motor", "detail": "Uses an electric motor that converts electrical energy into rotational energy. AC motors use alternating current to spin the rotor."},
-            {"title": "Wind Chill", "detail": "Fans don't lower room temperature — they create airflow that speeds up sweat evaporation, making you feel 3-4°C cooler."},
-            {"title": "Blade Design", "detail": "Blades are angled (pitched) to push air. Greater pitch = more air but more noise. Most fans are optimized at 12-15° pitch."},
-            {"title": "Energy", "detail": "A typical fan uses 50-100 watts — about 30x less energy than an air conditioner running at 1500 watts."},
-            {"title": "Fun Fact", "detail": "The first electric fan was invented in 1882 by Schuyler Wheeler. It had just two blades and no protective cage!"},
-        ],
-    },
+    "ceiling fan": ObjectCard(
+        name="Ceiling Fan",
+        category="Home Appliance",
+        features=(
+            Feature("How It Works", "Blades are angled (pitched) to push air downward. The motor spins at 50-350 RPM. More blade pitch = more air movement."),
+            Feature("Physics", "Fans don't actually cool air — they create a wind-chill effect that helps evaporate sweat from your skin, making you feel cooler."),
+            Feature("Energy", "A ceiling fan uses only 15-75 watts — about 50x less than an air conditioner! Running one can lower AC costs by 30-40%."),
+            Feature("Design", "Most fans have 3-5 blades. Fewer blades = less drag = higher speed. More blades = quieter operation but more motor strain."),
+            Feature("Fun Fact", "In winter, reverse the fan direction (clockwise) to push warm air down from the ceiling and distribute heat evenly."),
+        ),
+    ),
+    "electric fan": ObjectCard(
+        name="Electric Fan",
+        category="Home Appliance",
+        features=(
+            Feature("Motor", "Uses an electric motor that converts electrical energy into rotational energy. AC motors use alternating current to spin the rotor."),
+            Feature("Wind Chill", "Fans don't lower room temperature — they create airflow that speeds up sweat evaporation, making you feel 3-4°C cooler."),
+            Feature("Blade Design", "Blades are angled (pitched) to push air. Greater pitch = more air but more noise. Most fans are optimized at 12-15° pitch."),
+            Feature("Energy", "A typical fan uses 50-100 watts — about 30x less energy than an air conditioner running at 1500 watts."),
+            Feature("Fun Fact", "The first electric fan was invented in 1882 by Schuyler Wheeler. It had just two blades and no protective cage!"),
+        ),
+    ),
     # ── Lighting ───────────────────────────────────────────
-    "table lamp": {
-        "name": "Table Lamp",
-        "category": "Lighting",
-        "features": [
-            {"title": "Bulb Types", "detail": "LED bulbs use 75% less energy than incandescent. A 10W LED = 60W incandescent brightness. LEDs last 25,000+ hours."},
-            {"title": "Light Science", "detail": "Light is electromagnetic radiation visible to humans (380-700nm wavelength). Different wavelengths = different colors."},
-            {"title": "Color Temp", "detail": "Measured in Kelvin: 2700K = warm/yellow (relaxing), 4000K = neutral white, 6500K = daylight/blue (alerting)."},
-            {"title": "Fun Fact", "detail": "Before electric lamps, people used candles, oil lamps, and gas lights. The average candle produces about 13 lumens — an LED bulb produces 800!"},
-        ],
-    },
-    "desk lamp": {
-        "name": "Desk Lamp",
-        "category": "Lighting",
-        "features": [
-            {"title": "LED Technology", "detail": "LEDs produce light by electroluminescence — electrons release photons when passing through a semiconductor. 90% efficient vs 10% for incandescent."},
-            {"title": "Lumens", "detail": "Brightness is measured in lumens, not watts. For reading, 450-800 lumens is ideal. A 60W incandescent = ~800 lumens."},
-            {"title": "Eye Health", "detail": "Good desk lighting reduces eye strain. The 20-20-20 rule: every 20 minutes, look at something 20 feet away for 20 seconds."},
-            {"title": "Fun Fact", "detail": "The Anglepoise lamp (1932) uses springs to mimic human arm joints, allowing it to stay in any position — inspired by spring mechanics!"},
-        ],
-    },
-    "lampshade": {
-        "name": "Lamp / Lampshade",
-        "category": "Lighting",
-        "features": [
-            {"title": "Purpose", "detail": "Lampshades diffuse and redirect light, reducing glare. They soften harsh direct light into ambient, comfortable illumination."},
-            {"title": "Materials", "detail": "Made from fabric, paper, glass, or metal. Each material diffuses light differently — fabric creates warm, soft light."},
-            {"title": "Light Science", "detail": "Light intensity decreases with the square of distance (inverse-square law). Doubling distance = 1/4 the brightness."},
-            {"title": "Fun Fact", "detail": "The first lampshades were made in the 18th century from parchment paper to shield eyes from the flame of oil lamps."},
-        ],
-    },
+    "table lamp": ObjectCard(
+        name="Table Lamp",
+        category="Lighting",
+        features=(
+            Feature("Bulb Types", "LED bulbs use 75% less energy than incandescent. A 10W LED = 60W incandescent brightness. LEDs last 25,000+ hours."),
+            Feature("Light Science", "Light is electromagnetic radiation visible to humans (380-700nm wavelength). Different wavelengths = different colors."),
+            Feature("Color Temp", "Measured in Kelvin: 2700K = warm/yellow (relaxing), 4000K = neutral white, 6500K = daylight/blue (alerting)."),
+            Feature("Fun Fact", "Before electric lamps, people used candles, oil lamps, and gas lights. The average candle produces about 13 lumens — an LED bulb produces 800!"),
+        ),
+    ),
+    "desk lamp": ObjectCard(
+        name="Desk Lamp",
+        category="Lighting",
+        features=(
+            Feature("LED Technology", "LEDs produce light by electroluminescence — electrons release photons when passing through a semiconductor. 90% efficient vs 10% for incandescent."),
+            Feature("Lumens", "Brightness is measured in lumens, not watts. For reading, 450-800 lumens is ideal. A 60W incandescent = ~800 lumens."),
+            Feature("Eye Health", "Good desk lighting reduces eye strain. The 20-20-20 rule: every 20 minutes, look at something 20 feet away for 20 seconds."),
+            Feature("Fun Fact", "The Anglepoise lamp (1932) uses springs to mimic human arm joints, allowing it to stay in any position — inspired by spring mechanics!"),
+        ),
+    ),
+    "lampshade": ObjectCard(
+        name="Lamp / Lampshade",
+        category="Lighting",
+        features=(
+            Feature("Purpose", "Lampshades diffuse and redirect light, reducing glare. They soften harsh direct light into ambient, comfortable illumination."),
+            Feature("Materials", "Made from fabric, paper, glass, or metal. Each material diffuses light differently — fabric creates warm, soft light."),
+            Feature("Light Science", "Light intensity decreases with the square of distance (inverse-square law). Doubling distance = 1/4 the brightness."),
+            Feature("Fun Fact", "The first lampshades were made in the 18th century from parchment paper to shield eyes from the flame of oil lamps."),
+        ),
+    ),
     # ── Containers & Bottles ───────────────────────────────
-    "bottle": {
-        "name": "Water Bottle",
-        "category": "Everyday Object",
-        "features": [
-            {"title": "Material", "detail": "Usually PET plastic (Polyethylene Terephthalate) or glass. PET is recyclable and marked with recycle symbol #1."},
-            {"title": "Capacity", "detail": "Standard bottles hold 500ml (16.9 oz). Your body needs about 2 liters (4 bottles) of water daily."},
-            {"title": "Science", "detail": "Water (H₂O) is the only substance found naturally in all 3 states: solid (ice), liquid (water), and gas (steam)."},
-            {"title": "Physics", "detail": "Water has high surface tension — molecules at the surface stick together, letting you slightly overfill a glass."},
-            {"title": "Fun Fact", "detail": "The water you drink today could be the same water dinosaurs drank! Water is recycled through the water cycle over millions of years."},
-        ],
-    },
-    "water bottle": {
-        "name": "Water Bottle",
-        "category": "Everyday Object",
-        "features": [
-            {"title": "Material", "detail": "Usually PET plastic (Polyethylene Terephthalate) or glass. PET is recyclable and marked with recycle symbol #1."},
-            {"title": "Hydration", "detail": "Your body needs about 2 liters of water daily. Water makes up 60% of your body weight and is essential for every cell."},
-            {"title": "Science", "detail": "Water (H₂O) has unique properties: high specific heat capacity, universal solvent, and exists in all 3 states naturally on Earth."},
-            {"title": "Fun Fact", "detail": "Only 3% of Earth's water is fresh water, and only 1% is easily accessible. The rest is in glaciers or deep underground."},
-        ],
-    },
-    "cup": {
-        "name": "Cup / Mug",
-        "category": "Kitchen Item",
-        "features": [
-            {"title": "Material", "detail": "Ceramic cups are made from clay fired at 1000-1300°C in a kiln. The glazing makes them waterproof and shiny."},
-            {"title": "Design", "detail": "The handle stays cool because ceramic is a poor heat conductor — insulating your hand from the hot liquid."},
-            {"title": "Science", "detail": "Hot drinks cool via convection (hot liquid rises) and evaporation (molecules escape the surface as steam)."},
-            {"title": "Capacity", "detail": "A standard cup holds ~250ml (8 oz). A mug = ~350ml (12 oz). An espresso cup is only 60ml!"},
-            {"title": "Fun Fact", "detail": "The world's oldest cup is over 7,000 years old, found in China. Humans have been drinking from cups since the Stone Age."},
-        ],
-    },
-    "coffee mug": {
-        "name": "Coffee Mug",
-        "category": "Kitchen Item",
-        "features": [
-            {"title": "Material", "detail": "Ceramic mugs are clay fired at 1000-1300°C. Porcelain mugs are fired even hotter (1200-1400°C) making them stronger."},
-            {"title": "Heat Transfer", "detail": "Ceramic is a poor heat conductor (insulator), so the handle stays cool while the mug body holds hot liquid."},
-            {"title": "Coffee Science", "detail": "Coffee contains caffeine which blocks adenosine receptors in your brain, preventing drowsiness signals. Effect peaks at 30-60 minutes."},
-            {"title": "Fun Fact", "detail": "Finns drink the most coffee per capita — about 12 kg per person per year! That's roughly 4 cups every day."},
-        ],
-    },
+    "bottle": ObjectCard(
+        name="Water Bottle",
+        category="Everyday Object",
+        features=(
+            Feature("Material", "Usually PET plastic (Polyethylene Terephthalate) or glass. PET is recyclable and marked with recycle symbol #1."),
+            Feature("Capacity", "Standard bottles hold 500ml (16.9 oz). Your body needs about 2 liters (4 bottles) of water daily."),
+            Feature("Science", "Water (H₂O) is the only substance found naturally in all 3 states: solid (ice), liquid (water), and gas (steam)."),
+            Feature("Physics", "Water has high surface tension — molecules at the surface stick together, letting you slightly overfill a glass."),
+            Feature("Fun Fact", "The water you drink today could be the same water dinosaurs drank! Water is recycled through the water cycle over millions of years."),
+        ),
+    ),
+    "water bottle": ObjectCard(
+        name="Water Bottle",
+        category="Everyday Object",
+        features=(
+            Feature("Material", "Usually PET plastic (Polyethylene Terephthalate) or glass. PET is recyclable and marked with recycle symbol #1."),
+            Feature("Hydration", "Your body needs about 2 liters of water daily. Water makes up 60% of your body weight and is essential for every cell."),
+            Feature("Science", "Water (H₂O) has unique properties: high specific heat capacity, universal solvent, and exists in all 3 states naturally on Earth."),
+            Feature("Fun Fact", "Only 3% of Earth's water is fresh water, and only 1% is easily accessible. The rest is in glaciers or deep underground."),
+        ),
+    ),
+    "cup": ObjectCard(
+        name="Cup / Mug",
+        category="Kitchen Item",
+        features=(
+            Feature("Material", "Ceramic cups are made from clay fired at 1000-1300°C in a kiln. The glazing makes them waterproof and shiny."),
+            Feature("Design", "The handle stays cool because ceramic is a poor heat conductor — insulating your hand from the hot liquid."),
+            Feature("Science", "Hot drinks cool via convection (hot liquid rises) and evaporation (molecules escape the surface as steam)."),
+            Feature("Capacity", "A standard cup holds ~250ml (8 oz). A mug = ~350ml (12 oz). An espresso cup is only 60ml!"),
+            Feature("Fun Fact", "The world's oldest cup is over 7,000 years old, found in China. Humans have been drinking from cups since the Stone Age."),
+        ),
+    ),
+    "coffee mug": ObjectCard(
+        name="Coffee Mug",
+        category="Kitchen Item",
+        features=(
+            Feature("Material", "Ceramic mugs are clay fired at 1000-1300°C. Porcelain mugs are fired even hotter (1200-1400°C) making them stronger."),
+            Feature("Heat Transfer", "Ceramic is a poor heat conductor (insulator), so the handle stays cool while the mug body holds hot liquid."),
+            Feature("Coffee Science", "Coffee contains caffeine which blocks adenosine receptors in your brain, preventing drowsiness signals. Effect peaks at 30-60 minutes."),
+            Feature("Fun Fact", "Finns drink the most coffee per capita — about 12 kg per person per year! That's roughly 4 cups every day."),
+        ),
+    ),
     # ── Furniture ──────────────────────────────────────────
-    "chair": {
-        "name": "Chair",
-        "category": "Furniture",
-        "features": [
-            {"title": "Ergonomics", "detail": "A good chair supports the natural S-curve of your spine. Ideal seat height puts feet flat on the floor with knees at 90°."},
-            {"title": "Physics", "detail": "A chair distributes weight across its legs. A 4-legged chair on a flat surface is actually unstable — 3 legs is mathematically always stable!"},
-            {"title": "Material", "detail": "Can be wood, metal, plastic, or composite. Office chairs use pneumatic cylinders (compressed gas) to adjust height."},
-            {"title": "Fun Fact", "detail": "The average person spends about 9.3 hours per day sitting — more time than sleeping!"},
-        ],
-    },
-    "folding chair": {
-        "name": "Folding Chair",
-        "category": "Furniture",
-        "features": [
-            {"title": "Design", "detail": "Uses pivot joints that allow the frame to collapse flat. The X-frame design dates back to ancient Egypt and Rome."},
-            {"title": "Physics", "detail": "When unfolded, forces are distributed through the X-frame to the ground. The design converts vertical load into outward push at the base."},
-            {"title": "Materials", "detail": "Typically steel or aluminum frames with fabric or plastic seats. Steel chairs support 100-150 kg. Aluminum is lighter but weaker."},
-            {"title": "Fun Fact", "detail": "Ancient Egyptian pharaohs had folding stools as portable thrones! Folding chairs found in King Tutankhamun's tomb are 3,300 years old."},
-        ],
-    },
-    "rocking chair": {
-        "name": "Rocking Chair",
-        "category": "Furniture",
-        "features": [
-            {"title": "Physics", "detail": "The curved runners (rockers) create a pendulum motion. The center of gravity shifts as you rock, creating a natural back-and-forth rhythm."},
-            {"title": "Health", "detail": "Rocking stimulates the vestibular system (balance center). Studies show it can reduce anxiety, improve sleep, and help with dementia symptoms."},
-            {"title": "History", "detail": "Invented in the early 1700s, originally as garden furniture. Benjamin Franklin is sometimes (incorrectly) credited with the invention."},
-            {"title": "Fun Fact", "detail": "President John F. Kennedy's doctor prescribed a rocking chair for his back pain. His iconic rocker is now in the JFK Library!"},
-        ],
-    },
+    "chair": ObjectCard(
+        name="Chair",
+        category="Furniture",
+        features=(
+            Feature("Ergonomics", "A good chair supports the natural S-curve of your spine. Ideal seat height puts feet flat on the floor with knees at 90°."),
+            Feature("Physics", "A chair distributes weight across its legs. A 4-legged chair on a flat surface is actually unstable — 3 legs is mathematically always stable!"),
+            Feature("Material", "Can be wood, metal, plastic, or composite. Office chairs use pneumatic cylinders (compressed gas) to adjust height."),
+            Feature("Fun Fact", "The average person spends about 9.3 hours per day sitting — more time than sleeping!"),
+        ),
+    ),
+    "folding chair": ObjectCard(
+        name="Folding Chair",
+        category="Furniture",
+        features=(
+            Feature("Design", "Uses pivot joints that allow the frame to collapse flat. The X-frame design dates back to ancient Egypt and Rome."),
+            Feature("Physics", "When unfolded, forces are distributed through the X-frame to the ground. The design converts vertical load into outward push at the base."),
+            Feature("Materials", "Typically steel or aluminum frames with fabric or plastic seats. Steel chairs support 100-150 kg. Aluminum is lighter but weaker."),
+            Feature("Fun Fact", "Ancient Egyptian pharaohs had folding stools as portable thrones! Folding chairs found in King Tutankhamun's tomb are 3,300 years old."),
+        ),
+    ),
+    "rocking chair": ObjectCard(
+        name="Rocking Chair",
+        category="Furniture",
+        features=(
+            Feature("Physics", "The curved runners (rockers) create a pendulum motion. The center of gravity shifts as you rock, creating a natural back-and-forth rhythm."),
+            Feature("Health", "Rocking stimulates the vestibular system (balance center). Studies show it can reduce anxiety, improve sleep, and help with dementia symptoms."),
+            Feature("History", "Invented in the early 1700s, originally as garden furniture. Benjamin Franklin is sometimes (incorrectly) credited with the invention."),
+            Feature("Fun Fact", "President John F. Kennedy's doctor prescribed a rocking chair for his back pain. His iconic rocker is now in the JFK Library!"),
+        ),
+    ),
     # ── Books & Writing ────────────────────────────────────
-    "book": {
-        "name": "Book",
-        "category": "Knowledge & Learning",
-        "features": [
-            {"title": "History", "detail": "The first printed book was the Gutenberg Bible (1455). Before printing, books were copied by hand — taking months or years."},
-            {"title": "Material", "detail": "Paper is made from wood pulp — cellulose fibers from trees. One tree makes about 100 books."},
-            {"title": "Brain", "detail": "Reading activates multiple brain areas simultaneously: vision, language processing, memory, and imagination."},
-            {"title": "Data", "detail": "A 300-page book contains ~500KB of text. Your phone can store the equivalent of millions of books!"},
-            {"title": "Fun Fact", "detail": "The world's smallest book is 0.07mm × 0.10mm — you need an electron microscope to read it!"},
-        ],
-    },
-    "book jacket": {
-        "name": "Book",
-        "category": "Knowledge & Learning",
-        "features": [
-            {"title": "History", "detail": "Book dust jackets appeared in the 1830s as protective wrapping. They became decorative in the 1920s to attract buyers."},
-            {"title": "Paper Science", "detail": "Paper is made from cellulose fibers bonded together. Acid-free paper lasts 500+ years; regular paper yellows in 50 years."},
-            {"title": "Reading", "detail": "Your brain processes written text at 200-300 words per minute. Speed readers can reach 1000+ wpm with practice."},
-            {"title": "Fun Fact", "detail": "The most expensive book ever sold was Leonardo da Vinci's Codex Leicester — Bill Gates bought it for $30.8 million in 1994!"},
-        ],
-    },
+    "book": ObjectCard(
+        name="Book",
+        category="Knowledge & Learning",
+        features=(
+            Feature("History", "The first printed book was the Gutenberg Bible (1455). Before printing, books were copied by hand — taking months or years."),
+            Feature("Material", "Paper is made from wood pulp — cellulose fibers from trees. One tree makes about 100 books."),
+            Feature("Brain", "Reading activates multiple brain areas simultaneously: vision, language processing, memory, and imagination."),
+            Feature("Data", "A 300-page book contains ~500KB of text. Your phone can store the equivalent of millions of books!"),
+            Feature("Fun Fact", "The world's smallest book is 0.07mm × 0.10mm — you need an electron microscope to read it!"),
+        ),
+    ),
+    "book jacket": ObjectCard(
+        name="Book",
+        category="Knowledge & Learning",
+        features=(
+            Feature("History", "Book dust jackets appeared in the 1830s as protective wrapping. They became decorative in the 1920s to attract buyers."),
+            Feature("Paper Science", "Paper is made from cellulose fibers bonded together. Acid-free paper lasts 500+ years; regular paper yellows in 50 years."),
+            Feature("Reading", "Your brain processes written text at 200-300 words per minute. Speed readers can reach 1000+ wpm with practice."),
+            Feature("Fun Fact", "The most expensive book ever sold was Leonardo da Vinci's Codex Leicester — Bill Gates bought it for $30.8 million in 1994!"),
+        ),
+    ),
     # ── Timepieces ─────────────────────────────────────────
-    "clock": {
-        "name": "Clock",
-        "category": "Timekeeping",
-        "features": [
-            {"title": "Mechanism", "detail": "Quartz clocks use a tiny crystal that vibrates exactly 32,768 times per second when electricity is applied."},
-            {"title": "History", "detail": "Mechanical clocks appeared in 13th century Europe. Before that, people used sundials, water clocks, and candle clocks."},
-            {"title": "Accuracy", "detail": "Atomic clocks are accurate to 1 second in 300 million years! They use cesium atom vibrations (9.2 billion/second)."},
-            {"title": "Fun Fact", "detail": "Time moves slightly faster on a mountaintop than at sea level — Einstein's relativity! GPS satellites must account for this."},
-        ],
-    },
-    "wall clock": {
-        "name": "Wall Clock",
-        "category": "Timekeeping",
-        "features": [
-            {"title": "Quartz Crystal", "detail": "Most wall clocks use a quartz crystal that vibrates 32,768 times/second when voltage is applied, keeping precise time."},
-            {"title": "Clockwise", "detail": "Clocks go 'clockwise' because sundials in the Northern Hemisphere cast shadows that move in that direction as the sun crosses the sky."},
-            {"title": "History", "detail": "The first mechanical wall clocks (14th century) had no minute hand! Minutes weren't important until trains needed precise schedules."},
-            {"title": "Fun Fact", "detail": "Big Ben in London is actually the name of the bell, not the clock! The clock tower is officially called the Elizabeth Tower."},
-        ],
-    },
-    "analog clock": {
-        "name": "Analog Clock",
-        "category": "Timekeeping",
-        "features": [
-            {"title": "Mechanism", "detail": "Gears with specific tooth ratios make the minute hand rotate 12x faster than the hour hand. A simple yet elegant system."},
-            {"title": "Quartz", "detail": "A tiny quartz crystal vibrates 32,768 times per second when electrified. A circuit divides this into 1-second pulses to move the hands."},
-            {"title": "Hands", "detail": "The second hand's smooth vs ticking movement shows whether it uses a mechanical (sweep) or quartz (tick) movement."},
-            {"title": "Fun Fact", "detail": "Clocks in advertisements almost always show 10:10 — it makes the clock face look like it's smiling!"},
-        ],
-    },
-    "digital clock": {
-        "name": "Digital Clock",
-        "category": "Timekeeping",
-        "features": [
-            {"title": "Display", "detail": "Uses LED or LCD segments. The 7-segment display can show all digits 0-9 and was invented in 1910 but popularized in the 1970s."},
-            {"title": "Accuracy", "detail": "Digital clocks use quartz oscillators accurate to ±15 seconds/month. Radio-controlled clocks sync with atomic clocks for perfect time."},
-            {"title": "24h vs 12h", "detail": "Most of the world uses 24-hour time for clarity. The 12-hour AM/PM system originated from ancient Egypt's sundial divisions."},
-            {"title": "Fun Fact", "detail": "The first digital clock (1956) used a motorized mechanical display of flip cards — no LEDs or LCDs existed yet!"},
-        ],
-    },
+    "clock": ObjectCard(
+        name="Clock",
+        category="Timekeeping",
+        features=(
+            Feature("Mechanism", "Quartz clocks use a tiny crystal that vibrates exactly 32,768 times per second when electricity is applied."),
+            Feature("History", "Mechanical clocks appeared in 13th century Europe. Before that, people used sundials, water clocks, and candle clocks."),
+            Feature("Accuracy", "Atomic clocks are accurate to 1 second in 300 million years! They use cesium atom vibrations (9.2 billion/second)."),
+            Feature("Fun Fact", "Time moves slightly faster on a mountaintop than at sea level — Einstein's relativity! GPS satellites must account for this."),
+        ),
+    ),
+    "wall clock": ObjectCard(
+        name="Wall Clock",
+        category="Timekeeping",
+        features=(
+            Feature("Quartz Crystal", "Most wall clocks use a quartz crystal that vibrates 32,768 times/second when voltage is applied, keeping precise time."),
+            Feature("Clockwise", "Clocks go 'clockwise' because sundials in the Northern Hemisphere cast shadows that move in that direction as the sun crosses the sky."),
+            Feature("History", "The first mechanical wall clocks (14th century) had no minute hand! Minutes weren't important until trains needed precise schedules."),
+            Feature("Fun Fact", "Big Ben in London is actually the name of the bell, not the clock! The clock tower is officially called the Elizabeth Tower."),
+        ),
+    ),
+    "analog clock": ObjectCard(
+        name="Analog Clock",
+        category="Timekeeping",
+        features=(
+            Feature("Mechanism", "Gears with specific tooth ratios make the minute hand rotate 12x faster than the hour hand. A simple yet elegant system."),
+            Feature("Quartz", "A tiny quartz crystal vibrates 32,768 times per second when electrified. A circuit divides this into 1-second pulses to move the hands."),
+            Feature("Hands", "The second hand's smooth vs ticking movement shows whether it uses a mechanical (sweep) or quartz (tick) movement."),
+            Feature("Fun Fact", "Clocks in advertisements almost always show 10:10 — it makes the clock face look like it's smiling!"),
+        ),
+    ),
+    "digital clock": ObjectCard(
+        name="Digital Clock",
+        category="Timekeeping",
+        features=(
+            Feature("Display", "Uses LED or LCD segments. The 7-segment display can show all digits 0-9 and was invented in 1910 but popularized in the 1970s."),
+            Feature("Accuracy", "Digital clocks use quartz oscillators accurate to ±15 seconds/month. Radio-controlled clocks sync with atomic clocks for perfect time."),
+            Feature("24h vs 12h", "Most of the world uses 24-hour time for clarity. The 12-hour AM/PM system originated from ancient Egypt's sundial divisions."),
+            Feature("Fun Fact", "The first digital clock (1956) used a motorized mechanical display of flip cards — no LEDs or LCDs existed yet!"),
+        ),
+    ),
     # ── Living Things ──────────────────────────────────────
-    "person": {
-        "name": "Human Body",
-        "category": "Biology",
-        "features": [
-            {"title": "Cells", "detail": "Your body has ~37 trillion cells. About 3.8 million cells die every second, but new ones constantly replace them."},
-            {"title": "Brain", "detail": "The brain uses 20% of your body's energy despite being only 2% of body weight. It has ~86 billion neurons."},
-            {"title": "Skeleton", "detail": "You have 206 bones. Babies are born with ~270 that fuse as they grow. The smallest bone (stapes) is 3mm."},
-            {"title": "Water", "detail": "Your body is about 60% water. Brain = 73%, lungs = 83%, even bones = 31% water."},
-            {"title": "Fun Fact", "detail": "If stretched end to end, all your DNA molecules would reach from Earth to Pluto and back — about 70 billion miles!"},
-        ],
-    },
-    "cat": {
-        "name": "Cat",
-        "category": "Animal",
-        "features": [
-            {"title": "Vision", "detail": "Cats see 6x better in the dark thanks to a reflective layer (tapetum lucidum) behind their retinas."},
-            {"title": "Agility", "detail": "230 bones, no collarbone, and a flexible spine let cats squeeze through any gap their head fits."},
-            {"title": "Purring", "detail": "Purring at 25-150 Hz may promote bone healing and tissue repair — a self-healing mechanism!"},
-            {"title": "Fun Fact", "detail": "Cats sleep 16 hours/day and can rotate their ears 180° independently."},
-        ],
-    },
-    "dog": {
-        "name": "Dog",
-        "category": "Animal",
-        "features": [
-            {"title": "Smell", "detail": "Dogs have 300 million scent receptors (humans: 6 million). Their smell-processing brain area is 40x larger than ours."},
-            {"title": "Hearing", "detail": "Dogs hear up to 65,000 Hz (humans max at 20,000 Hz) and can hear sounds 4x farther away."},
-            {"title": "Evolution", "detail": "Domesticated from wolves 15,000-40,000 years ago — the first domesticated animal."},
-            {"title": "Fun Fact", "detail": "Each dog's nose print is unique, like a human fingerprint! Their noses are wet to absorb scent chemicals."},
-        ],
-    },
-    "potted plant": {
-        "name": "Potted Plant",
-        "category": "Living Organism",
-        "features": [
-            {"title": "Photosynthesis", "detail": "Uses sunlight + CO₂ + water to make glucose and O₂. One houseplant makes enough oxygen for about 1/10 of a person."},
-            {"title": "Roots", "detail": "Roots absorb water and minerals via osmosis. Root hairs increase surface area by 100x for better absorption."},
-            {"title": "Air Quality", "detail": "NASA found plants can remove up to 87% of air toxins (formaldehyde, benzene) in 24 hours."},
-            {"title": "Fun Fact", "detail": "Plants can 'hear' — studies show they grow faster with certain sound frequencies around 1000-5000 Hz."},
-        ],
-    },
-    "flowerpot": {
-        "name": "Potted Plant / Flowerpot",
-        "category": "Living Organism",
-        "features": [
-            {"title": "Drainage", "detail": "The hole at the bottom prevents root rot by draining excess water. Roots sitting in water suffocate from lack of oxygen."},
-            {"title": "Photosynthesis", "detail": "Plants convert CO₂ + water + sunlight into glucose (food) and oxygen. This process powers almost all life on Earth."},
-            {"title": "Soil Science", "detail": "Potting soil contains peat, perlite, and vermiculite — designed to retain moisture while allowing air circulation around roots."},
-            {"title": "Fun Fact", "detail": "Terracotta pots are porous — they 'breathe' by allowing air and moisture to pass through the walls, keeping roots healthy."},
-        ],
-    },
+    "person": ObjectCard(
+        name="Human Body",
+        category="Biology",
+        features=(
+            Feature("Cells", "Your body has ~37 trillion cells. About 3.8 million cells die every second, but new ones constantly replace them."),
+            Feature("Brain", "The brain uses 20% of your body's energy despite being only 2% of body weight. It has ~86 billion neurons."),
+            Feature("Skeleton", "You have 206 bones. Babies are born with ~270 that fuse as they grow. The smallest bone (stapes) is 3mm."),
+            Feature("Water", "Your body is about 60% water. Brain = 73%, lungs = 83%, even bones = 31% water."),
+            Feature("Fun Fact", "If stretched end to end, all your DNA molecules would reach from Earth to Pluto and back — about 70 billion miles!"),
+        ),
+    ),
+    "cat": ObjectCard(
+        name="Cat",
+        category="Animal",
+        features=(
+            Feature("Vision", "Cats see 6x better in the dark thanks to a reflective layer (tapetum lucidum) behind their retinas."),
+            Feature("Agility", "230 bones, no collarbone, and a flexible spine let cats squeeze through any gap their head fits."),
+            Feature("Purring", "Purring at 25-150 Hz may promote bone healing and tissue repair — a self-healing mechanism!"),
+            Feature("Fun Fact", "Cats sleep 16 hours/day and can rotate their ears 180° independently."),
+        ),
+    ),
+    "dog": ObjectCard(
+        name="Dog",
+        category="Animal",
+        features=(
+            Feature("Smell", "Dogs have 300 million scent receptors (humans: 6 million). Their smell-processing brain area is 40x larger than ours."),
+            Feature("Hearing", "Dogs hear up to 65,000 Hz (humans max at 20,000 Hz) and can hear sounds 4x farther away."),
+            Feature("Evolution", "Domesticated from wolves 15,000-40,000 years ago — the first domesticated animal."),
+            Feature("Fun Fact", "Each dog's nose print is unique, like a human fingerprint! Their noses are wet to absorb scent chemicals."),
+        ),
+    ),
+    "potted plant": ObjectCard(
+        name="Potted Plant",
+        category="Living Organism",
+        features=(
+            Feature("Photosynthesis", "Uses sunlight + CO₂ + water to make glucose and O₂. One houseplant makes enough oxygen for about 1/10 of a person."),
+            Feature("Roots", "Roots absorb water and minerals via osmosis. Root hairs increase surface area by 100x for better absorption."),
+            Feature("Air Quality", "NASA found plants can remove up to 87% of air toxins (formaldehyde, benzene) in 24 hours."),
+            Feature("Fun Fact", "Plants can 'hear' — studies show they grow faster with certain sound frequencies around 1000-5000 Hz."),
+        ),
+    ),
+    "flowerpot": ObjectCard(
+        name="Potted Plant / Flowerpot",
+        category="Living Organism",
+        features=(
+            Feature("Drainage", "The hole at the bottom prevents root rot by draining excess water. Roots sitting in water suffocate from lack of oxygen."),
+            Feature("Photosynthesis", "Plants convert CO₂ + water + sunlight into glucose (food) and oxygen. This process powers almost all life on Earth."),
+            Feature("Soil Science", "Potting soil contains peat, perlite, and vermiculite — designed to retain moisture while allowing air circulation around roots."),
+            Feature("Fun Fact", "Terracotta pots are porous — they 'breathe' by allowing air and moisture to pass through the walls, keeping roots healthy."),
+        ),
+    ),
     # ── Food & Fruit ───────────────────────────────────────
-    "banana": {
-        "name": "Banana",
-        "category": "Fruit / Food",
-        "features": [
-            {"title": "Nutrition", "detail": "Rich in potassium (422mg), vitamin B6, and fiber. Potassium helps muscles contract and nerves send signals."},
-            {"title": "Biology", "detail": "Bananas are technically berries! They grow in clusters called 'hands' on giant herbs, not trees."},
-            {"title": "Chemistry", "detail": "Slightly radioactive due to potassium-40 isotope. You'd need 10 million bananas at once for radiation to be harmful!"},
-            {"title": "Ripening", "detail": "Bananas produce ethylene gas that triggers ripening. Putting them near other fruits makes everything ripen faster."},
-            {"title": "Fun Fact", "detail": "Banana DNA is 60% identical to human DNA! We share more genes with bananas than you'd expect."},
-        ],
-    },
-    "apple": {
-        "name": "Apple",
-        "category": "Fruit / Food",
-        "features": [
-            {"title": "Nutrition", "detail": "One apple has ~95 calories, 4g fiber, and 14% daily vitamin C. The skin has most fiber and antioxidants."},
-            {"title": "Varieties", "detail": "Over 7,500 varieties worldwide. It would take 20 years to try a new variety every day!"},
-            {"title": "Science", "detail": "Apples float because they're 25% air! Air pockets between cells make them less dense than water."},
-            {"title": "History", "detail": "Newton's falling apple observation inspired his theory of gravity — the same force keeping the Moon in orbit."},
-            {"title": "Fun Fact", "detail": "Apple seeds contain amygdalin (cyanide precursor), but you'd need 200+ seeds at once for danger."},
-        ],
-    },
-    "orange": {
-        "name": "Orange",
-        "category": "Fruit / Food",
-        "features": [
-            {"title": "Nutrition", "detail": "One orange has 70 calories, 130% daily vitamin C, and 3g fiber. Vitamin C boosts immune function and collagen production."},
-            {"title": "Color", "detail": "The fruit was named before the color! The word 'orange' comes from Sanskrit 'naranga'. In many tropical countries, ripe oranges are green."},
-            {"title": "Segments", "detail": "Oranges typically have 10 segments (carpels). Each segment is filled with juice vesicles — tiny sacs that burst when you bite."},
-            {"title": "Fun Fact", "detail": "Brazil produces 1/3 of the world's oranges — about 17 million tonnes per year! Most become orange juice."},
-        ],
-    },
-    "lemon": {
-        "name": "Lemon",
-        "category": "Fruit / Food",
-        "features": [
-            {"title": "Acid", "detail": "Lemons contain 5-6% citric acid, giving them pH 2.0. This acidity kills some bacteria and is used as a natural preservative."},
-            {"title": "Vitamin C", "detail": "One lemon provides 51% of your daily vitamin C. British sailors ate lemons to prevent scurvy — hence the nickname 'limeys'."},
-            {"title": "Electricity", "detail": "A lemon can generate about 0.9 volts of electricity! The citric acid reacts with zinc and copper electrodes to create a battery."},
-            {"title": "Fun Fact", "detail": "Lemon juice is a natural invisible ink — write with it and the text appears when heated, as the acid chars before the paper!"},
-        ],
-    },
-    "pizza": {
-        "name": "Pizza",
-        "category": "Food Science",
-        "features": [
-            {"title": "Chemistry", "detail": "The Maillard reaction (browning) between amino acids and sugars at 140-165°C creates pizza's complex flavors and golden crust."},
-            {"title": "Yeast", "detail": "Dough rises because yeast (fungi) eats sugar and produces CO₂ gas bubbles. This fermentation creates the airy, chewy texture."},
-            {"title": "Temperature", "detail": "Traditional Neapolitan pizza cooks at 485°C for just 60-90 seconds. Home ovens at 250°C take 10-15 minutes."},
-            {"title": "Fun Fact", "detail": "Americans eat about 3 billion pizzas a year — roughly 100 acres of pizza per day! Pizza Margherita was named after Queen Margherita of Italy in 1889."},
-        ],
-    },
+    "banana": ObjectCard(
+        name="Banana",
+        category="Fruit / Food",
+        features=(
+            Feature("Nutrition", "Rich in potassium (422mg), vitamin B6, and fiber. Potassium helps muscles contract and nerves send signals."),
+            Feature("Biology", "Bananas are technically berries! They grow in clusters called 'hands' on giant herbs, not trees."),
+            Feature("Chemistry", "Slightly radioactive due to potassium-40 isotope. You'd need 10 million bananas at once for radiation to be harmful!"),
+            Feature("Ripening", "Bananas produce ethylene gas that triggers ripening. Putting them near other fruits makes everything ripen faster."),
+            Feature("Fun Fact", "Banana DNA is 60% identical to human DNA! We share more genes with bananas than you'd expect."),
+        ),
+    ),
+    "apple": ObjectCard(
+        name="Apple",
+        category="Fruit / Food",
+        features=(
+            Feature("Nutrition", "One apple has ~95 calories, 4g fiber, and 14% daily vitamin C. The skin has most fiber and antioxidants."),
+            Feature("Varieties", "Over 7,500 varieties worldwide. It would take 20 years to try a new variety every day!"),
+            Feature("Science", "Apples float because they're 25% air! Air pockets between cells make them less dense than water."),
+            Feature("History", "Newton's falling apple observation inspired his theory of gravity — the same force keeping the Moon in orbit."),
+            Feature("Fun Fact", "Apple seeds contain amygdalin (cyanide precursor), but you'd need 200+ seeds at once for danger."),
+        ),
+    ),
+    "orange": ObjectCard(
+        name="Orange",
+        category="Fruit / Food",
+        features=(
+            Feature("Nutrition", "One orange has 70 calories, 130% daily vitamin C, and 3g fiber. Vitamin C boosts immune function and collagen production."),
+            Feature("Color", "The fruit was named before the color! The word 'orange' comes from Sanskrit 'naranga'. In many tropical countries, ripe oranges are green."),
+            Feature("Segments", "Oranges typically have 10 segments (carpels). Each segment is filled with juice vesicles — tiny sacs that burst when you bite."),
+            Feature("Fun Fact", "Brazil produces 1/3 of the world's oranges — about 17 million tonnes per year! Most become orange juice."),
+        ),
+    ),
+    "lemon": ObjectCard(
+        name="Lemon",
+        category="Fruit / Food",
+        features=(
+            Feature("Acid", "Lemons contain 5-6% citric acid, giving them pH 2.0. This acidity kills some bacteria and is used as a natural preservative."),
+            Feature("Vitamin C", "One lemon provides 51% of your daily vitamin C. British sailors ate lemons to prevent scurvy — hence the nickname 'limeys'."),
+            Feature("Electricity", "A lemon can generate about 0.9 volts of electricity! The citric acid reacts with zinc and copper electrodes to create a battery."),
+            Feature("Fun Fact", "Lemon juice is a natural invisible ink — write with it and the text appears when heated, as the acid chars before the paper!"),
+        ),
+    ),
+    "pizza": ObjectCard(
+        name="Pizza",
+        category="Food Science",
+        features=(
+            Feature("Chemistry", "The Maillard reaction (browning) between amino acids and sugars at 140-165°C creates pizza's complex flavors and golden crust."),
+            Feature("Yeast", "Dough rises because yeast (fungi) eats sugar and produces CO₂ gas bubbles. This fermentation creates the airy, chewy texture."),
+            Feature("Temperature", "Traditional Neapolitan pizza cooks at 485°C for just 60-90 seconds. Home ovens at 250°C take 10-15 minutes."),
+            Feature("Fun Fact", "Americans eat about 3 billion pizzas a year — roughly 100 acres of pizza per day! Pizza Margherita was named after Queen Margherita of Italy in 1889."),
+        ),
+    ),
     # ── Home Objects ───────────────────────────────────────
-    "tv": {
-        "name": "Television",
-        "category": "Display Technology",
-        "features": [
-            {"title": "Pixels", "detail": "A 4K TV has 8.3 million pixels (3840×2160), each with RGB sub-pixels — ~25 million light sources!"},
-            {"title": "Technology", "detail": "OLED TVs have self-emitting pixels. LED TVs use a backlight behind an LCD panel that filters colors."},
-            {"title": "Refresh Rate", "detail": "60Hz = 60 updates/second. 120Hz is smoother for fast motion and gaming."},
-            {"title": "Fun Fact", "detail": "The first TV broadcast (1928) had only 48 lines of resolution. Today's 8K TVs have 7680 lines!"},
-        ],
-    },
-    "television": {
-        "name": "Television",
-        "category": "Display Technology",
-        "features": [
-            {"title": "Pixels", "detail": "A 4K TV has 8.3 million pixels. Each pixel has Red, Green, and Blue sub-pixels — about 25 million tiny light sources total!"},
-            {"title": "OLED vs LED", "detail": "OLED pixels emit their own light (true black). LED TVs use a backlight behind liquid crystal filters — can't achieve true black."},
-            {"title": "History", "detail": "First TV broadcast in 1928 had 48 lines. Standard HD is 1080 lines. 4K = 2160 lines. 8K = 4320 lines — 90x the first broadcast!"},
-            {"title": "Fun Fact", "detail": "If you watched TV 8 hours daily, it would take 56 years to watch every show and movie ever made."},
-        ],
-    },
-    "remote control": {
-        "name": "Remote Control",
-        "category": "Electronics",
-        "features": [
-            {"title": "How It Works", "detail": "Uses infrared (IR) LED — invisible to eyes but your phone camera can see it! Point and press to check."},
-            {"title": "Encoding", "detail": "Each button sends a unique pattern of IR light pulses. The TV decodes these patterns to know which button was pressed."},
-            {"title": "Battery", "detail": "Alkaline batteries convert chemical energy (zinc + manganese dioxide) to electrical energy."},
-            {"title": "Fun Fact", "detail": "The first remote (1955) was called 'Zenith Space Command' and used ultrasonic sound instead of IR light!"},
-        ],
-    },
-    "pillow": {
-        "name": "Pillow",
-        "category": "Everyday Object",
-        "features": [
-            {"title": "Ergonomics", "detail": "Pillows align your neck with your spine. Side sleepers need thicker pillows, back sleepers need thinner ones for proper support."},
-            {"title": "Materials", "detail": "Filled with polyester fiber, memory foam, down feathers, or buckwheat hulls. Memory foam molds to your head shape using body heat."},
-            {"title": "Hygiene", "detail": "After 2 years, 10% of a pillow's weight can be dust mites and their waste! Experts recommend replacing pillows every 1-2 years."},
-            {"title": "Fun Fact", "detail": "Ancient Mesopotamians used stone pillows 9,000 years ago! Ancient Egyptians used wooden or ivory headrests to protect elaborate hairstyles."},
-        ],
-    },
+    "tv": ObjectCard(
+        name="Television",
+        category="Display Technology",
+        features=(
+            Feature("Pixels", "A 4K TV has 8.3 million pixels (3840×2160), each with RGB sub-pixels — ~25 million light sources!"),
+            Feature("Technology", "OLED TVs have self-emitting pixels. LED TVs use a backlight behind an LCD panel that filters colors."),
+            Feature("Refresh Rate", "60Hz = 60 updates/second. 120Hz is smoother for fast motion and gaming."),
+            Feature("Fun Fact", "The first TV broadcast (1928) had only 48 lines of resolution. Today's 8K TVs have 7680 lines!"),
+        ),
+    ),
+    "television": ObjectCard(
+        name="Television",
+        category="Display Technology",
+        features=(
+            Feature("Pixels", "A 4K TV has 8.3 million pixels. Each pixel has Red, Green, and Blue sub-pixels — about 25 million tiny light sources total!"),
+            Feature("OLED vs LED", "OLED pixels emit their own light (true black). LED TVs use a backlight behind liquid crystal filters — can't achieve true black."),
+            Feature("History", "First TV broadcast in 1928 had 48 lines. Standard HD is 1080 lines. 4K = 2160 lines. 8K = 4320 lines — 90x the first broadcast!"),
+            Feature("Fun Fact", "If you watched TV 8 hours daily, it would take 56 years to watch every show and movie ever made."),
+        ),
+    ),
+    "remote control": ObjectCard(
+        name="Remote Control",
+        category="Electronics",
+        features=(
+            Feature("How It Works", "Uses infrared (IR) LED — invisible to eyes but your phone camera can see it! Point and press to check."),
+            Feature("Encoding", "Each button sends a unique pattern of IR light pulses. The TV decodes these patterns to know which button was pressed."),
+            Feature("Battery", "Alkaline batteries convert chemical energy (zinc + manganese dioxide) to electrical energy."),
+            Feature("Fun Fact", "The first remote (1955) was called 'Zenith Space Command' and used ultrasonic sound instead of IR light!"),
+        ),
+    ),
+    "pillow": ObjectCard(
+        name="Pillow",
+        category="Everyday Object",
+        features=(
+            Feature("Ergonomics", "Pillows align your neck with your spine. Side sleepers need thicker pillows, back sleepers need thinner ones for proper support."),
+            Feature("Materials", "Filled with polyester fiber, memory foam, down feathers, or buckwheat hulls. Memory foam molds to your head shape using body heat."),
+            Feature("Hygiene", "After 2 years, 10% of a pillow's weight can be dust mites and their waste! Experts recommend replacing pillows every 1-2 years."),
+            Feature("Fun Fact", "Ancient Mesopotamians used stone pillows 9,000 years ago! Ancient Egyptians used wooden or ivory headrests to protect elaborate hairstyles."),
+        ),
+    ),
     # ── Bags & Accessories ─────────────────────────────────
-    "backpack": {
-        "name": "Backpack",
-        "category": "Everyday Object",
-        "features": [
-            {"title": "Ergonomics", "detail": "Should weigh no more than 10-15% of body weight. Both straps distribute weight evenly across shoulders."},
-            {"title": "Material", "detail": "Most use nylon (strong, water-resistant) or polyester. Military packs use Cordura — 10x more abrasion-resistant."},
-            {"title": "Physics", "detail": "Wearing high on back keeps center of gravity close to spine, reducing strain by up to 50%."},
-            {"title": "Fun Fact", "detail": "The modern zippered backpack was invented in 1938. Before that, students used leather straps!"},
-        ],
-    },
-    "umbrella": {
-        "name": "Umbrella",
-        "category": "Everyday Object",
-        "features": [
-            {"title": "Material", "detail": "Canopy is polyester/nylon with waterproof coating. Frame uses steel or fiberglass ribs for flexibility."},
-            {"title": "History", "detail": "Invented over 3,500 years ago in ancient Egypt — originally for sun protection, not rain!"},
-            {"title": "Physics", "detail": "Tight fabric weave plus coating creates surface tension that prevents water from passing through."},
-            {"title": "Fun Fact", "detail": "The UK loses about 80,000 umbrellas on public transport every year!"},
-        ],
-    },
-    "sunglasses": {
-        "name": "Sunglasses",
-        "category": "Eyewear",
-        "features": [
-            {"title": "UV Protection", "detail": "Good sunglasses block 99-100% of UV-A and UV-B radiation. UV exposure can cause cataracts and macular degeneration over time."},
-            {"title": "Polarization", "detail": "Polarized lenses have a special filter that blocks horizontal light waves (glare from flat surfaces like water or roads)."},
-            {"title": "Tint vs Protection", "detail": "Dark tint does NOT mean better UV protection! A clear lens can block 100% UV. Cheap dark glasses without UV coating are actually worse."},
-            {"title": "Fun Fact", "detail": "Roman emperor Nero watched gladiator fights through polished emerald gems — possibly the first 'sunglasses' in history (1st century AD)!"},
-        ],
-    },
+    "backpack": ObjectCard(
+        name="Backpack",
+        category="Everyday Object",
+        features=(
+            Feature("Ergonomics", "Should weigh no more than 10-15% of body weight. Both straps distribute weight evenly across shoulders."),
+            Feature("Material", "Most use nylon (strong, water-resistant) or polyester. Military packs use Cordura — 10x more abrasion-resistant."),
+            Feature("Physics", "Wearing high on back keeps center of gravity close to spine, reducing strain by up to 50%."),
+            Feature("Fun Fact", "The modern zippered backpack was invented in 1938. Before that, students used leather straps!"),
+        ),
+    ),
+    "umbrella": ObjectCard(
+        name="Umbrella",
+        category="Everyday Object",
+        features=(
+            Feature("Material", "Canopy is polyester/nylon with waterproof coating. Frame uses steel or fiberglass ribs for flexibility."),
+            Feature("History", "Invented over 3,500 years ago in ancient Egypt — originally for sun protection, not rain!"),
+            Feature("Physics", "Tight fabric weave plus coating creates surface tension that prevents water from passing through."),
+            Feature("Fun Fact", "The UK loses about 80,000 umbrellas on public transport every year!"),
+        ),
+    ),
+    "sunglasses": ObjectCard(
+        name="Sunglasses",
+        category="Eyewear",
+        features=(
+            Feature("UV Protection", "Good sunglasses block 99-100% of UV-A and UV-B radiation. UV exposure can cause cataracts and macular degeneration over time."),
+            Feature("Polarization", "Polarized lenses have a special filter that blocks horizontal light waves (glare from flat surfaces like water or roads)."),
+            Feature("Tint vs Protection", "Dark tint does NOT mean better UV protection! A clear lens can block 100% UV. Cheap dark glasses without UV coating are actually worse."),
+            Feature("Fun Fact", "Roman emperor Nero watched gladiator fights through polished emerald gems — possibly the first 'sunglasses' in history (1st century AD)!"),
+        ),
+    ),
     # ── Scissors & Tools ───────────────────────────────────
-    "scissors": {
-        "name": "Scissors",
-        "category": "Tool",
-        "features": [
-            {"title": "Physics", "detail": "Scissors are two Class 1 levers joined at a fulcrum (pivot). They multiply your hand's force."},
-            {"title": "Material", "detail": "Blades are stainless steel (iron + chromium + carbon). Chromium forms an oxide layer preventing rust."},
-            {"title": "History", "detail": "Earliest scissors date to 1500 BC in ancient Egypt. Leonardo da Vinci is often incorrectly credited."},
-            {"title": "Fun Fact", "detail": "Left-handed scissors reverse the blade overlap — right-handed scissors actually push blades apart when used lefty!"},
-        ],
-    },
+    "scissors": ObjectCard(
+        name="Scissors",
+        category="Tool",
+        features=(
+            Feature("Physics", "Scissors are two Class 1 levers joined at a fulcrum (pivot). They multiply your hand's force."),
+            Feature("Material", "Blades are stainless steel (iron + chromium + carbon). Chromium forms an oxide layer preventing rust."),
+            Feature("History", "Earliest scissors date to 1500 BC in ancient Egypt. Leonardo da Vinci is often incorrectly credited."),
+            Feature("Fun Fact", "Left-handed scissors reverse the blade overlap — right-handed scissors actually push blades apart when used lefty!"),
+        ),
+    ),
     # ── Kitchen Appliances ─────────────────────────────────
-    "microwave": {
-        "name": "Microwave Oven",
-        "category": "Kitchen Appliance",
-        "features": [
-            {"title": "How It Works", "detail": "A magnetron generates microwaves (2.45 GHz) that vibrate water molecules 2.45 billion times/second, creating friction heat."},
-            {"title": "Discovery", "detail": "Invented by accident in 1945! Engineer Percy Spencer noticed a chocolate bar melted near a radar magnetron."},
-            {"title": "Safety", "detail": "The metal mesh in the door has holes smaller than microwave wavelength (12.2cm), so waves can't escape but light passes through."},
-            {"title": "Fun Fact", "detail": "Microwaves don't heat from inside out — they penetrate about 1-1.5cm deep. The rest heats by conduction."},
-        ],
-    },
-    "refrigerator": {
-        "name": "Refrigerator",
-        "category": "Kitchen Appliance",
-        "features": [
-            {"title": "How It Works", "detail": "Refrigerant gas absorbs heat when evaporating inside, releases heat when compressed outside. It moves heat, not cold!"},
-            {"title": "Temperature", "detail": "Ideal: fridge 3-4°C, freezer -18°C. Bacteria growth slows 2x for every 5°C decrease."},
-            {"title": "Energy", "detail": "Runs 24/7, using 150-400 kWh/year — about 13% of household electricity."},
-            {"title": "Fun Fact", "detail": "Before fridges, people stored food in icehouses filled with winter-harvested ice, or underground root cellars."},
-        ],
-    },
+    "microwave": ObjectCard(
+        name="Microwave Oven",
+        category="Kitchen Appliance",
+        features=(
+            Feature("How It Works", "A magnetron generates microwaves (2.45 GHz) that vibrate water molecules 2.45 billion times/second, creating friction heat."),
+            Feature("Discovery", "Invented by accident in 1945! Engineer Percy Spencer noticed a chocolate bar melted near a radar magnetron."),
+            Feature("Safety", "The metal mesh in the door has holes smaller than microwave wavelength (12.2cm), so waves can't escape but light passes through."),
+            Feature("Fun Fact", "Microwaves don't heat from inside out — they penetrate about 1-1.5cm deep. The rest heats by conduction."),
+        ),
+    ),
+    "refrigerator": ObjectCard(
+        name="Refrigerator",
+        category="Kitchen Appliance",
+        features=(
+            Feature("How It Works", "Refrigerant gas absorbs heat when evaporating inside, releases heat when compressed outside. It moves heat, not cold!"),
+            Feature("Temperature", "Ideal: fridge 3-4°C, freezer -18°C. Bacteria growth slows 2x for every 5°C decrease."),
+            Feature("Energy", "Runs 24/7, using 150-400 kWh/year — about 13% of household electricity."),
+            Feature("Fun Fact", "Before fridges, people stored food in icehouses filled with winter-harvested ice, or underground root cellars."),
+        ),
+    ),
     # ── Stationery ─────────────────────────────────────────
-    "ballpoint": {
-        "name": "Ballpoint Pen",
-        "category": "Writing Instrument",
-        "features": [
-            {"title": "How It Works", "detail": "A tiny ball (0.7-1.0mm) rotates in a socket, picking up viscous ink from a cartridge and depositing it on paper by contact."},
-            {"title": "Ink Science", "detail": "Ballpoint ink is oil-based and viscous (thick). It dries by absorption into paper and oxidation, unlike water-based fountain pen ink."},
-            {"title": "History", "detail": "Patented by László Bíró in 1938. He noticed newspaper ink dried quickly, so he created a pen that could use similar thick ink."},
-            {"title": "Fun Fact", "detail": "A single ballpoint pen can draw a line 2-3 km long! The average pen runs out after writing about 45,000 words."},
-        ],
-    },
-    "pencil": {
-        "name": "Pencil",
-        "category": "Writing Instrument",
-        "features": [
-            {"title": "Material", "detail": "Pencil 'lead' is actually graphite (carbon) mixed with clay. More clay = harder pencil (H). More graphite = softer/darker (B)."},
-            {"title": "How It Works", "detail": "Graphite has layers of carbon atoms that slide apart easily, leaving marks on paper. It's held by Van der Waals forces."},
-            {"title": "Capacity", "detail": "A single pencil can draw a line 56 km long or write approximately 45,000 words before running out!"},
-            {"title": "Fun Fact", "detail": "NASA spent millions developing a space pen. The Soviets used pencils! (Actually, both eventually used space pens — pencil tips can break and damage electronics in zero gravity.)"},
-        ],
-    },
+    "ballpoint": ObjectCard(
+        name="Ballpoint Pen",
+        category="Writing Instrument",
+        features=(
+            Feature("How It Works", "A tiny ball (0.7-1.0mm) rotates in a socket, picking up viscous ink from a cartridge and depositing it on paper by contact."),
+            Feature("Ink Science", "Ballpoint ink is oil-based and viscous (thick). It dries by absorption into paper and oxidation, unlike water-based fountain pen ink."),
+            Feature("History", "Patented by László Bíró in 1938. He noticed newspaper ink dried quickly, so he created a pen that could use similar thick ink."),
+            Feature("Fun Fact", "A single ballpoint pen can draw a line 2-3 km long! The average pen runs out after writing about 45,000 words."),
+        ),
+    ),
+    "pencil": ObjectCard(
+        name="Pencil",
+        category="Writing Instrument",
+        features=(
+            Feature("Material", "Pencil 'lead' is actually graphite (carbon) mixed with clay. More clay = harder pencil (H). More graphite = softer/darker (B)."),
+            Feature("How It Works", "Graphite has layers of carbon atoms that slide apart easily, leaving marks on paper. It's held by Van der Waals forces."),
+            Feature("Capacity", "A single pencil can draw a line 56 km long or write approximately 45,000 words before running out!"),
+            Feature("Fun Fact", "NASA spent millions developing a space pen. The Soviets used pencils! (Actually, both eventually used space pens — pencil tips can break and damage electronics in zero gravity.)"),
+        ),
+    ),
     # ── Footwear ───────────────────────────────────────────
-    "running shoe": {
-        "name": "Running Shoe / Sneaker",
-        "category": "Footwear",
-        "features": [
-            {"title": "Cushioning", "detail": "Midsoles use EVA foam or special foams (Nike ZoomX, Adidas Boost) that compress on impact and return energy — up to 85% energy return."},
-            {"title": "Biomechanics", "detail": "Running generates impact forces of 2-3x your body weight. Shoes distribute this force across the foot to reduce joint stress."},
-            {"title": "Material", "detail": "Uppers use knit or mesh fabric for breathability. Outsoles use rubber compounds optimized for grip on different surfaces."},
-            {"title": "Fun Fact", "detail": "The first modern running shoes (1920s) were just rubber-soled plimsolls. Today's carbon-plate shoes have helped break the 2-hour marathon!"},
-        ],
-    },
-    "Loafer": {
-        "name": "Shoe / Loafer",
-        "category": "Footwear",
-        "features": [
-            {"title": "Material", "detail": "Leather shoes are made from tanned animal hide. Tanning converts collagen fibers into a durable, flexible material."},
-            {"title": "Construction", "detail": "Quality shoes use a welt — a strip stitching the upper to the sole. Goodyear-welted shoes can be resoled multiple times."},
-            {"title": "Sizing", "detail": "Shoe sizes vary by country. The Brannock Device (invented 1927) measures foot length, width, and arch length for proper fit."},
-            {"title": "Fun Fact", "detail": "The oldest known shoes are 5,500 years old, found in an Armenian cave. They were made of a single piece of cowhide!"},
-        ],
-    },
+    "running shoe": ObjectCard(
+        name="Running Shoe / Sneaker",
+        category="Footwear",
+        features=(
+            Feature("Cushioning", "Midsoles use EVA foam or special foams (Nike ZoomX, Adidas Boost) that compress on impact and return energy — up to 85% energy return."),
+            Feature("Biomechanics", "Running generates impact forces of 2-3x your body weight. Shoes distribute this force across the foot to reduce joint stress."),
+            Feature("Material", "Uppers use knit or mesh fabric for breathability. Outsoles use rubber compounds optimized for grip on different surfaces."),
+            Feature("Fun Fact", "The first modern running shoes (1920s) were just rubber-soled plimsolls. Today's carbon-plate shoes have helped break the 2-hour marathon!"),
+        ),
+    ),
+    "loafer": ObjectCard(
+        name="Shoe / Loafer",
+        category="Footwear",
+        features=(
+            Feature("Material", "Leather shoes are made from tanned animal hide. Tanning converts collagen fibers into a durable, flexible material."),
+            Feature("Construction", "Quality shoes use a welt — a strip stitching the upper to the sole. Goodyear-welted shoes can be resoled multiple times."),
+            Feature("Sizing", "Shoe sizes vary by country. The Brannock Device (invented 1927) measures foot length, width, and arch length for proper fit."),
+            Feature("Fun Fact", "The oldest known shoes are 5,500 years old, found in an Armenian cave. They were made of a single piece of cowhide!"),
+        ),
+    ),
     # ── Miscellaneous ──────────────────────────────────────
-    "window shade": {
-        "name": "Window / Curtain",
-        "category": "Home Furnishing",
-        "features": [
-            {"title": "Insulation", "detail": "Curtains can reduce heat loss through windows by 25-40%. Thermal curtains have insulating backing that blocks cold air transfer."},
-            {"title": "Light Control", "detail": "Blackout curtains block 99% of light using tightly woven fabric or special coating. Important for sleep quality."},
-            {"title": "Physics", "detail": "Windows lose heat through conduction, convection, and radiation. The air gap between curtain and glass acts as an insulating layer."},
-            {"title": "Fun Fact", "detail": "Ancient Egyptians hung wet reeds over doorways — the first 'curtains'. As water evaporated, it cooled the air coming in!"},
-        ],
-    },
-    "toilet tissue": {
-        "name": "Toilet Paper / Tissue",
-        "category": "Everyday Object",
-        "features": [
-            {"title": "Material", "detail": "Made from virgin wood pulp or recycled paper. The fibers are softened by creping — scraping the paper off the manufacturing drum."},
-            {"title": "History", "detail": "Modern toilet paper was invented in 1857 in the US. Before that, people used leaves, corn cobs, wool, or water."},
-            {"title": "Manufacturing", "detail": "The embossed patterns aren't just decorative — they increase surface area and softness while helping the paper absorb more."},
-            {"title": "Fun Fact", "detail": "The average person uses about 100 rolls (20,000 sheets) of toilet paper per year! That's 384 trees in a lifetime."},
-        ],
-    },
-    "paper towel": {
-        "name": "Paper Towel",
-        "category": "Everyday Object",
-        "features": [
-            {"title": "Absorption", "detail": "Paper towels absorb water through capillary action — water molecules are attracted to cellulose fibers and climb into tiny spaces between them."},
-            {"title": "Strength", "detail": "Wet strength comes from special resins bonding the fibers. Without these resins, paper disintegrates when wet."},
-            {"title": "History", "detail": "Invented accidentally by Arthur Scott in 1907 when a toilet paper roll was made too thick. He cut it into towels instead of tossing it."},
-            {"title": "Fun Fact", "detail": "Bouncing water off a surface with a paper towel demonstrates hydrophobic properties some brands add to their towels!"},
-        ],
-    },
-    "water jug": {
-        "name": "Water Jug / Pitcher",
-        "category": "Kitchen Item",
-        "features": [
-            {"title": "Material", "detail": "Can be glass, ceramic, plastic, or stainless steel. Glass is non-reactive and won't leach chemicals into water."},
-            {"title": "Filtration", "detail": "Filter jugs use activated carbon (charcoal) which has millions of tiny pores. One gram has the surface area of 4 tennis courts!"},
-            {"title": "Water Science", "detail": "Water is called the 'universal solvent' because its polar molecules can dissolve more substances than any other liquid."},
-            {"title": "Fun Fact", "detail": "Hot water freezes faster than cold water in some conditions — this is called the Mpemba effect, and it's still not fully explained!"},
-        ],
-    },
-    "toothbrush": {
-        "name": "Toothbrush",
-        "category": "Personal Care",
-        "features": [
-            {"title": "Bristles", "detail": "Modern bristles are nylon (invented 1938). Before that, pig hair, horse hair, or bird feathers!"},
-            {"title": "Teeth", "detail": "Tooth enamel is the hardest substance in your body — harder than steel! But it can't regenerate once damaged."},
-            {"title": "Hygiene", "detail": "Your mouth has 700+ species of bacteria. Brushing removes plaque — the sticky biofilm bacteria form on teeth."},
-            {"title": "Fun Fact", "detail": "The first toothbrush was invented in China in 1498 using bamboo and boar bristles!"},
-        ],
-    },
-    "hand towel": {
-        "name": "Towel",
-        "category": "Everyday Object",
-        "features": [
-            {"title": "Material", "detail": "Terry cloth towels have tiny loops (called pile) that increase surface area dramatically, allowing them to absorb 27x their weight in water."},
-            {"title": "Absorption", "detail": "Cotton fibers are hollow and hydrophilic — they attract water through capillary action, pulling moisture into the fiber structure."},
-            {"title": "Hygiene", "detail": "Damp towels can grow bacteria rapidly. Wash them every 3-4 uses and hang to dry between uses to prevent microbial growth."},
-            {"title": "Fun Fact", "detail": "Towel Day is celebrated annually on May 25th — a tribute to Douglas Adams' 'The Hitchhiker's Guide to the Galaxy' where towels are essential!"},
-        ],
-    },
+    "window shade": ObjectCard(
+        name="Window / Curtain",
+        category="Home Furnishing",
+        features=(
+            Feature("Insulation", "Curtains can reduce heat loss through windows by 25-40%. Thermal curtains have insulating backing that blocks cold air transfer."),
+            Feature("Light Control", "Blackout curtains block 99% of light using tightly woven fabric or special coating. Important for sleep quality."),
+            Feature("Physics", "Windows lose heat through conduction, convection, and radiation. The air gap between curtain and glass acts as an insulating layer."),
+            Feature("Fun Fact", "Ancient Egyptians hung wet reeds over doorways — the first 'curtains'. As water evaporated, it cooled the air coming in!"),
+        ),
+    ),
+    "toilet tissue": ObjectCard(
+        name="Toilet Paper / Tissue",
+        category="Everyday Object",
+        features=(
+            Feature("Material", "Made from virgin wood pulp or recycled paper. The fibers are softened by creping — scraping the paper off the manufacturing drum."),
+            Feature("History", "Modern toilet paper was invented in 1857 in the US. Before that, people used leaves, corn cobs, wool, or water."),
+            Feature("Manufacturing", "The embossed patterns aren't just decorative — they increase surface area and softness while helping the paper absorb more."),
+            Feature("Fun Fact", "The average person uses about 100 rolls (20,000 sheets) of toilet paper per year! That's 384 trees in a lifetime."),
+        ),
+    ),
+    "paper towel": ObjectCard(
+        name="Paper Towel",
+        category="Everyday Object",
+        features=(
+            Feature("Absorption", "Paper towels absorb water through capillary action — water molecules are attracted to cellulose fibers and climb into tiny spaces between them."),
+            Feature("Strength", "Wet strength comes from special resins bonding the fibers. Without these resins, paper disintegrates when wet."),
+            Feature("History", "Invented accidentally by Arthur Scott in 1907 when a toilet paper roll was made too thick. He cut it into towels instead of tossing it."),
+            Feature("Fun Fact", "Bouncing water off a surface with a paper towel demonstrates hydrophobic properties some brands add to their towels!"),
+        ),
+    ),
+    "water jug": ObjectCard(
+        name="Water Jug / Pitcher",
+        category="Kitchen Item",
+        features=(
+            Feature("Material", "Can be glass, ceramic, plastic, or stainless steel. Glass is non-reactive and won't leach chemicals into water."),
+            Feature("Filtration", "Filter jugs use activated carbon (charcoal) which has millions of tiny pores. One gram has the surface area of 4 tennis courts!"),
+            Feature("Water Science", "Water is called the 'universal solvent' because its polar molecules can dissolve more substances than any other liquid."),
+            Feature("Fun Fact", "Hot water freezes faster than cold water in some conditions — this is called the Mpemba effect, and it's still not fully explained!"),
+        ),
+    ),
+    "toothbrush": ObjectCard(
+        name="Toothbrush",
+        category="Personal Care",
+        features=(
+            Feature("Bristles", "Modern bristles are nylon (invented 1938). Before that, pig hair, horse hair, or bird feathers!"),
+            Feature("Teeth", "Tooth enamel is the hardest substance in your body — harder than steel! But it can't regenerate once damaged."),
+            Feature("Hygiene", "Your mouth has 700+ species of bacteria. Brushing removes plaque — the sticky biofilm bacteria form on teeth."),
+            Feature("Fun Fact", "The first toothbrush was invented in China in 1498 using bamboo and boar bristles!"),
+        ),
+    ),
+    "hand towel": ObjectCard(
+        name="Towel",
+        category="Everyday Object",
+        features=(
+            Feature("Material", "Terry cloth towels have tiny loops (called pile) that increase surface area dramatically, allowing them to absorb 27x their weight in water."),
+            Feature("Absorption", "Cotton fibers are hollow and hydrophilic — they attract water through capillary action, pulling moisture into the fiber structure."),
+            Feature("Hygiene", "Damp towels can grow bacteria rapidly. Wash them every 3-4 uses and hang to dry between uses to prevent microbial growth."),
+            Feature("Fun Fact", "Towel Day is celebrated annually on May 25th — a tribute to Douglas Adams' 'The Hitchhiker's Guide to the Galaxy' where towels are essential!"),
+        ),
+    ),
 }
+# Read-only all the way down (frozen cards holding tuples of frozen Features),
+# so the shared table can be handed out without defensive copies
+OBJECT_FEATURES = MappingProxyType(OBJECT_FEATURES)
 
 # ── Aliases: map various MobileNet labels to the same features ──
 
-ALIASES = {
+ALIASES: Mapping[str, str] = MappingProxyType({
     # Technology
     "notebook computer": "laptop",
     "portable computer": "laptop",
@@ -749,222 +778,652 @@ ALIASES = {
     "mailbag": "backpack",
     "purse": "backpack",
     "wallet": "backpack",
-}
+})
 
 # ── Quiz questions ──────────────────────────────────────────
 
-OBJECT_QUIZZES: Dict[str, List[dict]] = {
-    "bottle": [
-        {"question": "What is the chemical formula of water?", "options": ["CO₂", "H₂O", "O₂", "NaCl"], "correct": 1, "explanation": {"correct": "Correct! Water is H₂O — two hydrogen atoms bonded to one oxygen atom.", "wrong": "It's H₂O — two hydrogen (H) atoms and one oxygen (O) atom bonded together."}},
-        {"question": "At what temperature does water boil?", "options": ["50°C", "100°C", "150°C", "200°C"], "correct": 1, "explanation": {"correct": "Correct! Water boils at 100°C (212°F) at sea level.", "wrong": "Water boils at 100°C (212°F) at standard atmospheric pressure."}},
-    ],
-    "laptop": [
-        {"question": "What does CPU stand for?", "options": ["Central Processing Unit", "Computer Power Unit", "Central Power Utility", "Core Processing Unit"], "correct": 0, "explanation": {"correct": "Correct! CPU = Central Processing Unit — the 'brain' of your computer.", "wrong": "CPU stands for Central Processing Unit — it executes instructions and processes data."}},
-        {"question": "Which component stores data permanently?", "options": ["RAM", "CPU", "SSD/Hard Drive", "GPU"], "correct": 2, "explanation": {"correct": "Correct! SSDs and hard drives retain data even when powered off.", "wrong": "SSD/Hard Drive stores data permanently. RAM loses data when power is off."}},
-    ],
-    "cell phone": [
-        {"question": "What type of waves does WiFi use?", "options": ["Sound waves", "Radio waves", "X-rays", "Light waves"], "correct": 1, "explanation": {"correct": "Correct! WiFi uses radio waves at 2.4 GHz or 5 GHz frequency.", "wrong": "WiFi uses radio waves — same type as FM radio, just at different frequencies."}},
-    ],
-    "cellular telephone": [
-        {"question": "What type of waves does WiFi use?", "options": ["Sound waves", "Radio waves", "X-rays", "Light waves"], "correct": 1, "explanation": {"correct": "Correct! WiFi uses radio waves at 2.4 GHz or 5 GHz.", "wrong": "WiFi uses radio waves, similar to FM radio but at different frequencies."}},
-    ],
-    "ceiling fan": [
-        {"question": "How does a fan cool you down?", "options": ["It makes cold air", "It removes heat from air", "It speeds up sweat evaporation", "It lowers room temperature"], "correct": 2, "explanation": {"correct": "Correct! Fans create airflow that speeds up sweat evaporation, providing a wind-chill effect.", "wrong": "Fans don't actually cool air — they create wind-chill by speeding up sweat evaporation from your skin."}},
-        {"question": "How much energy does a ceiling fan use vs an AC?", "options": ["Same amount", "50x less", "2x less", "10x more"], "correct": 1, "explanation": {"correct": "Correct! Ceiling fans use only 15-75 watts vs 1500-3000 watts for AC — about 50x less!", "wrong": "A ceiling fan uses only 15-75 watts compared to 1500-3000 watts for an air conditioner — about 50x less energy!"}},
-    ],
-    "electric fan": [
-        {"question": "A fan actually cools you by...", "options": ["Lowering air temperature", "Producing cold air", "Speeding up sweat evaporation", "Filtering warm air"], "correct": 2, "explanation": {"correct": "Correct! The wind-chill effect from airflow speeds up evaporation of sweat from your skin.", "wrong": "Fans create a wind-chill effect — moving air speeds up sweat evaporation, making you feel cooler without actually lowering the air temperature."}},
-    ],
-    "banana": [
-        {"question": "Which mineral are bananas famous for?", "options": ["Iron", "Calcium", "Potassium", "Zinc"], "correct": 2, "explanation": {"correct": "Correct! Bananas have ~422mg potassium, essential for nerve and muscle function.", "wrong": "Bananas are rich in potassium — about 422mg per banana."}},
-    ],
-    "apple": [
-        {"question": "Why do apples float in water?", "options": ["They're hollow", "They're 25% air", "They have wax coating", "They repel water"], "correct": 1, "explanation": {"correct": "Correct! Apples are about 25% air, making them less dense than water.", "wrong": "Apples are approximately 25% air due to tiny pockets between cells."}},
-    ],
-    "potted plant": [
-        {"question": "What gas do plants absorb during photosynthesis?", "options": ["Oxygen", "Nitrogen", "Carbon Dioxide", "Hydrogen"], "correct": 2, "explanation": {"correct": "Correct! Plants absorb CO₂ and use it with sunlight and water to make glucose.", "wrong": "Plants absorb Carbon Dioxide (CO₂) and use it + sunlight + water to produce glucose and oxygen."}},
-    ],
-    "person": [
-        {"question": "How many bones does an adult human have?", "options": ["106", "206", "306", "406"], "correct": 1, "explanation": {"correct": "Correct! Adults have 206 bones. Babies have ~270 that fuse together.", "wrong": "Adults have 206 bones. Babies are born with ~270, many of which fuse during growth."}},
-    ],
-    "scissors": [
-        {"question": "What type of simple machine are scissors?", "options": ["Pulley", "Wedge", "Lever", "Wheel"], "correct": 2, "explanation": {"correct": "Correct! Scissors are two Class 1 levers joined at a fulcrum.", "wrong": "Scissors are a type of lever — two Class 1 levers joined at a pivot point."}},
-    ],
-    "clock": [
-        {"question": "How many times does a quartz crystal vibrate per second?", "options": ["100", "1,000", "32,768", "1,000,000"], "correct": 2, "explanation": {"correct": "Correct! Quartz crystals vibrate exactly 32,768 times per second when voltage is applied.", "wrong": "Quartz crystals vibrate exactly 32,768 times per second — this frequency is used to keep precise time."}},
-    ],
-    "table lamp": [
-        {"question": "How much less energy does an LED use vs incandescent?", "options": ["10% less", "25% less", "50% less", "75% less"], "correct": 3, "explanation": {"correct": "Correct! LEDs use 75% less energy than incandescent bulbs while producing the same brightness.", "wrong": "LED bulbs use 75% less energy — a 10W LED equals a 60W incandescent in brightness!"}},
-    ],
-    "book": [
-        {"question": "When was the first printed book made?", "options": ["1055", "1255", "1455", "1655"], "correct": 2, "explanation": {"correct": "Correct! The Gutenberg Bible (1455) was the first major book printed with movable type.", "wrong": "The Gutenberg Bible was printed in 1455, marking the start of mass-produced books in Europe."}},
-    ],
-    "microwave": [
-        {"question": "How was the microwave invented?", "options": ["Carefully designed", "By accident", "Military project", "Science fair"], "correct": 1, "explanation": {"correct": "Correct! Percy Spencer noticed a candy bar melted in his pocket near a radar magnetron in 1945.", "wrong": "The microwave was invented by accident in 1945 when engineer Percy Spencer noticed a chocolate bar melted near a radar device."}},
-    ],
-}
+@dataclass(frozen=True, slots=True)
+class Quiz:
+    question: str
+    options: Tuple[str, ...]
+    correct_index: int
+    correct_explanation: str
+    wrong_explanation: str
 
-# Also add quiz aliases
-QUIZ_ALIASES = {
-    "notebook computer": "laptop",
-    "portable computer": "laptop",
-    "cellular telephone": "cell phone",
-    "smartphone": "cell phone",
-    "hand-held computer": "cell phone",
-    "fan": "electric fan",
-    "propeller": "electric fan",
-    "lamp": "table lamp",
+
+# Shared by both ImageNet names for a phone, so the copies can't drift apart
+_PHONE_QUIZZES = (
+    Quiz("What type of waves does WiFi use?", ("Sound waves", "Radio waves", "X-rays", "Light waves"), 1, "Correct! WiFi uses radio waves at 2.4 GHz or 5 GHz frequency.", "WiFi uses radio waves — same type as FM radio, just at different frequencies."),
+)
+
+OBJECT_QUIZZES: Mapping[str, Tuple[Quiz, ...]] = MappingProxyType({
+    "bottle": (
+        Quiz("What is the chemical formula of water?", ("CO₂", "H₂O", "O₂", "NaCl"), 1, "Correct! Water is H₂O — two hydrogen atoms bonded to one oxygen atom.", "It's H₂O — two hydrogen (H) atoms and one oxygen (O) atom bonded together."),
+        Quiz("At what temperature does water boil?", ("50°C", "100°C", "150°C", "200°C"), 1, "Correct! Water boils at 100°C (212°F) at sea level.", "Water boils at 100°C (212°F) at standard atmospheric pressure."),
+    ),
+    "laptop": (
+        Quiz("What does CPU stand for?", ("Central Processing Unit", "Computer Power Unit", "Central Power Utility", "Core Processing Unit"), 0, "Correct! CPU = Central Processing Unit — the 'brain' of your computer.", "CPU stands for Central Processing Unit — it executes instructions and processes data."),
+        Quiz("Which component stores data permanently?", ("RAM", "CPU", "SSD/Hard Drive", "GPU"), 2, "Correct! SSDs and hard drives retain data even when powered off.", "SSD/Hard Drive stores data permanently. RAM loses data when power is off."),
+    ),
+    "cell phone": _PHONE_QUIZZES,
+    "cellular telephone": _PHONE_QUIZZES,
+    "ceiling fan": (
+        Quiz("How does a fan cool you down?", ("It makes cold air", "It removes heat from air", "It speeds up sweat evaporation", "It lowers room temperature"), 2, "Correct! Fans create airflow that speeds up sweat evaporation, providing a wind-chill effect.", "Fans don't actually cool air — they create wind-chill by speeding up sweat evaporation from your skin."),
+        Quiz("How much energy does a ceiling fan use vs an AC?", ("Same amount", "50x less", "2x less", "10x more"), 1, "Correct! Ceiling fans use only 15-75 watts vs 1500-3000 watts for AC — about 50x less!", "A ceiling fan uses only 15-75 watts compared to 1500-3000 watts for an air conditioner — about 50x less energy!"),
+    ),
+    "electric fan": (
+        Quiz("A fan actually cools you by...", ("Lowering air temperature", "Producing cold air", "Speeding up sweat evaporation", "Filtering warm air"), 2, "Correct! The wind-chill effect from airflow speeds up evaporation of sweat from your skin.", "Fans create a wind-chill effect — moving air speeds up sweat evaporation, making you feel cooler without actually lowering the air temperature."),
+    ),
+    "banana": (
+        Quiz("Which mineral are bananas famous for?", ("Iron", "Calcium", "Potassium", "Zinc"), 2, "Correct! Bananas have ~422mg potassium, essential for nerve and muscle function.", "Bananas are rich in potassium — about 422mg per banana."),
+    ),
+    "apple": (
+        Quiz("Why do apples float in water?", ("They're hollow", "They're 25% air", "They have wax coating", "They repel water"), 1, "Correct! Apples are about 25% air, making them less dense than water.", "Apples are approximately 25% air due to tiny pockets between cells."),
+    ),
+    "potted plant": (
+        Quiz("What gas do plants absorb during photosynthesis?", ("Oxygen", "Nitrogen", "Carbon Dioxide", "Hydrogen"), 2, "Correct! Plants absorb CO₂ and use it with sunlight and water to make glucose.", "Plants absorb Carbon Dioxide (CO₂) and use it + sunlight + water to produce glucose and oxygen."),
+    ),
+    "person": (
+        Quiz("How many bones does an adult human have?", ("106", "206", "306", "406"), 1, "Correct! Adults have 206 bones. Babies have ~270 that fuse together.", "Adults have 206 bones. Babies are born with ~270, many of which fuse during growth."),
+    ),
+    "scissors": (
+        Quiz("What type of simple machine are scissors?", ("Pulley", "Wedge", "Lever", "Wheel"), 2, "Correct! Scissors are two Class 1 levers joined at a fulcrum.", "Scissors are a type of lever — two Class 1 levers joined at a pivot point."),
+    ),
+    "clock": (
+        Quiz("How many times does a quartz crystal vibrate per second?", ("100", "1,000", "32,768", "1,000,000"), 2, "Correct! Quartz crystals vibrate exactly 32,768 times per second when voltage is applied.", "Quartz crystals vibrate exactly 32,768 times per second — this frequency is used to keep precise time."),
+    ),
+    "table lamp": (
+        Quiz("How much less energy does an LED use vs incandescent?", ("10% less", "25% less", "50% less", "75% less"), 3, "Correct! LEDs use 75% less energy than incandescent bulbs while producing the same brightness.", "LED bulbs use 75% less energy — a 10W LED equals a 60W incandescent in brightness!"),
+    ),
+    "book": (
+        Quiz("When was the first printed book made?", ("1055", "1255", "1455", "1655"), 2, "Correct! The Gutenberg Bible (1455) was the first major book printed with movable type.", "The Gutenberg Bible was printed in 1455, marking the start of mass-produced books in Europe."),
+    ),
+    "microwave": (
+        Quiz("How was the microwave invented?", ("Carefully designed", "By accident", "Military project", "Science fair"), 1, "Correct! Percy Spencer noticed a candy bar melted in his pocket near a radar magnetron in 1945.", "The microwave was invented by accident in 1945 when engineer Percy Spencer noticed a chocolate bar melted near a radar device."),
+    ),
+})
+
+# Quiz-only redirects for labels that keep their own feature card but share
+# another object's questions. Everything else resolves through ALIASES.
+QUIZ_ALIASES: Mapping[str, str] = MappingProxyType({
     "desk lamp": "table lamp",
     "lampshade": "table lamp",
     "wall clock": "clock",
     "analog clock": "clock",
     "digital clock": "clock",
-    "stopwatch": "clock",
-    "granny smith": "apple",
     "water bottle": "bottle",
-    "pop bottle": "bottle",
-    "wine bottle": "bottle",
-    "coffee mug": "cup",
-    "espresso": "cup",
     "flowerpot": "potted plant",
     "book jacket": "book",
     "running shoe": "person",
     "ballpoint": "book",
     "pencil": "book",
-}
+})
 
 
 # ── Service Functions ──────────────────────────────────────────
 
+class _PartialMatcher:
+    """Find the first key (in dict order) that occurs in a name or contains it.
+
+    Equivalent to ``next(k for k in keys if k in name or name in k)``, but
+    done as one Aho-Corasick scan of the name (keys inside the name) plus one
+    ``str.find`` over all keys joined by NULs (name inside a key).
+    """
+
+    __slots__ = ("keys", "joined", "starts", "automaton")
+
+    def __init__(self, keys):
+        self.keys = tuple(keys)
+        self.joined = "\0".join(self.keys)
+        self.starts = []
+        pos = 0
+        for key in self.keys:
+            self.starts.append(pos)
+            pos += len(key) + 1
+        self.automaton = None
+        if ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for order, key in enumerate(self.keys):
+                self.automaton.add_word(key, order)
+            self.automaton.make_automaton()
+
+    def match(self, name: str) -> Optional[str]:
+        if self.automaton is None or "\0" in name:
+            # np.char.find is no faster here: it loops per element too, and its
+            # array setup makes it 5x slower at this table's size
+            return next((k for k in self.keys if k in name or name in k), None)
+        best = min((order for _, order in self.automaton.iter(name)), default=len(self.keys))
+        pos = self.joined.find(name)
+        if pos != -1:
+            best = min(best, bisect.bisect_right(self.starts, pos) - 1)
+        return self.keys[best] if best < len(self.keys) else None
+
+
+# Lookup tables built once at import. The keys above are already lowercase;
+# the prebuilt responses are shared, so they are handed out as read-only views.
+_FEATURE_MATCHER = _PartialMatcher(OBJECT_FEATURES)
+# Plain {"title", "detail"} dicts per object (dataclasses.asdict deep-copies
+# and was the bulk of this module's import time)
+_FEATURE_DICTS = {
+    key: [{"title": feature.title, "detail": feature.detail} for feature in data.features]
+    for key, data in OBJECT_FEATURES.items()
+}
+# Exact bytes of the /object-features response body for each pre-built object
+_FEATURE_JSON = {
+    key: orjson.dumps({"name": data.name, "category": data.category, "features": _FEATURE_DICTS[key]})
+    for key, data in OBJECT_FEATURES.items()
+}
+_FEATURE_RESPONSES = {
+    key: MappingProxyType({
+        "found": True,
+        "name": data.name,
+        "category": data.category,
+        "features": tuple(map(MappingProxyType, _FEATURE_DICTS[key])),
+    })
+    for key, data in OBJECT_FEATURES.items()
+}
+_QUIZ_MATCHER = _PartialMatcher(OBJECT_QUIZZES)
+# Quizzes are served round-robin from a shuffled order so a learner doesn't
+# see the same question twice in a row. Each cycle entry pairs a quiz with
+# the pre-serialized /quiz response body; objects without questions get no
+# cycle, so they look up as None.
+_QUIZ_CYCLES = {
+    key: itertools.cycle([
+        (quiz, orjson.dumps({"question": quiz.question, "options": quiz.options}))
+        for quiz in random.sample(quizzes, len(quizzes))
+    ])
+    for key, quizzes in OBJECT_QUIZZES.items()
+    if quizzes
+}
+
 
-def _resolve_alias(name: str) -> str:
-    """Resolve an object name through aliases to find matching features."""
-    lower = name.lower().strip()
-    if lower in ALIASES:
-        return ALIASES[lower]
-    return lower
+def _resolve_alias(normalized: str) -> str:
+    """Resolve a normalized object name through aliases to find matching features."""
+    return ALIASES.get(normalized, normalized)
 
 
-def get_object_features(object_name: str) -> dict:
-    """Return pre-built educational features for a detected object."""
-    resolved = _resolve_alias(object_name)
+def _find_feature_key(normalized: str) -> Optional[str]:
+    """Match a normalized object name to its OBJECT_FEATURES key."""
+    resolved = _resolve_alias(normalized)
 
     # Direct match
     if resolved in OBJECT_FEATURES:
-        data = OBJECT_FEATURES[resolved]
-        return {
-            "found": True,
-            "name": data["name"],
-            "category": data["category"],
-            "features": data["features"],
-        }
+        return resolved
 
     # Partial / substring match
-    for key, data in OBJECT_FEATURES.items():
-        if key in resolved or resolved in key:
-            return {
-                "found": True,
-                "name": data["name"],
-                "category": data["category"],
-                "features": data["features"],
-            }
+    return _FEATURE_MATCHER.match(resolved)
+
+
+# Every known name, normalized, mapped to its key. Detector labels usually
+# arrive normalized and resolve with one probe; other spellings ("Cell Phone ")
+# and unknown names go through the memoized _feature_key.
+_KNOWN_FEATURE_NAMES = {
+    name: key
+    for name in (*OBJECT_FEATURES, *ALIASES)
+    if (key := _find_feature_key(name)) is not None
+}
+
+
+# The same index with the values resolved, so a known label reaches its
+# response in one probe
+_LABEL_TO_FEATURES = {name: _FEATURE_RESPONSES[key] for name, key in _KNOWN_FEATURE_NAMES.items()}
+_LABEL_TO_FEATURE_JSON = {name: _FEATURE_JSON[key] for name, key in _KNOWN_FEATURE_NAMES.items()}
+
 
+# Callers index the per-key tables with these results, not the label tables:
+# a key can also be an alias of another object ("notebook").
+@lru_cache(maxsize=2048)
+def _feature_key(object_name: str) -> Optional[str]:
+    """Resolve any spelling of an object name to its OBJECT_FEATURES key (memoized)."""
+    return _find_feature_key(object_name.lower().strip())
+
+
+def _known_card(object_name: str) -> Optional[ObjectCard]:
+    """Return the pre-built card for an object name, or None (no response dict built)."""
+    key = _KNOWN_FEATURE_NAMES.get(object_name)
+    if key is None:
+        key = _feature_key(object_name)
+    return None if key is None else OBJECT_FEATURES[key]
+
+
+def get_object_features(object_name: str) -> Mapping:
+    """Return pre-built educational features for a detected object (read-only on a hit)."""
+    response = _LABEL_TO_FEATURES.get(object_name)
+    if response is None and (key := _feature_key(object_name)) is not None:
+        response = _FEATURE_RESPONSES[key]
+    if response is not None:
+        return response
     return {"found": False, "name": object_name, "category": "Object", "features": []}
 
 
+def get_object_features_json(object_name: str) -> Optional[bytes]:
+    """Return the serialized features response for a pre-built object, or None."""
+    body = _LABEL_TO_FEATURE_JSON.get(object_name)
+    if body is None and (key := _feature_key(object_name)) is not None:
+        body = _FEATURE_JSON[key]
+    return body
+
+
+LLM_FEATURE_CACHE_TTL = 3600  # seconds
+LLM_FEATURE_CACHE_SIZE = 512
+
+# normalized object name → (expires_at, features), least recently used first
+_llm_feature_cache: "OrderedDict[str, tuple]" = OrderedDict()
+# normalized object name → LLM call in flight, shared by concurrent requests
+_llm_feature_inflight: Dict[str, asyncio.Future] = {}
+# unknown labels requested since the last flush to the shared cache
+_llm_label_hits: Counter = Counter()
+
+
 async def generate_object_features_llm(object_name: str) -> list:
-    """Generate educational features for an unknown object via LLM."""
-    system_prompt = (
-        "You are an educational assistant. A student has shown an object to their camera. "
-        "Generate exactly 4 educational features about this object. "
-        "Each feature should have a short title (1-2 words) and a detailed explanation (1-2 sentences, max 30 words). "
-        "Cover: what it's made of, how it works, a science fact, and a fun fact. "
-        "Format each feature on a new line as: Title: Detail"
+    """Generate educational features for an unknown object via LLM (cached per object name)."""
+    key = object_name.lower().strip()
+    cached = _cached_llm_features(key)
+    if cached is not None:
+        return cached
+
+    # Camera frames repeat the same label; coalesce them onto one LLM call
+    task = _llm_feature_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_generate_object_features(object_name, key))
+        _llm_feature_inflight[key] = task
+        task.add_done_callback(lambda _: _llm_feature_inflight.pop(key, None))
+    # shield: one client disconnecting must not cancel the call for the others
+    return await asyncio.shield(task)
+
+
+FEATURES_PER_OBJECT = 4  # what the prompts below ask for
+
+FEATURE_SYSTEM_PROMPT = (
+    "You are an educational assistant. A student has shown an object to their camera. "
+    "Generate exactly 4 educational features about this object. "
+    "Each feature should have a short title (1-2 words) and a detailed explanation (1-2 sentences, max 30 words). "
+    "Cover: what it's made of, how it works, a science fact, and a fun fact. "
+    "Format each feature on a new line as: Title: Detail"
+)
+
+BATCH_FEATURE_SYSTEM_PROMPT = (
+    "You are an educational assistant. A student has shown several objects to their camera. "
+    "For EACH object, generate exactly 4 educational features. "
+    "Each feature should have a short title (1-2 words) and a detailed explanation (1-2 sentences, max 30 words). "
+    "Cover: what it's made of, how it works, a science fact, and a fun fact. "
+    "Start each object with a line 'OBJECT: <name>' using the name exactly as given, "
+    "then put each feature on a new line as: Title: Detail. "
+    "Separate objects with a line containing only ---"
+)
+
+
+def _cached_llm_features(key: str) -> Optional[list]:
+    """Unexpired cached features for *key* (now the most recently used), or None."""
+    cached = _llm_feature_cache.get(key)
+    if cached is None or cached[0] <= time.monotonic():
+        return None
+    _llm_feature_cache.move_to_end(key)
+    return cached[1]
+
+
+def _store_llm_features(key: str, features: list):
+    _llm_feature_cache[key] = (time.monotonic() + LLM_FEATURE_CACHE_TTL, features)
+    _llm_feature_cache.move_to_end(key)
+    if len(_llm_feature_cache) > LLM_FEATURE_CACHE_SIZE:
+        _llm_feature_cache.popitem(last=False)
+
+
+# ── Shared LLM feature cache ──────────────────────────────────
+# Each uvicorn worker process has its own in-memory cache; this SQLite table
+# lets the workers reuse each other's LLM answers. Only consulted on an
+# in-memory miss, where the alternative is a multi-second LLM call.
+
+def _shared_cache_connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(settings.LLM_CACHE_DB, timeout=5.0)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS llm_features ("
+        "key TEXT PRIMARY KEY, features TEXT NOT NULL, expires_at REAL NOT NULL)"
     )
-    prompt = f"Generate 4 educational features about: {object_name}"
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS llm_label_counts ("
+        "key TEXT PRIMARY KEY, hits INTEGER NOT NULL)"
+    )
+    return conn
 
-    result = None
-    if await check_ollama_available():
-        result = await generate_with_ollama(prompt, system_prompt)
-
-    if not result or len(result) < 30:
-        result = await generate_with_pollinations(prompt, system_prompt)
-
-    if result and len(result) > 30:
-        features = []
-        for line in result.strip().split("\n"):
-            line = line.strip().lstrip("0123456789.-) ")
-            if ":" in line:
-                parts = line.split(":", 1)
-                title = parts[0].strip().strip("*#")
-                detail = parts[1].strip()
-                if title and detail:
-                    features.append({"title": title, "detail": detail})
-        if features:
-            return features[:5]
 
+def _shared_features_get(keys: List[str]) -> Dict[str, list]:
+    """Return {key: features} for the unexpired entries among *keys*."""
+    try:
+        with closing(_shared_cache_connect()) as conn:
+            rows = conn.execute(
+                f"SELECT key, features FROM llm_features "
+                f"WHERE key IN ({','.join('?' * len(keys))}) AND expires_at > ?",
+                (*keys, time.time()),
+            ).fetchall()
+    except sqlite3.Error as e:
+        logger.warning(f"Shared LLM cache read failed: {e}")
+        return {}
+    return {key: orjson.loads(features) for key, features in rows}
+
+
+def _shared_features_put(items: Dict[str, list]):
+    now = time.time()
+    try:
+        with closing(_shared_cache_connect()) as conn, conn:
+            conn.execute("DELETE FROM llm_features WHERE expires_at <= ?", (now,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO llm_features VALUES (?, ?, ?)",
+                [(key, orjson.dumps(features), now + settings.LLM_CACHE_TTL) for key, features in items.items()],
+            )
+    except sqlite3.Error as e:
+        logger.warning(f"Shared LLM cache write failed: {e}")
+
+
+async def _remember_llm_features(items: Dict[str, list]):
+    """Cache freshly generated features in this process and for the other workers."""
+    for key, features in items.items():
+        _store_llm_features(key, features)
+    await asyncio.to_thread(_shared_features_put, items)
+    await flush_label_counts()
+
+
+def _shared_counts_add(counts: Dict[str, int]):
+    try:
+        with closing(_shared_cache_connect()) as conn, conn:
+            conn.executemany(
+                "INSERT INTO llm_label_counts VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET hits = hits + excluded.hits",
+                counts.items(),
+            )
+    except sqlite3.Error as e:
+        logger.warning(f"Shared LLM label count write failed: {e}")
+
+
+def _shared_top_labels(limit: int) -> List[str]:
+    try:
+        with closing(_shared_cache_connect()) as conn:
+            rows = conn.execute(
+                "SELECT key FROM llm_label_counts ORDER BY hits DESC LIMIT ?", (limit,)
+            ).fetchall()
+    except sqlite3.Error as e:
+        logger.warning(f"Shared LLM label count read failed: {e}")
+        return []
+    return [key for key, in rows]
+
+
+def record_unknown_labels(object_names: List[str]):
+    """Count requests for objects without a pre-built card (feeds warm_llm_cache)."""
+    _llm_label_hits.update(name.lower().strip() for name in object_names)
+
+
+async def flush_label_counts():
+    """Add the unknown-label request counts gathered so far to the shared table."""
+    if not _llm_label_hits:
+        return
+    counts = dict(_llm_label_hits)
+    _llm_label_hits.clear()
+    await asyncio.to_thread(_shared_counts_add, counts)
+
+
+# Everyday objects MobileNet reports that have no pre-built card
+WARM_SEED_LABELS = ("fork", "spoon", "knife", "headphones", "watch")
+WARM_TOP_LABELS = 20
+
+
+async def warm_llm_cache(labels: Optional[List[str]] = None):
+    """
+    Generate features ahead of time for the seed labels plus the unknown
+    labels requested most often so far, so the first detection of a
+    popular object doesn't wait on the LLM.
+    Labels already in the shared cache cost one SQLite lookup.
+    """
+    if labels is None:
+        top = await asyncio.to_thread(_shared_top_labels, WARM_TOP_LABELS)
+        labels = [*WARM_SEED_LABELS, *top]
+    labels = [name for name in dict.fromkeys(labels) if _known_card(name) is None]
+    if not labels:
+        return
+
+    # batches of the same size the /objects-features route allows
+    chunks = [labels[i:i + 10] for i in range(0, len(labels), 10)]
+    results = await asyncio.gather(
+        *(generate_object_features_llm_batch(chunk) for chunk in chunks),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning(f"LLM cache warm-up failed: {result}")
+    logger.info(f"LLM feature cache warmed for {len(labels)} labels")
+
+
+def _fallback_features(object_name: str) -> list:
     return [
         {"title": "Identified", "detail": f"This is a {object_name}. Point your camera at common objects to learn more!"},
         {"title": "Explore", "detail": "Try showing bottles, phones, books, fruits, or plants for detailed educational content."},
     ]
 
 
-def get_object_quiz(object_name: str) -> Optional[dict]:
-    """Get a quiz question about the detected object."""
-    resolved = _resolve_alias(object_name)
+def _has_enough_features(text: str) -> bool:
+    return len(parse_features(text)) >= FEATURES_PER_OBJECT
+
+
+# A burst of distinct unknown objects (many cameras, the startup warm-up)
+# queues here instead of flooding a local Ollama or Pollinations' rate limit
+_llm_slots = asyncio.Semaphore(settings.LLM_CONCURRENCY)
+
+
+async def _ask_llm(prompt: str, system_prompt: str, **options) -> str:
+    """Race the LLM backends for feature text, giving up after LLM_FEATURE_TIMEOUT."""
+    # Imported here so card lookups don't load the HTTP/LLM stack
+    from app.services.llm_service import generate_with_fastest_backend
+
+    async def ask() -> str:
+        async with _llm_slots:
+            return await generate_with_fastest_backend(
+                prompt, system_prompt, min_length=31, keep_lines=True, **options,
+            )
+
+    # The client timeouts bound each read, not a reply that keeps trickling in;
+    # past the deadline (queueing included) the caller gets its fallback
+    # instead of a hung request
+    try:
+        return await asyncio.wait_for(ask(), settings.LLM_FEATURE_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(f"LLM feature generation timed out after {settings.LLM_FEATURE_TIMEOUT:g}s")
+        return ""
+
+
+async def _generate_object_features(object_name: str, key: str) -> list:
+    shared = (await asyncio.to_thread(_shared_features_get, [key])).get(key)
+    if shared:
+        _store_llm_features(key, shared)
+        return shared
+
+    prompt = f"Generate 4 educational features about: {object_name}"
+
+    # Race both backends; the first usable answer wins
+    # The prompt asks for 4 features; stop the stream as soon as they're in
+    result = await _ask_llm(prompt, FEATURE_SYSTEM_PROMPT, stop_when=_has_enough_features)
+
+    if result:
+        features = parse_features(result)
+        if features:
+            await _remember_llm_features({key: features})
+            return features
+
+    return _fallback_features(object_name)
+
+
+async def _generate_features_batch(batch: Dict[str, str]) -> Dict[str, list]:
+    """One LLM call for {normalized key: name}; returns the objects it answered."""
+    prompt = "Generate 4 educational features about each of these objects:\n" + "\n".join(batch.values())
+    result = await _ask_llm(prompt, BATCH_FEATURE_SYSTEM_PROMPT)
+    parsed = parse_batch_features(result) if result else {}
+    generated = {key: parsed[key] for key in batch if parsed.get(key)}
+    if generated:
+        await _remember_llm_features(generated)
+    return generated
+
+
+async def _batch_member_features(batch_task: asyncio.Future, object_name: str, key: str) -> list:
+    """One object's share of a batched call, generated alone if the batch missed it."""
+    features = (await batch_task).get(key)
+    return features if features else await _generate_object_features(object_name, key)
+
+
+async def generate_object_features_llm_batch(object_names: List[str]) -> Dict[str, list]:
+    """
+    Generate features for several unknown objects with one LLM call.
+    Returns {object_name: features}; objects the batched answer misses fall
+    back to individual generate_object_features_llm calls.
+    """
+    by_key: Dict[str, list] = {}
+    pending: Dict[str, str] = {}  # normalized key → name as given
+    for name in object_names:
+        key = name.lower().strip()
+        if key in by_key or key in pending:
+            continue
+        cached = _cached_llm_features(key)
+        if cached is not None:
+            by_key[key] = cached
+        else:
+            pending[key] = name
+
+    # Another worker may already have generated some of them
+    if pending:
+        shared = await asyncio.to_thread(_shared_features_get, list(pending))
+        for key, features in shared.items():
+            _store_llm_features(key, features)
+            by_key[key] = features
+            del pending[key]
+
+    # Objects another request is already generating just join that call below.
+    # The rest go out as one call, with a per-object task registered for each
+    # so concurrent single requests join the batch instead of asking again
+    batch = {key: pending[key] for key in pending if key not in _llm_feature_inflight}
+    if len(batch) > 1:
+        batch_task = asyncio.ensure_future(_generate_features_batch(batch))
+        for key, name in batch.items():
+            task = asyncio.ensure_future(_batch_member_features(batch_task, name, key))
+            _llm_feature_inflight[key] = task
+            task.add_done_callback(lambda _, key=key: _llm_feature_inflight.pop(key, None))
+
+    # Batch members, requests already in flight, and single unknowns
+    if pending:
+        generated = await asyncio.gather(*(generate_object_features_llm(name) for name in pending.values()))
+        by_key.update(zip(pending, generated))
+
+    return {name: by_key[name.lower().strip()] for name in object_names}
+
+
+def _find_quiz_key(normalized: str) -> Optional[str]:
+    """Match a normalized object name to its OBJECT_QUIZZES key."""
+    resolved = _resolve_alias(normalized)
 
     # Direct match in quizzes
     if resolved in OBJECT_QUIZZES:
-        quiz = random.choice(OBJECT_QUIZZES[resolved])
-        return {
-            "question": quiz["question"],
-            "options": quiz["options"],
-            "correct_index": quiz["correct"],
-            "explanations": quiz["explanation"],
-        }
+        return resolved
 
     # Check quiz-specific aliases
-    lower = object_name.lower().strip()
-    if lower in QUIZ_ALIASES:
-        alias_key = QUIZ_ALIASES[lower]
+    if normalized in QUIZ_ALIASES:
+        alias_key = QUIZ_ALIASES[normalized]
         if alias_key in OBJECT_QUIZZES:
-            quiz = random.choice(OBJECT_QUIZZES[alias_key])
-            return {
-                "question": quiz["question"],
-                "options": quiz["options"],
-                "correct_index": quiz["correct"],
-                "explanations": quiz["explanation"],
-            }
+            return alias_key
 
     # Partial match
-    for key, quizzes in OBJECT_QUIZZES.items():
-        if key in resolved or resolved in key:
-            quiz = random.choice(quizzes)
-            return {
-                "question": quiz["question"],
-                "options": quiz["options"],
-                "correct_index": quiz["correct"],
-                "explanations": quiz["explanation"],
-            }
+    return _QUIZ_MATCHER.match(resolved)
+
 
+# Same shortcut as _KNOWN_FEATURE_NAMES, for the quiz tables
+_KNOWN_QUIZ_NAMES = {
+    name: key
+    for name in (*OBJECT_QUIZZES, *QUIZ_ALIASES, *ALIASES)
+    if (key := _find_quiz_key(name)) is not None
+}
+
+
+@lru_cache(maxsize=2048)
+def _quiz_key(object_name: str) -> Optional[str]:
+    """Resolve any spelling of an object name to its OBJECT_QUIZZES key (memoized)."""
+    return _find_quiz_key(object_name.lower().strip())
+
+
+# Label -> resolved values, like _LABEL_TO_FEATURES
+_LABEL_TO_QUIZZES = {name: OBJECT_QUIZZES[key] for name, key in _KNOWN_QUIZ_NAMES.items()}
+_LABEL_TO_QUIZ_CYCLE = {
+    name: _QUIZ_CYCLES[key] for name, key in _KNOWN_QUIZ_NAMES.items() if key in _QUIZ_CYCLES
+}
+
+
+def get_object_quiz(object_name: str) -> Optional[Quiz]:
+    """
+    Get a quiz question about the detected object, as a shared frozen Quiz.
+    The object's questions are served in rotation.
+    """
+    cycle = _LABEL_TO_QUIZ_CYCLE.get(object_name)
+    if cycle is None and (key := _quiz_key(object_name)) is not None:
+        cycle = _QUIZ_CYCLES.get(key)
+    return None if cycle is None else next(cycle)[0]
+
+
+def find_object_quiz(object_name: str, question: Optional[str] = None) -> Optional[Quiz]:
+    """
+    Look up the object's quiz whose text is *question*, without advancing the
+    rotation. Without *question* only an object with a single quiz resolves.
+    Returns None when the quiz the user saw can't be identified.
+    """
+    quizzes = _LABEL_TO_QUIZZES.get(object_name)
+    if quizzes is None and (key := _quiz_key(object_name)) is not None:
+        quizzes = OBJECT_QUIZZES[key]
+    if not quizzes:
+        return None
+    if question is None:
+        return quizzes[0] if len(quizzes) == 1 else None
+    for quiz in quizzes:
+        if quiz.question == question:
+            return quiz
     return None
 
 
+def get_object_quiz_json(object_name: str) -> Optional[bytes]:
+    """Return the next serialized /quiz response body for the object, or None."""
+    cycle = _LABEL_TO_QUIZ_CYCLE.get(object_name)
+    if cycle is None and (key := _quiz_key(object_name)) is not None:
+        cycle = _QUIZ_CYCLES.get(key)
+    return None if cycle is None else next(cycle)[1]
+
+
 # Backward compatibility
+# Column views of the constant feature cards (one tuple per field, in key
+# order), so per-field scans don't walk the nested card dicts
+_OBJECT_KEYS = tuple(OBJECT_FEATURES)
+_OBJECT_NAMES = tuple(v.name for v in OBJECT_FEATURES.values())
+_OBJECT_CATEGORIES = tuple(v.category for v in OBJECT_FEATURES.values())
+_OBJECT_FIRST_FACTS = tuple(v.features[0].detail if v.features else "" for v in OBJECT_FEATURES.values())
+
+# Built once from the columns above; shared, so treat as read-only.
+_DETECTABLE_OBJECTS = list(_OBJECT_KEYS)
+_OBJECT_DETAILS = {
+    key: {"label": name, "fact": fact}
+    for key, name, fact in zip(_OBJECT_KEYS, _OBJECT_NAMES, _OBJECT_FIRST_FACTS)
+}
+
+
 def get_topic_objects(topic: str) -> dict:
     return {
         "topic": topic,
-        "detectable_objects": list(OBJECT_FEATURES.keys()),
-        "object_details": {k: {"label": v["name"], "fact": v["features"][0]["detail"] if v["features"] else ""} for k, v in OBJECT_FEATURES.items()},
+        "detectable_objects": _DETECTABLE_OBJECTS,
+        "object_details": _OBJECT_DETAILS,
         "fallback_message": "Show any object to your camera!",
     }
 
 async def generate_object_explanation(topic: str, detected_object: str, object_label: str = "") -> str:
-    data = get_object_features(detected_object)
-    if data["found"] and data["features"]:
-        return data["features"][0]["detail"]
+    card = _known_card(detected_object)
+    if card is not None and card.features:
+        return card.features[0].detail
     features = await generate_object_features_llm(detected_object)
     return features[0]["detail"] if features else f"You found a {detected_object}!"
 
-def get_quiz_for_topic(topic: str, detected_object: str = "") -> Optional[dict]:
-    return get_object_quiz(detected_object or topic)
+def get_quiz_for_topic(topic: str, detected_object: str = "") -> Optional[Quiz]:
+    name = detected_object or topic
+    # An empty name is a substring of every key and would match the first quiz
+    if not name:
+        return None
+    return get_object_quiz(name)
@@ -7,31 +7,41 @@ Fully FFmpeg-based (no moviepy).
 
 import os
 import glob
+import time
+import shutil
+import asyncio
 import json
 import math
+import hashlib
 import logging
+import multiprocessing
 import textwrap
 import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 from gtts import gTTS
 from mutagen.mp3 import MP3
 
 from app.config import settings
-from app.services.image_service import get_topic_images, resize_crop
+from app.services.image_service import _composite_tile, get_topic_images, resize_crop
 
 logger = logging.getLogger(__name__)
 
+_frame_executor: Optional[ProcessPoolExecutor] = None
+_frame_executor_lock = threading.Lock()
+
 
 def _gtts_worker(text: str, output_path: str):
-    """Worker function for gTTS (must be module-level for multiprocessing)."""
-    try:
-        t = gTTS(text=text, lang="en", slow=False)
-        t.save(output_path)
-    except Exception:
-        pass
+    """Worker function for gTTS.  Runs on a thread: the per-request socket
+    timeouts keep an abandoned call from hanging around indefinitely."""
+    t = gTTS(text=text, lang="en", slow=False, timeout=(10, 20))
+    t.save(output_path)
 
 # Accent colour palettes — (primary, secondary/glow)
 ACCENT_PALETTES = [
@@ -135,10 +145,110 @@ def _rounded_rect(draw, xy, radius, fill, outline=None, outline_width=0):
         draw.rectangle(xy, fill=fill, outline=outline, width=outline_width)
 
 
+def _text_mask(text, font, anchor="mm"):
+    """Rasterise *text* once into an L mask.
+
+    Returns (mask, (dx, dy)), the mask's offset from the anchor point, or
+    None for text with no ink.  Pasting a colour through the mask at that
+    offset gives the same pixels as draw.text with the same anchor.
+    """
+    x0, y0, x1, y1 = font.getbbox(text, anchor=anchor)
+    if x1 <= x0 or y1 <= y0:
+        return None
+    mask = Image.new("L", (x1 - x0, y1 - y0), 0)
+    ImageDraw.Draw(mask).text((-x0, -y0), text, font=font, fill=255, anchor=anchor)
+    return mask, (x0, y0)
+
+
+# Labels recur across slides and videos (header, branding, slide numbers,
+# "Point N of M"), so their masks are kept; fonts are cached singletons.
+_label_mask = lru_cache(maxsize=256)(_text_mask)
+
+
+def _stamp_text(img, xy, mask_offset, fill, shift=(0, 0)):
+    if mask_offset is not None:
+        mask, (dx, dy) = mask_offset
+        img.paste(fill, (xy[0] + dx + shift[0], xy[1] + dy + shift[1]), mask)
+
+
+def _label_text(img, xy, text, font, fill, anchor="mm"):
+    """draw.text for a recurring label, reusing its cached glyph mask."""
+    _stamp_text(img, xy, _label_mask(text, font, anchor), fill)
+
+
+def _shadowed_text(img, xy, text, font, fill, shadow_fill, shadow_offset):
+    """Draw *text* centred ("mm") at *xy* over a drop shadow.
+
+    Same pixels as two draw.text calls (shadow, then main), but the glyphs
+    are rasterised once into a mask that is then stamped in both colours.
+    """
+    mask_offset = _text_mask(text, font)
+    _stamp_text(img, xy, mask_offset, shadow_fill, shadow_offset)
+    _stamp_text(img, xy, mask_offset, fill)
+
+
 # ---------------------------------------------------------------------------
 #  Frame creation — cinematic visuals
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=16)
+def _accent_glow(color: tuple) -> Image.Image:
+    """721x241 RGBA tile: a 3:1 elliptical glow of *color* fading out to r=120.
+
+    Equivalent to stacking filled ellipses of half-height r from 120 down to 3
+    (half-width 3r), each with alpha ``int(12 * (1 - r / 120))``, but computed
+    as one distance field and only once per accent colour.
+    """
+    yy, xx = np.ogrid[-120:121, -360:361]
+    ring = np.maximum(np.ceil(np.hypot(xx / 3, yy) / 3), 1) * 3
+    alpha = np.where(ring <= 120, 12 * (1 - ring / 120), 0).astype(np.uint8)
+    tile = Image.new("RGBA", (alpha.shape[1], alpha.shape[0]), (*color, 0))
+    tile.putalpha(Image.fromarray(alpha, "L"))
+    return tile
+
+
+@lru_cache(maxsize=8)
+def _overlay_band(width: int, height: int, is_title: bool) -> Tuple[int, Image.Image]:
+    """Black darkening overlay for a slide type, as (top row, RGBA band).
+
+    Black with a per-row alpha: built as one column of alpha values broadcast
+    across the width.  The band only spans the rows it actually darkens, and
+    depends on nothing but the frame size, so it is built once per worker.
+    """
+    y = np.arange(height, dtype=np.float64)
+    if is_title:
+        # Full-screen gradient vignette — heavier at center for contrast
+        # (S-curve for smoother falloff)
+        band_top = 0
+        a = np.clip((160 * (0.3 + 0.7 * (1.0 - np.abs(y / height - 0.5) * 1.4))).astype(np.int32), 0, 200)
+        # Top and bottom edge darkening (replaces the vignette on those rows)
+        top = int(height * 0.08)
+        a[:top] = 120 * (1 - y[:top] / (height * 0.08))
+        bottom = int(height * 0.85)
+        a[bottom:] = 150 * ((y[bottom:] - height * 0.85) / (height * 0.15))
+    else:
+        # Content: bottom glass panel gradient, ease-in curve for smoother gradient
+        band_top = int(height * 0.35)
+        a = 220 * ((y[band_top:] - band_top) / (height - band_top)) ** 1.5
+    alpha = np.ascontiguousarray(np.broadcast_to(a.astype(np.uint8)[:, None], (len(a), width)))
+    overlay = Image.new("RGBA", (width, len(a)), (0, 0, 0, 0))
+    overlay.putalpha(Image.fromarray(alpha, "L"))
+    return band_top, overlay
+
+
+@lru_cache(maxsize=16)
+def _card_layer(width: int, height: int, accent: tuple) -> Image.Image:
+    """Glass card background (semi-transparent) with its accent top edge,
+    sized to the card; _draw_content composites it at (40, 0.42 * height)."""
+    cw, ch = width - 80, height - 80 - int(height * 0.42)
+    card_layer = Image.new("RGBA", (cw + 1, ch + 1), (0, 0, 0, 0))
+    cd = ImageDraw.Draw(card_layer)
+    _rounded_rect(cd, (0, 0, cw, ch), 24, fill=(0, 0, 0, 100))
+    # Accent top edge on card
+    _rounded_rect(cd, (0, 0, cw, 4), 2, fill=(*accent, 180))
+    return card_layer
+
+
 def create_frame(
     image: Image.Image,
     text: str,
@@ -154,72 +264,41 @@ def create_frame(
     accent_glow = accent[1] if isinstance(accent[0], tuple) else tuple(min(c + 60, 255) for c in accent)
 
     # --- background image ---
-    frame = image.copy().convert("RGBA")
+    # convert() always returns a new image (a copy when already RGBA), so the
+    # in-place composites below never touch the caller's image
+    frame = image.convert("RGBA")
     if frame.size != (width, height):
         frame = resize_crop(frame.convert("RGB"), width, height).convert("RGBA")
 
     # --- cinematic overlay ---
-    overlay = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    od = ImageDraw.Draw(overlay)
+    band_top, overlay = _overlay_band(width, height, is_title)
+    frame.alpha_composite(overlay, dest=(0, band_top))
 
-    if is_title:
-        # Full-screen gradient vignette — heavier at center for contrast
-        for y in range(height):
-            # S-curve for smoother falloff
-            norm = y / height
-            a = int(160 * (0.3 + 0.7 * (1.0 - abs(norm - 0.5) * 1.4)))
-            a = max(0, min(a, 200))
-            od.line([(0, y), (width, y)], fill=(0, 0, 0, a))
-        # Top and bottom edge darkening
-        for y in range(int(height * 0.08)):
-            a = int(120 * (1 - y / (height * 0.08)))
-            od.line([(0, y), (width, y)], fill=(0, 0, 0, a))
-        for y in range(int(height * 0.85), height):
-            a = int(150 * ((y - height * 0.85) / (height * 0.15)))
-            od.line([(0, y), (width, y)], fill=(0, 0, 0, int(a)))
-    else:
-        # Content: bottom glass panel gradient
-        start = int(height * 0.35)
-        for y in range(start, height):
-            progress = (y - start) / (height - start)
-            # Ease-in curve for smoother gradient
-            a = int(220 * (progress ** 1.5))
-            od.line([(0, y), (width, y)], fill=(0, 0, 0, a))
+    if not is_title:
         # Subtle top bar — thin accent line
-        od.rectangle([(0, 0), (width, 3)], fill=(*accent_primary, 200))
-
-    frame = Image.alpha_composite(frame, overlay)
+        frame.alpha_composite(Image.new("RGBA", (width, 4), (*accent_primary, 200)))
 
     # --- accent glow effect at bottom ---
-    glow_layer = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    gd = ImageDraw.Draw(glow_layer)
     glow_y = height - 180 if is_title else int(height * 0.55)
-    for r in range(120, 0, -3):
-        a = int(12 * (1 - r / 120))
-        gd.ellipse(
-            [(width // 2 - r * 3, glow_y - r), (width // 2 + r * 3, glow_y + r)],
-            fill=(*accent_primary, a),
-        )
-    frame = Image.alpha_composite(frame, glow_layer).convert("RGB")
-
-    draw = ImageDraw.Draw(frame)
+    _composite_tile(frame, _accent_glow(accent_primary), width // 2 - 360, glow_y - 120)
 
     if is_title:
-        _draw_title(draw, text, width, height, accent_primary, accent_glow)
+        frame = frame.convert("RGB")
+        _draw_title(frame, text, width, height, accent_primary, accent_glow)
         return frame
     else:
-        result = _draw_content(frame, text, slide_number, total_slides, width, height, accent_primary, accent_glow)
-        return result
+        return _draw_content(frame, text, slide_number, total_slides, width, height, accent_primary, accent_glow)
 
 
-def _draw_title(draw, question, w, h, accent, accent_glow):
+def _draw_title(frame, question, w, h, accent, accent_glow):
+    draw = ImageDraw.Draw(frame)
     title_f = _font(56)
     sub_f = _font(28, bold=False)
     brand_f = _font(24, bold=False)
 
     # "DID YOU KNOW?" or topic header
     header_y = int(h * 0.28)
-    draw.text((w // 2, header_y), "— DID YOU KNOW? —", font=sub_f, fill=accent, anchor="mm")
+    _label_text(frame, (w // 2, header_y), "— DID YOU KNOW? —", sub_f, accent)
 
     # Accent underline below header
     line_w = 160
@@ -230,10 +309,7 @@ def _draw_title(draw, question, w, h, accent, accent_glow):
     lines = textwrap.TextWrapper(width=20).wrap(question)
     y = int(h * 0.40)
     for line in lines[:5]:
-        # Shadow
-        draw.text((w // 2 + 2, y + 3), line, font=title_f, fill=(0, 0, 0, 180), anchor="mm")
-        # Main text
-        draw.text((w // 2, y), line, font=title_f, fill="#ffffff", anchor="mm")
+        _shadowed_text(frame, (w // 2, y), line, title_f, "#ffffff", (0, 0, 0, 180), (2, 3))
         y += 72
 
     # Bottom branding area
@@ -243,7 +319,7 @@ def _draw_title(draw, question, w, h, accent, accent_glow):
     for i in range(3):
         cx = w // 2 - 20 + i * 20
         draw.ellipse([(cx - dot_r, by - dot_r), (cx + dot_r, by + dot_r)], fill=accent)
-    draw.text((w // 2, by + 30), "EduVid AI", font=brand_f, fill=(200, 200, 200), anchor="mm")
+    _label_text(frame, (w // 2, by + 30), "EduVid AI", brand_f, (200, 200, 200))
 
 
 def _draw_content(frame_img, text, num, total, w, h, accent, accent_glow):
@@ -256,17 +332,12 @@ def _draw_content(frame_img, text, num, total, w, h, accent, accent_glow):
     card_top = int(h * 0.42)
     card_bottom = h - 80
     card_left = 40
-    card_right = w - 40
 
-    # Glass card background (semi-transparent)
-    base = frame_img.convert("RGBA")
-    card_layer = Image.new("RGBA", (w, h), (0, 0, 0, 0))
-    cd = ImageDraw.Draw(card_layer)
-    _rounded_rect(cd, (card_left, card_top, card_right, card_bottom), 24, fill=(0, 0, 0, 100))
-    # Accent top edge on card
-    _rounded_rect(cd, (card_left, card_top, card_right, card_top + 4), 2, fill=(*accent, 180))
+    # Glass card background, composited over just the card's region
+    base = frame_img if frame_img.mode == "RGBA" else frame_img.convert("RGBA")
+    base.alpha_composite(_card_layer(w, h, tuple(accent)), dest=(card_left, card_top))
 
-    base = Image.alpha_composite(base, card_layer).convert("RGB")
+    base = base.convert("RGB")
     draw = ImageDraw.Draw(base)
 
     # --- slide number badge ---
@@ -277,13 +348,12 @@ def _draw_content(frame_img, text, num, total, w, h, accent, accent_glow):
         [(badge_x - badge_r, badge_y - badge_r), (badge_x + badge_r, badge_y + badge_r)],
         fill=accent,
     )
-    draw.text((badge_x, badge_y), str(num), font=num_f, fill="#ffffff", anchor="mm")
+    _label_text(base, (badge_x, badge_y), str(num), num_f, "#ffffff")
 
     # "Point N of M" label
-    draw.text(
-        (badge_x + badge_r + 14, badge_y),
-        f"Point {num} of {total}",
-        font=label_f, fill=(180, 180, 180), anchor="lm",
+    _label_text(
+        base, (badge_x + badge_r + 14, badge_y),
+        f"Point {num} of {total}", label_f, (180, 180, 180), anchor="lm",
     )
 
     # --- content text ---
@@ -292,8 +362,7 @@ def _draw_content(frame_img, text, num, total, w, h, accent, accent_glow):
     max_lines = min(len(lines), 8)
     for line in lines[:max_lines]:
         # Subtle shadow
-        draw.text((w // 2 + 1, y + 2), line, font=content_f, fill=(0, 0, 0), anchor="mm")
-        draw.text((w // 2, y), line, font=content_f, fill=(240, 240, 240), anchor="mm")
+        _shadowed_text(base, (w // 2, y), line, content_f, (240, 240, 240), (0, 0, 0), (1, 2))
         y += 52
 
     # --- progress indicator (dots) ---
@@ -311,6 +380,59 @@ def _draw_content(frame_img, text, num, total, w, h, accent, accent_glow):
     return base
 
 
+def _render_and_save_frame(
+    image: Image.Image,
+    text: str,
+    slide_number: int,
+    total_slides: int,
+    is_title: bool,
+    width: int,
+    height: int,
+    accent: tuple,
+    output_path: str,
+) -> str:
+    """Compose one frame and write it as raw rgb24 (module-level so worker processes can run it).
+
+    ffmpeg reads the raw bytes directly, which skips a ~90 ms PNG encode per
+    slide here and the matching decode on its side.
+    """
+    frame = create_frame(image, text, slide_number, total_slides, is_title, width, height, accent)
+    with open(output_path, "wb") as f:
+        f.write(frame.tobytes())
+    return output_path
+
+
+def _load_raw_frame(path: str, width: int, height: int) -> Image.Image:
+    """Read back a frame written by _render_and_save_frame."""
+    with open(path, "rb") as f:
+        return Image.frombytes("RGB", (width, height), f.read())
+
+
+def _get_frame_executor() -> ProcessPoolExecutor:
+    """Worker pool for frame rendering, started on first use and kept for later videos."""
+    global _frame_executor
+    # create_video runs on the request threadpool, so two videos can get here at once
+    with _frame_executor_lock:
+        if _frame_executor is None:
+            # Workers come from a single-threaded fork server: forking this
+            # process directly would copy it mid-flight, threadpool and all,
+            # and a child can inherit a lock some other thread was holding
+            _frame_executor = ProcessPoolExecutor(
+                max_workers=settings.VIDEO_FRAME_WORKERS,
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+        return _frame_executor
+
+
+def shutdown_frame_executor():
+    """Stop the frame worker processes (called on application shutdown)."""
+    global _frame_executor
+    with _frame_executor_lock:
+        if _frame_executor is not None:
+            _frame_executor.shutdown(wait=False, cancel_futures=True)
+            _frame_executor = None
+
+
 # ---------------------------------------------------------------------------
 #  Script / audio / subtitle helpers
 # ---------------------------------------------------------------------------
@@ -336,23 +458,91 @@ def split_script_into_segments(script: str) -> List[str]:
     return segments if segments else [script]
 
 
+def _tts_cache_path(text: str) -> str:
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return os.path.join(settings.TTS_CACHE_DIR, digest + ".mp3")
+
+
+def _link_or_copy(src: str, dst: str):
+    """Hard-link *src* to *dst*, copying instead when they're on different filesystems."""
+    try:
+        if os.path.exists(dst):
+            os.remove(dst)
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _tts_cache_load(cache_file: str, output_path: str) -> Optional[float]:
+    """Place a cached narration at *output_path* and return its length, or None on a miss."""
+    try:
+        if time.time() - os.path.getmtime(cache_file) > settings.TTS_CACHE_TTL:
+            return None
+        if os.path.getsize(cache_file) <= 1000:
+            return None
+        _link_or_copy(cache_file, output_path)
+        return MP3(output_path).info.length
+    except Exception:
+        return None
+
+
+def _tts_cache_store(output_path: str, cache_file: str):
+    """Add a fresh narration to the cache atomically and drop entries past the TTL."""
+    tmp = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        _link_or_copy(output_path, tmp)
+        os.replace(tmp, cache_file)
+    except OSError as e:
+        logger.warning(f"TTS cache write failed: {e}")
+        return
+    cutoff = time.time() - settings.TTS_CACHE_TTL
+    try:
+        with os.scandir(settings.TTS_CACHE_DIR) as it:
+            for entry in it:
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+
 def generate_tts_audio(text: str, output_path: str) -> float:
-    """Generate TTS audio → MP3.  Falls back to silent audio on failure."""
-    import multiprocessing
+    """Generate TTS audio → MP3.  Falls back to silent audio on failure.
 
+    Narrations are cached on disk by text, so retries and repeat scripts
+    skip the gTTS round-trip.
+    """
+    cache_file = _tts_cache_path(text)
+    cached = _tts_cache_load(cache_file, output_path)
+    if cached is not None:
+        logger.info("Narration served from TTS cache")
+        return cached
+
+    # gTTS writes to a side file that only replaces output_path once it has
+    # finished in time, so a timed-out thread can't clobber the fallback audio
+    part_path = output_path + ".part"
+    pool = ThreadPoolExecutor(max_workers=1)
     try:
-        proc = multiprocessing.Process(target=_gtts_worker, args=(text, output_path))
-        proc.start()
-        proc.join(timeout=30)  # Hard 30s timeout
-        if proc.is_alive():
-            proc.terminate()
-            proc.join(2)
+        try:
+            pool.submit(_gtts_worker, text, part_path).result(timeout=30)  # Hard 30s timeout
+        except TimeoutError:
             raise TimeoutError("gTTS timed out after 30s")
+        finally:
+            pool.shutdown(wait=False)
+        os.replace(part_path, output_path)
         if os.path.exists(output_path) and os.path.getsize(output_path) > 1000:
-            return MP3(output_path).info.length
+            duration = MP3(output_path).info.length
+            _tts_cache_store(output_path, cache_file)
+            return duration
         raise RuntimeError("gTTS produced no output")
     except Exception as e:
         logger.warning(f"gTTS failed ({e}), generating silent audio")
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
         duration = max(len(text.split()) / 2.5, 15)
         try:
             subprocess.run(
@@ -401,179 +591,289 @@ def _srt_ts(sec: float) -> str:
 # ---------------------------------------------------------------------------
 
 CROSSFADE_DURATION = 0.6  # seconds of crossfade between clips
+# zoompan crops at whole input pixels, so on a slow pan or zoom some frames
+# don't move at all while others jump a pixel.  Scaling the slide up first
+# gives it sub-pixel steps.  Each input is a single frame, so the upscale
+# runs once.
+ZOOMPAN_OVERSAMPLE = 2
+
+# libass force_style for burned-in captions
+SUBTITLE_STYLE = (
+    "FontSize=24,FontName=DejaVu Sans,"
+    "PrimaryColour=&H00FFFFFF,"
+    "OutlineColour=&H00000000,"
+    "BackColour=&H80000000,"
+    "BorderStyle=1,Outline=2,Shadow=0,"
+    "MarginV=50,Bold=1,"
+    "Alignment=2"
+)
+
+XFADE_TRANSITIONS = ["fade", "fadeblack", "slideleft", "slideup", "smoothleft", "smoothup"]
+
+# H.264 encoders in order of preference, with their rate-control/pixel-format
+# options.  libx264 is always available and is the fallback for the others.
+VIDEO_ENCODERS = {
+    "h264_nvenc": ["-preset", "p4", "-tune", "hq", "-rc", "vbr", "-pix_fmt", "yuv420p"],
+    "h264_qsv": ["-preset", "medium", "-pix_fmt", "nv12"],
+    "libx264": ["-pix_fmt", "yuv420p"],
+}
+
+
+@lru_cache(maxsize=1)
+def _hw_encoder() -> Optional[str]:
+    """First hardware H.264 encoder that can actually open on this machine, or None.
+
+    Being listed by ``ffmpeg -encoders`` isn't enough (builds ship NVENC/QSV
+    without the GPU to back them), so each is tried on a tiny test encode.
+    Probed once per process.
+    """
+    for enc in VIDEO_ENCODERS:
+        if enc == "libx264":
+            continue
+        try:
+            res = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-f", "lavfi", "-i", "color=s=256x256:d=0.1",
+                 "-c:v", enc, *VIDEO_ENCODERS[enc], "-f", "null", "-"],
+                capture_output=True, timeout=15,
+            )
+        except Exception:
+            continue
+        if res.returncode == 0:
+            logger.info(f"Using hardware video encoder {enc}")
+            return enc
+    return None
+
+
+# Each encode already spreads across every core (libx264 threads=auto), so
+# concurrent videos queue here instead of multiplying ffmpeg processes that
+# just fight over the same CPUs.
+_encode_slots = threading.BoundedSemaphore(settings.VIDEO_ENCODE_CONCURRENCY)
+
+
+def _run_encode(before: List[str], after: List[str], timeout: int) -> subprocess.CompletedProcess:
+    """Run ``before + <video codec args> + after`` on the hardware encoder when
+    there is one, retrying once with libx264 if that encode fails."""
+    def run(enc):
+        codec = ["-c:v", enc, *VIDEO_ENCODERS[enc], "-b:v", "1500k"]
+        return subprocess.run(before + codec + after, capture_output=True, text=True, timeout=timeout)
+
+    with _encode_slots:
+        hw = _hw_encoder()
+        if hw:
+            res = run(hw)
+            if res.returncode == 0:
+                return res
+            logger.warning(f"{hw} encode failed, retrying with libx264: {res.stderr[-200:]}")
+        return run("libx264")
+
+
+def _kenburns_graph(durations, width, height, fps, captions=None) -> str:
+    """Build one filter_complex: zoompan on every slide input, xfade transitions
+    between them, and (optionally) the *captions* burn filter.  The result is
+    labelled [v]."""
+    n = len(durations)
+    chains = []
+    prev, prev_len = None, 0.0
+    for i, dur in enumerate(durations):
+        # Add extra time for crossfade overlap (except last clip)
+        extra = CROSSFADE_DURATION if i < n - 1 else 0
+        d_frames = max(int((dur + extra) * fps), fps)
+        effect = ZOOM_EFFECTS[i % len(ZOOM_EFFECTS)].replace("{d}", str(max(d_frames - 1, 1)))
+        chains.append(
+            f"[{i}:v]scale={width * ZOOMPAN_OVERSAMPLE}:{height * ZOOMPAN_OVERSAMPLE}:flags=bilinear,"
+            f"zoompan={effect}:d={d_frames}:s={width}x{height}:fps={fps},format=yuv420p[z{i}]"
+        )
+        if prev is None:
+            prev, prev_len = f"z{i}", d_frames / fps
+            continue
+        # Crossfade into this slide over the tail of everything merged so far
+        transition = XFADE_TRANSITIONS[i % len(XFADE_TRANSITIONS)]
+        offset = max(prev_len - CROSSFADE_DURATION, 0.1)
+        chains.append(
+            f"[{prev}][z{i}]xfade=transition={transition}:duration={CROSSFADE_DURATION:.2f}"
+            f":offset={offset:.2f}[x{i}]"
+        )
+        prev, prev_len = f"x{i}", offset + d_frames / fps
+    chains.append(f"[{prev}]{captions or 'null'}[v]")
+    return ";".join(chains)
 
 
 def _assemble_kenburns(
     frame_paths, durations, audio_path, output_path,
-    width, height, fps, srt_path, video_id, temp_dir,
+    width, height, fps, srt_path, video_id, burn_subs=True, captions=None,
 ):
-    """Create video clips with zoompan per frame, crossfade transitions,
-    audio, and subtitles."""
-    clip_paths = []
+    """Render the whole video in a single ffmpeg pass: zoompan per frame,
+    crossfade transitions, subtitles and audio, encoded once.
 
-    for i, (fp, dur) in enumerate(zip(frame_paths, durations)):
-        # Add extra time for crossfade overlap (except last clip)
-        extra = CROSSFADE_DURATION if i < len(frame_paths) - 1 else 0
-        clip_dur = dur + extra
-        d_frames = max(int(clip_dur * fps), fps)
-        effect = ZOOM_EFFECTS[i % len(ZOOM_EFFECTS)].replace("{d}", str(max(d_frames - 1, 1)))
-        clip = os.path.join(temp_dir, f"clip_{i:03d}.mp4")
-
-        cmd = [
-            "ffmpeg", "-y",
-            "-loop", "1", "-i", fp,
-            "-vf", f"zoompan={effect}:d={d_frames}:s={width}x{height}:fps={fps}",
-            "-t", f"{clip_dur:.2f}",
-            "-c:v", "libx264", "-b:v", "1500k",
-            "-pix_fmt", "yuv420p", "-an",
-            clip,
-        ]
-        logger.info(f"[Video {video_id}] Ken Burns clip {i + 1}/{len(frame_paths)}...")
-        res = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-        if res.returncode != 0:
-            raise RuntimeError(f"zoompan clip {i} failed: {res.stderr[-300:]}")
-        clip_paths.append(clip)
-
-    # ---- crossfade between clips ----
-    merged = _crossfade_clips(clip_paths, CROSSFADE_DURATION, temp_dir, video_id)
-
-    # ---- add audio ----
+    Subtitles are burned with the *captions* filter (default: libass on the
+    SRT).  With *burn_subs* False the SRT is muxed as a soft mov_text track
+    instead of being drawn into the pixels."""
     has_audio = os.path.exists(audio_path) and os.path.getsize(audio_path) > 0
+    cmd = ["ffmpeg", "-y"]
+    for fp in frame_paths:
+        cmd += ["-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}", "-i", fp]
     if has_audio:
-        with_audio = os.path.join(temp_dir, "with_audio.mp4")
-        cmd = [
-            "ffmpeg", "-y",
-            "-i", merged, "-i", audio_path,
-            "-c:v", "copy", "-c:a", "aac", "-b:a", "128k",
-            "-shortest", "-movflags", "+faststart",
-            with_audio,
-        ]
-        res = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-        if res.returncode != 0:
-            logger.warning(f"Audio merge failed, using video only: {res.stderr[-200:]}")
-            with_audio = merged
-    else:
-        with_audio = merged
-
-    # ---- burn subtitles ----
-    _burn_subtitles(with_audio, srt_path, output_path)
-
-
-def _crossfade_clips(clip_paths, fade_dur, temp_dir, video_id):
-    """Apply crossfade transitions between clips using xfade filter."""
-    if len(clip_paths) < 2:
-        return clip_paths[0]
+        cmd += ["-i", audio_path]
 
-    # Try xfade-based crossfading (requires clips to be re-encoded with same params)
-    try:
-        return _xfade_chain(clip_paths, fade_dur, temp_dir, video_id)
-    except Exception as e:
-        logger.warning(f"[Video {video_id}] Crossfade failed ({e}), using simple concat")
-        # Fallback: simple concat
-        concat_file = os.path.join(temp_dir, "clips.txt")
-        with open(concat_file, "w") as f:
-            for cp in clip_paths:
-                f.write(f"file '{cp}'\n")
-        merged = os.path.join(temp_dir, "merged.mp4")
-        cmd = [
-            "ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", concat_file,
-            "-c:v", "copy", "-movflags", "+faststart", merged,
-        ]
-        res = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-        if res.returncode != 0:
-            raise RuntimeError(f"concat failed: {res.stderr[-300:]}")
-        return merged
-
-
-def _xfade_chain(clip_paths, fade_dur, temp_dir, video_id):
-    """Chain xfade transitions across all clips.
-    Applies transitions iteratively: (clip0 x clip1) → tmp, (tmp x clip2) → tmp2, etc.
-    Uses different transition styles for variety."""
-    transitions = ["fade", "fadeblack", "slideleft", "slideup", "smoothleft", "smoothup"]
-    current = clip_paths[0]
-
-    for i in range(1, len(clip_paths)):
-        transition = transitions[i % len(transitions)]
-        output = os.path.join(temp_dir, f"xfade_{i:03d}.mp4")
-
-        # Get duration of current clip to calculate offset
-        probe_cmd = [
-            "ffprobe", "-v", "error", "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1", current,
-        ]
-        probe_res = subprocess.run(probe_cmd, capture_output=True, text=True, timeout=15)
-        if probe_res.returncode != 0:
-            raise RuntimeError(f"ffprobe failed for clip {i}")
-        cur_duration = float(probe_res.stdout.strip())
-        offset = max(cur_duration - fade_dur, 0.1)
-
-        cmd = [
-            "ffmpeg", "-y",
-            "-i", current, "-i", clip_paths[i],
-            "-filter_complex",
-            f"[0:v][1:v]xfade=transition={transition}:duration={fade_dur:.2f}:offset={offset:.2f},format=yuv420p[v]",
-            "-map", "[v]",
-            "-c:v", "libx264", "-b:v", "1500k",
-            "-movflags", "+faststart", "-an",
-            output,
-        ]
-        logger.info(f"[Video {video_id}] Crossfade {i}/{len(clip_paths)-1} ({transition})...")
-        res = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+    libass = _subtitle_filter(srt_path)
+
+    def run(with_subs, burn_filter=None):
+        soft = with_subs and not burn_subs
+        graph = _kenburns_graph(durations, width, height, fps, burn_filter if with_subs and burn_subs else None)
+        full = cmd + (["-i", srt_path] if soft else []) + ["-filter_complex", graph, "-map", "[v]"]
+        if has_audio:
+            full += ["-map", f"{len(frame_paths)}:a", "-c:a", "aac", "-b:a", "128k", "-shortest"]
+        if soft:
+            full += [
+                "-map", f"{len(frame_paths) + has_audio}:s",
+                "-c:s", "mov_text", "-metadata:s:s:0", "language=eng",
+            ]
+        return _run_encode(full, ["-movflags", "+faststart", output_path], timeout=300)
+
+    logger.info(f"[Video {video_id}] Ken Burns: {len(frame_paths)} slides in one pass...")
+    res = run(with_subs=True, burn_filter=captions or libass)
+    if res.returncode != 0 and burn_subs and captions and captions != libass:
+        logger.warning(f"[Video {video_id}] Caption render failed, retrying with libass: {res.stderr[-200:]}")
+        res = run(with_subs=True, burn_filter=libass)
+    if res.returncode != 0:
+        logger.warning(f"[Video {video_id}] Subtitled render failed, retrying without: {res.stderr[-200:]}")
+        res = run(with_subs=False)
         if res.returncode != 0:
-            raise RuntimeError(f"xfade {i} failed: {res.stderr[-300:]}")
-        current = output
-
-    return current
+            raise RuntimeError(f"Ken Burns render failed: {res.stderr[-300:]}")
 
 
 def _assemble_simple(
-    frame_paths, durations, audio_path, output_path, fps, srt_path, temp_dir,
+    frame_paths, durations, audio_path, output_path,
+    width, height, fps, srt_path, temp_dir, burn_subs=True, captions=None,
 ):
     """Fallback: simple slide concat with fade filter between slides."""
+    # The concat demuxer needs self-describing images, so only this
+    # (rare) path pays for PNG-encoding the raw frames
+    png_paths = []
+    for fp in frame_paths:
+        png = os.path.splitext(fp)[0] + ".png"
+        _load_raw_frame(fp, width, height).save(png, compress_level=1)
+        png_paths.append(png)
+
     concat_file = os.path.join(temp_dir, "concat.txt")
     with open(concat_file, "w") as f:
-        for fp, dur in zip(frame_paths, durations):
+        for fp, dur in zip(png_paths, durations):
             f.write(f"file '{fp}'\nduration {dur:.4f}\n")
-        f.write(f"file '{frame_paths[-1]}'\n")
+        f.write(f"file '{png_paths[-1]}'\n")
 
     temp_vid = os.path.join(temp_dir, "simple.mp4")
     has_audio = os.path.exists(audio_path) and os.path.getsize(audio_path) > 0
     cmd = ["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", concat_file]
     if has_audio:
         cmd += ["-i", audio_path]
-    cmd += ["-c:v", "libx264", "-b:v", "1500k", "-pix_fmt", "yuv420p",
-            "-r", str(fps)]
+    out = ["-r", str(fps)]
     if has_audio:
-        cmd += ["-c:a", "aac", "-b:a", "128k", "-shortest"]
-    cmd += ["-movflags", "+faststart", temp_vid]
+        out += ["-c:a", "aac", "-b:a", "128k", "-shortest"]
+    out += ["-movflags", "+faststart", temp_vid]
 
-    res = subprocess.run(cmd, capture_output=True, text=True, timeout=180)
+    res = _run_encode(cmd, out, timeout=180)
     if res.returncode != 0:
         raise RuntimeError(f"simple assembly: {res.stderr[-300:]}")
 
-    _burn_subtitles(temp_vid, srt_path, output_path)
+    _burn_subtitles(temp_vid, srt_path, output_path, burn=burn_subs, captions=captions)
 
 
-def _burn_subtitles(input_path: str, srt_path: str, output_path: str):
-    """Burn styled SRT subtitles into video. Falls back to no-sub copy on error."""
-    srt_esc = srt_path.replace("\\", "/").replace(":", "\\:")
-    style = (
-        "FontSize=24,FontName=DejaVu Sans,"
-        "PrimaryColour=&H00FFFFFF,"
-        "OutlineColour=&H00000000,"
-        "BackColour=&H80000000,"
-        "BorderStyle=1,Outline=2,Shadow=0,"
-        "MarginV=50,Bold=1,"
-        "Alignment=2"
+def _filter_path(path: str) -> str:
+    """Escape a file path for use as a filter option value."""
+    return path.replace("\\", "/").replace(":", "\\:")
+
+
+def _subtitle_filter(srt_path: str) -> str:
+    """libass filter that burns *srt_path* in with the caption style."""
+    return f"subtitles={_filter_path(srt_path)}:force_style='{SUBTITLE_STYLE}'"
+
+
+@lru_cache(maxsize=1)
+def _has_drawtext() -> bool:
+    """Whether this ffmpeg was built with the drawtext filter (needs freetype)."""
+    try:
+        res = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-filters"], capture_output=True, text=True, timeout=15,
+        )
+    except Exception:
+        return False
+    return " drawtext " in res.stdout
+
+
+def _caption_filter(subs: List[dict], srt_path: str, temp_dir: str, width: int, height: int) -> str:
+    """Filter chain that burns *subs* into the video.
+
+    Captions are plain timed lines, so when ffmpeg has drawtext they are drawn
+    with one drawtext per line, enabled only for its time span.  That skips
+    libass's SRT parsing, fontconfig setup and per-frame ASS layout.  The look
+    matches SUBTITLE_STYLE: libass lays SRT out on a 384x288 canvas scaled to
+    the video, and its FontSize is the line height rather than the em size.
+    Without drawtext (or a font file) this is the libass filter on *srt_path*.
+    """
+    font_path = get_system_font()
+    if not subs or not font_path or not _has_drawtext():
+        return _subtitle_filter(srt_path)
+
+    scale = height / 288
+    ref = ImageFont.truetype(font_path, 100)
+    size = round(24 * scale * 100 / sum(ref.getmetrics()))
+    font = ImageFont.truetype(font_path, size)
+    line_h = sum(font.getmetrics())
+    max_w = width - 2 * round(10 * width / 384)
+    bottom = height - round(50 * scale)
+    common = (
+        f"fontfile={_filter_path(font_path)}:fontsize={size}:fontcolor=white"
+        f":borderw={round(2 * scale)}:bordercolor=black:expansion=none:x=(w-text_w)/2"
     )
-    cmd = [
-        "ffmpeg", "-y", "-i", input_path,
-        "-vf", f"subtitles={srt_esc}:force_style='{style}'",
-        "-c:a", "copy", "-c:v", "libx264", "-b:v", "1500k",
-        output_path,
-    ]
+
+    chain = []
+    for i, sub in enumerate(subs):
+        lines: List[str] = []
+        for word in sub["text"].split():
+            if lines and font.getlength(f"{lines[-1]} {word}") <= max_w:
+                lines[-1] += f" {word}"
+            else:
+                lines.append(word)
+        for k, line in enumerate(lines):
+            # Text goes through a file so it needs no filtergraph escaping
+            text_path = os.path.join(temp_dir, f"caption_{i:03d}_{k}.txt")
+            with open(text_path, "w", encoding="utf-8") as f:
+                f.write(line)
+            chain.append(
+                f"drawtext={common}:textfile={_filter_path(text_path)}"
+                f":y={bottom - (len(lines) - k) * line_h}"
+                f":enable='gte(t,{sub['start']})*lt(t,{sub['end']})'"
+            )
+    return ",".join(chain)
+
+
+def _burn_subtitles(
+    input_path: str, srt_path: str, output_path: str, burn: bool = True, captions: Optional[str] = None,
+):
+    """Burn styled SRT subtitles into video with the *captions* filter (default:
+    libass) or, with *burn* False, mux them as a soft mov_text track without
+    re-encoding. A failed *captions* burn is retried with libass before
+    falling back to a no-sub copy."""
     try:
-        res = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        if burn:
+            libass = _subtitle_filter(srt_path)
+            for vf in dict.fromkeys([captions or libass, libass]):
+                res = _run_encode(
+                    ["ffmpeg", "-y", "-i", input_path, "-vf", vf],
+                    ["-c:a", "copy", output_path],
+                    timeout=120,
+                )
+                if res.returncode == 0:
+                    break
+                if vf != libass:
+                    logger.warning(f"Caption burn failed, retrying with libass: {res.stderr[-200:]}")
+        else:
+            res = subprocess.run([
+                "ffmpeg", "-y", "-i", input_path, "-i", srt_path,
+                "-map", "0", "-map", "1", "-c", "copy",
+                "-c:s", "mov_text", "-metadata:s:s:0", "language=eng",
+                "-movflags", "+faststart", output_path,
+            ], capture_output=True, text=True, timeout=120)
         if res.returncode != 0:
             logger.warning(f"Subtitle burn failed, copying without: {res.stderr[-200:]}")
             os.rename(input_path, output_path)
@@ -597,51 +897,59 @@ def create_video(video_id: int, question: str, script: str) -> dict:
       5. Hardcoded subtitles
     Returns dict with file_path, duration, subtitle_text, thumbnail_path.
     """
-    accent = ACCENT_PALETTES[hash(question) % len(ACCENT_PALETTES)]
+    # Stable across processes (str hash() is randomised per interpreter)
+    digest = hashlib.blake2b(question.encode("utf-8"), digest_size=8).digest()
+    accent = ACCENT_PALETTES[int.from_bytes(digest, "little") % len(ACCENT_PALETTES)]
     temp_dir = os.path.join(settings.TEMP_DIR, f"video_{video_id}")
     os.makedirs(temp_dir, exist_ok=True)
 
     try:
-        # 1 — Audio
+        # 1 — Audio: narration is a network round-trip, so run it in the
+        # background while images are fetched and frames are rendered
         logger.info(f"[Video {video_id}] Generating narration...")
         audio_path = os.path.join(temp_dir, "narration.mp3")
-        audio_dur = max(generate_tts_audio(script, audio_path), 10)
-
-        # 2 — Script segments
-        segments = split_script_into_segments(script)
-        n_slides = len(segments) + 1          # +1 for title
-        time_per = audio_dur / n_slides
-
-        # 3 — Fetch topic images (AI or gradient fallback)
-        logger.info(f"[Video {video_id}] Fetching AI images...")
-        images = get_topic_images(
-            question, segments,
-            settings.VIDEO_WIDTH, settings.VIDEO_HEIGHT,
-        )
+        with ThreadPoolExecutor(max_workers=1) as tts_pool:
+            tts_future = tts_pool.submit(generate_tts_audio, script, audio_path)
 
-        # 4 — Create cinematic frames
-        logger.info(f"[Video {video_id}] Composing {n_slides} cinematic frames...")
-        frame_paths = []
+            # 2 — Script segments
+            segments = split_script_into_segments(script)
+            n_slides = len(segments) + 1          # +1 for title
 
-        # title
-        title_img = create_frame(
-            images[0], question, 0, len(segments), True,
-            settings.VIDEO_WIDTH, settings.VIDEO_HEIGHT, accent,
-        )
-        tp = os.path.join(temp_dir, "frame_000.png")
-        title_img.save(tp)
-        frame_paths.append(tp)
-
-        # content
-        for i, seg in enumerate(segments):
-            img = images[i + 1] if i + 1 < len(images) else images[-1]
-            cf = create_frame(
-                img, seg, i + 1, len(segments), False,
-                settings.VIDEO_WIDTH, settings.VIDEO_HEIGHT, accent,
-            )
-            fp = os.path.join(temp_dir, f"frame_{i + 1:03d}.png")
-            cf.save(fp)
-            frame_paths.append(fp)
+            # 3 — Fetch topic images (AI or gradient fallback)
+            logger.info(f"[Video {video_id}] Fetching AI images...")
+            images = asyncio.run(get_topic_images(
+                question, segments,
+                settings.VIDEO_WIDTH, settings.VIDEO_HEIGHT,
+            ))
+            # Fit each source once here: images are reused across slides and
+            # shipped to the frame workers, so don't resample (or pickle) a
+            # full-size one per slide
+            size = (settings.VIDEO_WIDTH, settings.VIDEO_HEIGHT)
+            images = [
+                img if img.size == size else resize_crop(img.convert("RGB"), *size)
+                for img in images
+            ]
+
+            # 4 — Create cinematic frames (composed in parallel)
+            logger.info(f"[Video {video_id}] Composing {n_slides} cinematic frames...")
+            executor = _get_frame_executor()
+            slides = [(images[0], question)] + [
+                (images[i + 1] if i + 1 < len(images) else images[-1], seg)
+                for i, seg in enumerate(segments)
+            ]
+            futures = [
+                executor.submit(
+                    _render_and_save_frame, img, text, n, len(segments), n == 0,
+                    settings.VIDEO_WIDTH, settings.VIDEO_HEIGHT, accent,
+                    os.path.join(temp_dir, f"frame_{n:03d}.rgb"),
+                )
+                for n, (img, text) in enumerate(slides)
+            ]
+            frame_paths = [f.result() for f in futures]
+
+            # Slide timing depends on the narration length
+            audio_dur = max(tts_future.result(), 10)
+        time_per = audio_dur / n_slides
 
         # 5 — Subtitles
         logger.info(f"[Video {video_id}] Generating subtitles...")
@@ -649,6 +957,9 @@ def create_video(video_id: int, question: str, script: str) -> dict:
         srt_path = os.path.join(temp_dir, "subtitles.srt")
         with open(srt_path, "w") as f:
             f.write(generate_srt_content(subs))
+        captions = None
+        if settings.VIDEO_BURN_SUBTITLES:
+            captions = _caption_filter(subs, srt_path, temp_dir, settings.VIDEO_WIDTH, settings.VIDEO_HEIGHT)
 
         # 6 — Assemble video (Ken Burns → fallback simple concat)
         output_name = f"eduvid_{video_id}_{int(datetime.now().timestamp())}.mp4"
@@ -660,18 +971,22 @@ def create_video(video_id: int, question: str, script: str) -> dict:
             _assemble_kenburns(
                 frame_paths, durations, audio_path, output_path,
                 settings.VIDEO_WIDTH, settings.VIDEO_HEIGHT,
-                settings.VIDEO_FPS, srt_path, video_id, temp_dir,
+                settings.VIDEO_FPS, srt_path, video_id,
+                burn_subs=settings.VIDEO_BURN_SUBTITLES, captions=captions,
             )
         except Exception as e:
             logger.warning(f"[Video {video_id}] Ken Burns failed ({e}), using simple assembly")
             _assemble_simple(
                 frame_paths, durations, audio_path, output_path,
+                settings.VIDEO_WIDTH, settings.VIDEO_HEIGHT,
                 settings.VIDEO_FPS, srt_path, temp_dir,
+                burn_subs=settings.VIDEO_BURN_SUBTITLES, captions=captions,
             )
 
         # 7 — Thumbnail
         thumb_name = f"thumb_{video_id}.png"
         thumb_path = os.path.join(settings.VIDEO_DIR, thumb_name)
+        title_img = _load_raw_frame(frame_paths[0], settings.VIDEO_WIDTH, settings.VIDEO_HEIGHT)
         title_img.resize((270, 480)).save(thumb_path)
 
         duration = int(audio_dur)
@@ -688,5 +1003,19 @@ def create_video(video_id: int, question: str, script: str) -> dict:
         logger.error(f"[Video {video_id}] Failed: {e}", exc_info=True)
         raise
     finally:
-        import shutil
         shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _warm_frame_caches():
+    """Load the slide fonts and the accent-independent overlay bands up front.
+
+    Frame workers import this module when they start, so each one warms its
+    caches there instead of on its first frame.
+    """
+    for size, bold in ((56, True), (48, True), (38, True), (28, False), (24, False), (22, False), (20, False)):
+        _font(size, bold)
+    for is_title in (True, False):
+        _overlay_band(settings.VIDEO_WIDTH, settings.VIDEO_HEIGHT, is_title)
+
+
+_warm_frame_caches()
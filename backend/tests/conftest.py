@@ -0,0 +1,14 @@
+"""Point every storage setting at a throwaway directory before the app is imported."""
+
+import os
+import sys
+import tempfile
+
+_tmp = tempfile.mkdtemp(prefix="eduvid-tests-")
+for _key in ("UPLOAD_DIR", "VIDEO_DIR", "TEMP_DIR", "IMAGE_CACHE_DIR", "TTS_CACHE_DIR"):
+    os.environ.setdefault(_key, os.path.join(_tmp, _key.lower()))
+os.environ.setdefault("LLM_CACHE_DB", os.path.join(_tmp, "llm_cache.db"))
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_tmp, 'eduvid.db')}")
+os.environ.setdefault("LLM_WARM_ON_STARTUP", "false")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
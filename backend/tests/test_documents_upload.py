@@ -0,0 +1,46 @@
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.auth import create_access_token, hash_password
+from app.config import settings
+from app.database import SessionLocal, User
+from app.main import app
+from app.routes import documents
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Parsing and question extraction aren't under test here
+    monkeypatch.setattr(documents, "process_document_task", lambda document_id: None)
+    with TestClient(app) as c:
+        db = SessionLocal()
+        try:
+            user = db.query(User).filter(User.username == "uploader").first()
+            if user is None:
+                user = User(username="uploader", email="uploader@example.com", hashed_password=hash_password("secret123"))
+                db.add(user)
+                db.commit()
+            token = create_access_token({"sub": str(user.id)})
+        finally:
+            db.close()
+        c.headers["Authorization"] = f"Bearer {token}"
+        yield c
+
+
+@pytest.mark.parametrize("client_name", [
+    "C:\\Users\\x\\notes.pdf",
+    "/home/x/notes.pdf",
+    "notes.pdf",
+])
+def test_upload_keeps_only_the_base_filename(client, client_name):
+    resp = client.post(
+        "/api/documents/upload",
+        files={"file": (client_name, b"%PDF-1.4 test", "application/pdf")},
+    )
+
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["filename"] == "notes.pdf"
+    stored = [name for name in os.listdir(settings.UPLOAD_DIR) if name.endswith("_notes.pdf")]
+    assert stored and not any("\\" in name or "Users" in name for name in stored)
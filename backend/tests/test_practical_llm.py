@@ -0,0 +1,96 @@
+import asyncio
+
+from app.services import practical_service as ps
+
+
+def _fake_llm(monkeypatch, reply):
+    """Replace the LLM with one that waits for the returned event, counting calls."""
+    calls = []
+    release = asyncio.Event()
+
+    async def ask(prompt, system_prompt, **options):
+        calls.append(prompt)
+        await release.wait()
+        return reply(prompt)
+
+    monkeypatch.setattr(ps, "_ask_llm", ask)
+    monkeypatch.setattr(ps, "_shared_features_get", lambda keys: {})
+    monkeypatch.setattr(ps, "_shared_features_put", lambda items: None)
+    return calls, release
+
+
+async def _until_llm_called(calls):
+    for _ in range(1000):
+        if calls:
+            return
+        await asyncio.sleep(0.001)
+    raise AssertionError("the LLM was never called")
+
+
+def _batch_reply(names):
+    return "\n---\n".join(
+        f"OBJECT: {name}\n" + "\n".join(f"Fact {i}: {name} detail {i}" for i in range(4)) for name in names
+    )
+
+
+def test_single_request_joins_a_running_batch(monkeypatch):
+    names = ["zorblax widget", "quuxon gadget"]
+    calls, release = _fake_llm(monkeypatch, lambda prompt: _batch_reply(names))
+
+    async def scenario():
+        batch = asyncio.ensure_future(ps.generate_object_features_llm_batch(names))
+        await _until_llm_called(calls)  # the batch is now in flight
+        single = asyncio.ensure_future(ps.generate_object_features_llm("Zorblax Widget"))
+        await asyncio.sleep(0)
+        release.set()
+        return await batch, await single
+
+    batched, single = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert single == batched["zorblax widget"]
+    assert single[0]["title"] == "Fact 0"
+    assert not ps._llm_feature_inflight
+
+
+def test_batch_miss_is_generated_once_for_everyone(monkeypatch):
+    names = ["plimbus rod", "fnord lamp"]
+
+    def reply(prompt):
+        if prompt.startswith("Generate 4 educational features about: "):
+            name = prompt.rsplit(": ", 1)[1]
+            return "\n".join(f"Solo {i}: {name} detail {i}" for i in range(4))
+        return _batch_reply(names[:1])  # the batched answer leaves out the second object
+
+    calls, release = _fake_llm(monkeypatch, reply)
+
+    async def scenario():
+        batch = asyncio.ensure_future(ps.generate_object_features_llm_batch(names))
+        await _until_llm_called(calls)
+        single = asyncio.ensure_future(ps.generate_object_features_llm("fnord lamp"))
+        await asyncio.sleep(0)
+        release.set()
+        return await batch, await single
+
+    batched, single = asyncio.run(scenario())
+
+    assert len(calls) == 2  # the batch, then one solo call for the missed object
+    assert single == batched["fnord lamp"]
+    assert single[0]["title"] == "Solo 0"
+
+
+def test_llm_feature_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(ps, "LLM_FEATURE_CACHE_SIZE", 3)
+    monkeypatch.setattr(ps, "_llm_feature_cache", ps.OrderedDict())
+    for key in ("hot", "cold1", "cold2"):
+        ps._store_llm_features(key, [{"title": key, "detail": key}])
+
+    # A hit on the oldest entry keeps it; the coldest one goes instead
+    assert asyncio.run(ps.generate_object_features_llm("Hot"))[0]["title"] == "hot"
+    ps._store_llm_features("new", [{"title": "new", "detail": "new"}])
+    assert list(ps._llm_feature_cache) == ["cold2", "hot", "new"]
+
+    # Batch lookups count as hits too
+    assert asyncio.run(ps.generate_object_features_llm_batch(["cold2", "hot"]))["cold2"][0]["title"] == "cold2"
+    ps._store_llm_features("newer", [{"title": "newer", "detail": "newer"}])
+    assert list(ps._llm_feature_cache) == ["cold2", "hot", "newer"]
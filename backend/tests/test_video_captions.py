@@ -0,0 +1,58 @@
+import subprocess
+
+from app.services import video_service
+
+
+def _fake_encoder(monkeypatch, fail_on):
+    """Replace _run_encode; any command containing *fail_on* exits non-zero."""
+    calls = []
+
+    def run_encode(before, after, timeout):
+        cmd = before + after
+        calls.append(" ".join(cmd))
+        failed = any(fail_on in arg for arg in cmd)
+        return subprocess.CompletedProcess(cmd, 1 if failed else 0, "", "bad filter" if failed else "")
+
+    monkeypatch.setattr(video_service, "_run_encode", run_encode)
+    return calls
+
+
+def test_kenburns_retries_failed_captions_with_libass(monkeypatch, tmp_path):
+    calls = _fake_encoder(monkeypatch, "drawtext=bogus")
+    srt = str(tmp_path / "subtitles.srt")
+
+    video_service._assemble_kenburns(
+        ["f0.rgb", "f1.rgb"], [3.0, 3.0], str(tmp_path / "missing.mp3"), str(tmp_path / "out.mp4"),
+        720, 1280, 24, srt, 1, captions="drawtext=bogus",
+    )
+
+    assert len(calls) == 2
+    assert "drawtext=bogus" in calls[0]
+    assert video_service._subtitle_filter(srt) in calls[1]
+
+
+def test_kenburns_drops_subtitles_only_after_libass_fails(monkeypatch, tmp_path):
+    calls = _fake_encoder(monkeypatch, "subtitles=")
+    srt = str(tmp_path / "subtitles.srt")
+
+    video_service._assemble_kenburns(
+        ["f0.rgb"], [3.0], str(tmp_path / "missing.mp3"), str(tmp_path / "out.mp4"),
+        720, 1280, 24, srt, 1, captions="drawtext=bogus,subtitles=x",
+    )
+
+    assert len(calls) == 3
+    assert video_service._subtitle_filter(srt) in calls[1]
+    assert "subtitles=" not in calls[2] and "drawtext" not in calls[2]
+
+
+def test_burn_subtitles_retries_failed_captions_with_libass(monkeypatch, tmp_path):
+    calls = _fake_encoder(monkeypatch, "drawtext=bogus")
+    srt = str(tmp_path / "subtitles.srt")
+    src = tmp_path / "in.mp4"
+    src.write_bytes(b"video")
+
+    video_service._burn_subtitles(str(src), srt, str(tmp_path / "out.mp4"), captions="drawtext=bogus")
+
+    assert len(calls) == 2
+    assert video_service._subtitle_filter(srt) in calls[1]
+    assert src.exists()  # burned copy succeeded, so the input was not renamed into place
@@ -71,8 +71,10 @@ export const practicalAPI = {
     api.post('/api/practical/object-features', { object_name }),
   getQuiz: (object_name) =>
     api.post('/api/practical/quiz', { object_name }),
-  checkAnswer: (object_name, selected_index) =>
-    api.post('/api/practical/check-answer', { object_name, selected_index }),
+  getObjectBundle: (object_name) =>
+    api.post('/api/practical/object-bundle', { object_name }),
+  checkAnswer: (object_name, selected_index, question) =>
+    api.post('/api/practical/check-answer', { object_name, selected_index, question }),
 };
 
 export default api;
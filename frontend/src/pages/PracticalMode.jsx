@@ -45,6 +45,7 @@ export default function PracticalMode({ onClose }) {
   const featureTimerRef = useRef(null);
   const stabilityRef = useRef({});
   const frameCountRef = useRef(0);
+  const prefetchedQuizRef = useRef(null);
 
   const [stage, setStage] = useState('loading');
   const [loadProgress, setLoadProgress] = useState('');
@@ -350,9 +351,11 @@ export default function PracticalMode({ onClose }) {
     setExpandedFeature(null);
     setQuiz(null);
     setQuizAnswer(null);
+    prefetchedQuizRef.current = null;
     try {
-      const { data } = await practicalAPI.getObjectFeatures(objectClass);
-      setFeatures(data);
+      const { data } = await practicalAPI.getObjectBundle(objectClass);
+      setFeatures(data.features);
+      prefetchedQuizRef.current = data.quiz;
     } catch (err) {
       console.error('Feature fetch error:', err);
       setFeatures({
@@ -368,7 +371,9 @@ export default function PracticalMode({ onClose }) {
   const loadQuiz = async () => {
     if (!activeObject) return;
     try {
-      const { data } = await practicalAPI.getQuiz(activeObject);
+      let data = prefetchedQuizRef.current;
+      prefetchedQuizRef.current = null;
+      if (!data) ({ data } = await practicalAPI.getQuiz(activeObject));
       setQuiz(data);
       setQuizAnswer(null);
       setSelectedOption(null);
@@ -380,7 +385,7 @@ export default function PracticalMode({ onClose }) {
   const submitAnswer = async (index) => {
     if (!activeObject) return;
     try {
-      const { data } = await practicalAPI.checkAnswer(activeObject, index);
+      const { data } = await practicalAPI.checkAnswer(activeObject, index, quiz?.question);
       setQuizAnswer(data);
     } catch {
       setQuizAnswer({ correct: false, explanation: 'Could not check answer. Try again.' });